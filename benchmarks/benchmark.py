@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+benchmarks for the measurement hot paths
+
+The device is replaced with a simulated device ('SimulatedAds1x1x') which
+models the conversion timing and counts the I²C transactions. For each
+benchmark we report:
+ - ns/op          time per operation (best of several repeats)
+ - transactions   I²C transactions per operation (or sample)
+ - samples/s      achieved sample rate (measurements only)
+
+The import time of the package is measured in a fresh interpreter.
+
+The results are compared with the reference values stored in
+'baseline.json' and the run fails if a metric regressed beyond the
+tolerance. Timings are noisy (best of several repeats, but shared
+machines still vary by ±30%), hence the default tolerance of 50% only
+catches real slowdowns. Transaction counts are deterministic and must
+not increase at all.
+
+usage:
+```
+pdm run python benchmarks/benchmark.py
+pdm run python benchmarks/benchmark.py --tolerance 0.25  # on a quiet machine
+pdm run python benchmarks/benchmark.py --update-baseline
+```
+
+Timings depend on the machine. Record the baseline on the machine the
+benchmarks are run on. ('--update-baseline' keeps the metrics that were
+not measured in this run, use '--only' to select individual benchmarks.)
+"""
+
+import argparse
+import functools
+import itertools
+import json
+import subprocess
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, Iterator
+
+from attrs import define
+
+from feeph.ads1xxx.ads1115 import Ads1115, Ads1115Config
+from feeph.ads1xxx.conversions import (convert_microvolts_to_step, convert_number_to_sint16, convert_sint16_to_number,
+                                       convert_step_to_microvolts)
+from feeph.ads1xxx.settings import DOM, DRS, MUX, PGA
+from feeph.ads1xxx.simulation import ConstantSignal, SimulatedAds1x1x
+
+BASELINE = Path(__file__).parent / 'baseline.json'
+
+# measured in a fresh interpreter (modules are cached after the first import)
+IMPORT_BENCHMARK = 'import feeph.ads1xxx'
+IMPORT_SCRIPT = """
+import time
+time_start = time.perf_counter_ns()
+import feeph.ads1xxx
+print(time.perf_counter_ns() - time_start)
+"""
+
+# metric -> True if a higher value is better
+METRICS = {
+    'ns_per_op':               False,
+    'transactions_per_sample': False,
+    'samples_per_second':      True,
+}
+
+
+@define
+class Benchmark:
+    # fmt: off
+    name:      str
+    func:      Callable[[], object]
+    bus:       SimulatedAds1x1x | None = None  # count transactions on this bus
+    is_sample: bool = False                    # operation yields a measurement
+    number:    int | None = None               # operations per repeat (None = auto)
+    # fmt: on
+
+
+def get_simulated_device(config: Ads1115Config | None = None) -> tuple[SimulatedAds1x1x, Ads1115]:
+    bus = SimulatedAds1x1x(signals={MUX.MODE0: ConstantSignal(voltage=1.0)})
+    device = Ads1115(i2c_bus=bus)  # type: ignore[arg-type]  # duck-typed bus
+    device.reset_device_registers()
+    if config is not None:
+        device.configure(config)
+    return bus, device
+
+
+def get_benchmarks() -> list[Benchmark]:
+    benchmarks = [
+        Benchmark(name='convert_number_to_sint16', func=lambda: convert_number_to_sint16(-12345)),
+        Benchmark(name='convert_sint16_to_number', func=lambda: convert_sint16_to_number(0xCFC7)),
+        Benchmark(name='convert_step_to_microvolts', func=lambda: convert_step_to_microvolts(0x3039, PGA.MODE2)),
+        Benchmark(name='convert_microvolts_to_step', func=lambda: convert_microvolts_to_step(1_234_567, PGA.MODE2)),
+        Benchmark(name='Ads1115Config.as_uint16', func=Ads1115Config().as_uint16),
+    ]
+    # configure() - alternate between two configurations to force a write
+    bus, device = get_simulated_device()
+    configs = itertools.cycle([Ads1115Config(drs=DRS.MODE7), Ads1115Config(drs=DRS.MODE6)])
+    benchmarks.append(Benchmark(name='configure', func=functools.partial(_configure_next, device, configs), bus=bus))
+    # configure() - unchanged configuration
+    bus, device = get_simulated_device()
+    configure = functools.partial(device.configure, Ads1115Config(drs=DRS.MODE7))
+    benchmarks.append(Benchmark(name='configure (unchanged)', func=configure, bus=bus))
+    # get_ssc_measurement() - highest data rate
+    bus, device = get_simulated_device()
+    measure = functools.partial(device.get_ssc_measurement, config=Ads1115Config(drs=DRS.MODE7))
+    benchmarks.append(Benchmark(name='get_ssc_measurement', func=measure, bus=bus, is_sample=True, number=100))
+    # get_ccm_measurement() - highest data rate
+    bus, device = get_simulated_device(config=Ads1115Config(dom=DOM.CCM, drs=DRS.MODE7))
+    benchmarks.append(Benchmark(name='get_ccm_measurement', func=device.get_ccm_measurement, bus=bus, is_sample=True))
+    return benchmarks
+
+
+def _configure_next(device: Ads1115, configs: Iterator[Ads1115Config]):
+    device.configure(next(configs))
+
+
+def run_benchmark(benchmark: Benchmark, repeat: int) -> dict[str, float]:
+    timer = timeit.Timer(benchmark.func)
+    number = benchmark.number
+    if number is None:
+        number, _ = timer.autorange()
+    # warm-up (fills caches and shadow registers)
+    timer.timeit(number=1)
+    ns_per_op = min(timer.repeat(repeat=repeat, number=number)) / number * 1_000_000_000
+    result = {'ns_per_op': ns_per_op}
+    if benchmark.bus is not None:
+        transactions = benchmark.bus.transactions
+        timer.timeit(number=number)
+        result['transactions_per_sample'] = (benchmark.bus.transactions - transactions) / number
+    if benchmark.is_sample:
+        result['samples_per_second'] = 1_000_000_000 / ns_per_op
+    return result
+
+
+def run_import_benchmark(repeat: int) -> dict[str, float]:
+    durations = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', IMPORT_SCRIPT], capture_output=True, check=True, text=True).stdout
+        durations.append(int(output))
+    return {'ns_per_op': min(durations)}
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], tolerance: float) -> list[str]:
+    """
+    compare the results with the baseline and return a list of regressions
+    """
+    regressions = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            reference = baseline.get(name, {}).get(metric)
+            if reference is None:
+                continue
+            if metric == 'transactions_per_sample':
+                # deterministic - no tolerance
+                regressed = value > reference
+            elif METRICS[metric]:
+                regressed = value < reference * (1 - tolerance)
+            else:
+                regressed = value > reference * (1 + tolerance)
+            if regressed:
+                regressions.append(f"{name}: {metric} regressed from {reference:.2f} to {value:.2f}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="benchmark the measurement hot paths")
+    parser.add_argument('--baseline', type=Path, default=BASELINE, help="baseline file (default: %(default)s)")
+    parser.add_argument('--tolerance', type=float, default=0.50, help="acceptable slowdown (default: %(default).2f)")
+    parser.add_argument('--repeat', type=int, default=5, help="number of repeats (default: %(default)d)")
+    parser.add_argument('--only', action='append', metavar='NAME', help="run the named benchmark(s) only")
+    parser.add_argument('--update-baseline', action='store_true', help="store the results as the new baseline")
+    args = parser.parse_args()
+
+    benchmarks = [benchmark for benchmark in get_benchmarks() if args.only is None or benchmark.name in args.only]
+    results = {}
+    print(f"{'benchmark':<30} {'ns/op':>12} {'transactions':>12} {'samples/s':>10}")
+    for benchmark in benchmarks:
+        result = run_benchmark(benchmark, repeat=args.repeat)
+        results[benchmark.name] = result
+        transactions = f"{result['transactions_per_sample']:.2f}" if 'transactions_per_sample' in result else '-'
+        samples_per_second = f"{result['samples_per_second']:.0f}" if 'samples_per_second' in result else '-'
+        print(f"{benchmark.name:<30} {result['ns_per_op']:>12.0f} {transactions:>12} {samples_per_second:>10}")
+    if args.only is None or IMPORT_BENCHMARK in args.only:
+        result = run_import_benchmark(repeat=args.repeat)
+        results[IMPORT_BENCHMARK] = result
+        print(f"{IMPORT_BENCHMARK:<30} {result['ns_per_op']:>12.0f} {'-':>12} {'-':>10}")
+
+    baseline: dict[str, dict[str, float]] = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+
+    if args.update_baseline:
+        for name, result in results.items():
+            baseline.setdefault(name, {}).update({metric: round(value, 2) for metric, value in result.items()})
+        args.baseline.write_text(json.dumps(baseline, indent=4, sort_keys=True) + '\n')
+        print(f"updated baseline '{args.baseline}'")
+        return 0
+
+    regressions = compare(results, baseline, tolerance=args.tolerance)
+    if regressions:
+        print()
+        for regression in regressions:
+            print(f"REGRESSION - {regression}")
+        return 1
+    else:
+        return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -18,7 +18,7 @@ import board  # type: ignore
 # module busio and board provide no type hints
 import busio  # type: ignore
 
-from feeph.ads1xxx import MUX, PGA, Ads1115, Ads1115Config
+from feeph.ads1xxx import DRS, MUX, PGA, Ads1115, Ads1115Config, ScanList
 
 LH = logging.getLogger("main")
 
@@ -38,8 +38,25 @@ if __name__ == '__main__':
     config_dif = Ads1115Config(mux=MUX.MODE0, pga=PGA.MODE4)  # AIN0»AIN1
 
     # switch between both configurations and take measurements
-    while True:
+    for i in range(1, 5):
         value1 = ads1x15.get_ssc_measurement(config=config_abs)
         value2 = ads1x15.get_ssc_measurement(config=config_dif)
-        print(f"value1: {value1}µV, value2: {value1}µV")
+        print(f"#{i:} value1: {value1}µV, value2: {value2}µV")
+        time.sleep(1)
+
+    print('-' * 80)
+
+    # scan all single-ended channels as fast as possible
+    #   Only the config register is written for each channel and the next
+    #   conversion is started right after reading the previous result.
+    scan_list = ScanList(device=ads1x15, channels=[
+        (MUX.MODE4, PGA.MODE1, DRS.MODE7),  # AIN0»GND
+        (MUX.MODE5, PGA.MODE1, DRS.MODE7),  # AIN1»GND
+        (MUX.MODE6, PGA.MODE1, DRS.MODE7),  # AIN2»GND
+        (MUX.MODE7, PGA.MODE1, DRS.MODE7),  # AIN3»GND
+    ])
+    while True:
+        result = scan_list.scan(rounds=100)
+        averages = [sum(values) // len(values) for values in result.values]
+        print(f"averages: {averages}µV ({result.sample_rate:.0f} samples per second)")
         time.sleep(1)
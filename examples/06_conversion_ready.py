@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+wait for conversions using the ALERT/RDY pin
+
+The comparator of the ADS1x14 and ADS1x15 can be configured to assert the
+ALERT/RDY pin whenever a conversion is completed. Instead of polling the
+device over the I²C bus we wait for an edge event on a GPIO line and read
+the conversion register afterwards.
+
+The ALERT/RDY pin is an open-drain output and must be connected to a GPIO
+line. (The line's internal pull-up resistor is enabled.)
+
+This example requires an ALERT/RDY pin:
+ - ADS1014, ADS1015
+ - ADS1114, ADS1115
+
+usage:
+  pdm run examples/06_conversion_ready.py
+"""
+
+import logging
+
+import board  # type: ignore
+
+# module busio and board provide no type hints
+import busio  # type: ignore
+
+from feeph.ads1xxx import DOM, DRS, Ads1115, Ads1115Config
+from feeph.ads1xxx.alert import AlertReadyPin
+
+LH = logging.getLogger("main")
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(levelname).1s: %(message)s', level=logging.INFO)
+
+    i2c_bus = busio.I2C(scl=board.SCL, sda=board.SDA)
+    ads1x15 = Ads1115(i2c_bus=i2c_bus)
+
+    # ALERT/RDY is connected to GPIO17 on the first GPIO chip
+    with AlertReadyPin(chip_path='/dev/gpiochip0', line_offset=17) as alert:
+        # on an ADS111x in MODE4 there is a new sample every 1/128 seconds
+        my_config = Ads1115Config(dom=DOM.CCM, drs=DRS.MODE4)
+        if ads1x15.configure_rdy(config=my_config):
+            for i in range(1, 129):
+                value = ads1x15.get_rdy_measurement(alert=alert)
+                print(f"#{i:} value: {value}µV")
+        else:
+            print("Unable to configure ADC.")
@@ -1,20 +1,88 @@
 #!/usr/bin/env python3
 """
 ADS1xxx family of I²C analog-to-digital converters
+
+The device classes are imported on first use. Importing this package
+is cheap and does not load 'busio' (and its board detection) until a
+device is used.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 # the following imports are provided for user convenience
 # flake8: noqa: F401
-# 12bit / 3300 samples per second
-from feeph.ads1xxx.ads1013 import Ads1013, Ads1013Config
-from feeph.ads1xxx.ads1014 import Ads1014, Ads1014Config
-from feeph.ads1xxx.ads1015 import Ads1015, Ads1015Config
-
-# 16bit / 860 samples per second
-from feeph.ads1xxx.ads1113 import Ads1113, Ads1113Config
-from feeph.ads1xxx.ads1114 import Ads1114, Ads1114Config
-from feeph.ads1xxx.ads1115 import Ads1115, Ads1115Config
-
 # config settings
 from feeph.ads1xxx.conversions import UNIT
 from feeph.ads1xxx.settings import CLAT, CMOD, CPOL, CQUE, DOM, DRS, MUX, PGA, SSC
+
+if TYPE_CHECKING:
+    # 12bit / 3300 samples per second
+    from feeph.ads1xxx.ads1013 import Ads1013, Ads1013Config
+    from feeph.ads1xxx.ads1014 import Ads1014, Ads1014Config
+    from feeph.ads1xxx.ads1015 import Ads1015, Ads1015Config
+
+    # 16bit / 860 samples per second
+    from feeph.ads1xxx.ads1113 import Ads1113, Ads1113Config
+    from feeph.ads1xxx.ads1114 import Ads1114, Ads1114Config
+    from feeph.ads1xxx.ads1115 import Ads1115, Ads1115Config
+
+    # immutable and hashable configurations ('config.freeze()')
+    from feeph.ads1xxx.ads1x1x import FrozenConfig
+
+    # multiple devices on the same bus
+    from feeph.ads1xxx.group import DeviceGroup
+
+    # multi-channel scans (ADS1x15)
+    from feeph.ads1xxx.scan import ScanList
+
+    # direct access to /dev/i2c-N (bypasses Blinka)
+    from feeph.ads1xxx.linux_i2c import LinuxI2C
+
+    # automatic gain selection (ADS1x14, ADS1x15)
+    from feeph.ads1xxx.autorange import AutoRange
+
+    # oversampled measurements ('get_oversampled_measurement()')
+    from feeph.ads1xxx.oversampling import REDUCTION
+
+# name -> module (imported on first access)
+_LAZY_IMPORTS = {
+    'Ads1013':       'feeph.ads1xxx.ads1013',
+    'Ads1013Config': 'feeph.ads1xxx.ads1013',
+    'Ads1014':       'feeph.ads1xxx.ads1014',
+    'Ads1014Config': 'feeph.ads1xxx.ads1014',
+    'Ads1015':       'feeph.ads1xxx.ads1015',
+    'Ads1015Config': 'feeph.ads1xxx.ads1015',
+    'Ads1113':       'feeph.ads1xxx.ads1113',
+    'Ads1113Config': 'feeph.ads1xxx.ads1113',
+    'Ads1114':       'feeph.ads1xxx.ads1114',
+    'Ads1114Config': 'feeph.ads1xxx.ads1114',
+    'Ads1115':       'feeph.ads1xxx.ads1115',
+    'Ads1115Config': 'feeph.ads1xxx.ads1115',
+    'FrozenConfig':  'feeph.ads1xxx.ads1x1x',
+    'DeviceGroup':   'feeph.ads1xxx.group',
+    'ScanList':      'feeph.ads1xxx.scan',
+    'AutoRange':     'feeph.ads1xxx.autorange',
+    'LinuxI2C':      'feeph.ads1xxx.linux_i2c',
+    'REDUCTION':     'feeph.ads1xxx.oversampling',
+}
+
+__all__ = [
+    *_LAZY_IMPORTS,
+    'UNIT',
+    'CLAT', 'CMOD', 'CPOL', 'CQUE', 'DOM', 'DRS', 'MUX', 'PGA', 'SSC',
+]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module_name), name)
+    # cache the value - subsequent lookups don't call __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
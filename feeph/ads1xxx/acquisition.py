@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+background acquisition in continuous conversion mode
+
+A dedicated reader thread reads the conversion register at the
+configured data rate and stores the timestamped raw samples in a fixed-
+size ring buffer. Consumers fetch whatever is available in batches and
+never touch the I²C bus. A slow consumer therefore does not affect the
+sampling cadence, it only loses the oldest samples (overruns).
+
+usage:
+```
+with ads1115.start_acquisition(config=Ads1115Config(dom=DOM.CCM, drs=DRS.MODE7)) as acquisition:
+    while ...:
+        batch = acquisition.read_available()
+        process(batch.timestamps, batch.get_values())
+```
+
+(Do not access the device by other means while the acquisition is
+running.)
+"""
+
+import logging
+import threading
+import time
+from array import array
+from typing import TYPE_CHECKING
+
+from attrs import field, frozen
+
+from feeph.ads1xxx.conversions import UNIT
+
+if TYPE_CHECKING:
+    from feeph.ads1xxx.ads1x1x import Ads1x1x
+
+LH = logging.getLogger('feeph.ads1xxx')
+
+# seconds to wait for the reader thread to stop
+STOP_TIMEOUT = 1.0
+
+
+class SampleRing:
+    """
+    fixed-size ring buffer of timestamped raw samples
+
+    Single producer, single consumer. No lock is needed: the producer
+    publishes a sample by incrementing the write counter after storing
+    it and the consumer discards samples the producer might have
+    overwritten while they were copied.
+    """
+
+    def __init__(self, size: int):
+        if size < 2:
+            raise ValueError(f"ring buffer must hold at least 2 samples ({size})")
+        self.size = size
+        self.timestamps = array('q', [0]) * size  # monotonic clock (ns)
+        self.steps = array('H', [0]) * size       # conversion register
+        self.overruns = 0                         # samples overwritten before they were read
+        self._written = 0                         # total number of samples written
+        self._read = 0                            # total number of samples read
+
+    def put(self, timestamp: int, step: int):
+        index = self._written % self.size
+        self.timestamps[index] = timestamp
+        self.steps[index] = step
+        self._written += 1
+
+    def get(self, max_count: int | None = None) -> tuple[array, array, int]:
+        """
+        remove the available samples from the ring
+
+        returns the timestamps, the steps and the number of samples that
+        were lost since the previous call
+        """
+        written = self._written
+        first = max(self._read, written - self.size)
+        count = written - first
+        if max_count is not None:
+            count = min(count, max_count)
+        timestamps = self._copy(self.timestamps, first, count)
+        steps = self._copy(self.steps, first, count)
+        # the producer may have overwritten the oldest samples in the
+        # meantime (incl. the slot it's currently writing)
+        unsafe = self._written - self.size + 1 - first
+        if unsafe > 0:
+            unsafe = min(unsafe, count)
+            del timestamps[:unsafe]
+            del steps[:unsafe]
+        lost = max(unsafe, 0) + first - self._read
+        self._read = first + count
+        self.overruns += lost
+        return timestamps, steps, lost
+
+    def __len__(self) -> int:
+        return min(self._written - self._read, self.size)
+
+    def _copy(self, source: array, first: int, count: int) -> array:
+        start = first % self.size
+        end = start + count
+        if end <= self.size:
+            return source[start:end]
+        else:
+            return source[start:] + source[:end - self.size]
+
+
+@frozen
+class AcquisitionBatch:
+    """
+    samples fetched by a single 'Acquisition.read_available()'
+    """
+    # fmt: off
+    timestamps: array  # monotonic clock ('time.monotonic_ns()')
+    steps:      array  # conversion register
+    overruns:   int    # samples lost since the previous batch
+    _table:     array = field(repr=False)      # step -> microvolts
+    _shift:     int = field(repr=False)        # number of unused lower bits (12-bit: 4)
+    # fmt: on
+
+    def get_values(self, unit: UNIT = UNIT.MICRO) -> list[int]:
+        if unit == UNIT.MICRO:
+            table = self._table
+            shift = self._shift
+            return [table[step >> shift] for step in self.steps]
+        else:
+            return list(self.steps)
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+
+class Acquisition:
+    """
+    reader thread and ring buffer of a running acquisition
+
+    (use 'Ads1x1x.start_acquisition()' to create)
+    """
+
+    def __init__(self, device: 'Ads1x1x', buffer_size: int, period_ns: int, first_sample_ns: int,
+                 microvolt_table: array, shift: int):
+        self.ring = SampleRing(buffer_size)
+        self.error: Exception | None = None
+        self._device = device
+        self._period_ns = period_ns
+        self._first_sample_ns = first_sample_ns
+        self._microvolt_table = microvolt_table
+        self._shift = shift
+        self._first_timestamp: int | None = None
+        self._last_timestamp: int | None = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='feeph.ads1xxx.acquisition', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        """
+        stop the reader thread (samples in the ring remain available)
+        """
+        self._stop.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=STOP_TIMEOUT)
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    @property
+    def missed(self) -> int:
+        """
+        estimated number of conversions the reader thread did not read
+        """
+        first_timestamp = self._first_timestamp
+        last_timestamp = self._last_timestamp
+        if first_timestamp is None or last_timestamp is None:
+            return 0
+        expected = round((last_timestamp - first_timestamp) / self._period_ns) + 1
+        return max(expected - self.ring._written, 0)
+
+    def read_available(self, max_count: int | None = None) -> AcquisitionBatch:
+        """
+        fetch the samples acquired since the previous call
+
+        raises RuntimeError if the reader thread failed and all samples
+        were fetched
+        """
+        timestamps, steps, lost = self.ring.get(max_count=max_count)
+        if not steps and self.error is not None:
+            raise RuntimeError("acquisition failed") from self.error
+        return AcquisitionBatch(timestamps=timestamps, steps=steps, overruns=lost,
+                                table=self._microvolt_table, shift=self._shift)
+
+    def __enter__(self) -> 'Acquisition':
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.stop()
+
+    def _run(self):
+        read_conversion_register = self._device._read_conversion_register
+        put = self.ring.put
+        period_ns = self._period_ns
+        next_sample = self._first_sample_ns
+        while not self._stop.is_set():
+            delay_ns = next_sample - time.monotonic_ns()
+            if delay_ns > 0 and self._stop.wait(delay_ns / 1_000_000_000):
+                break
+            try:
+                step = read_conversion_register()
+            except Exception as e:
+                LH.error("Acquisition failed: %s", e)
+                self.error = e
+                break
+            timestamp = time.monotonic_ns()
+            put(timestamp, step)
+            if self._first_timestamp is None:
+                self._first_timestamp = timestamp
+            self._last_timestamp = timestamp
+            next_sample += period_ns
+            if next_sample <= timestamp:
+                # fell behind - skip the missed conversions (keeps the phase)
+                next_sample += ((timestamp - next_sample) // period_ns + 1) * period_ns
@@ -11,6 +11,7 @@ import logging
 from attrs import define
 
 from feeph.ads1xxx.ads1x1x import Ads1x1x, Ads1x1xConfig
+from feeph.ads1xxx.capabilities import ADS1013
 from feeph.ads1xxx.conversions import UNIT, convert_step_to_value
 from feeph.ads1xxx.settings import CLAT, CMOD, CPOL, CQUE, DOM, DRS, MUX, PGA, SSC
 
@@ -43,11 +44,12 @@ class Ads1013Config(Ads1x1xConfig):
     # doesn't have any effect since there is no comparator which uses them
 
     def get_atlo(self, unit: UNIT = UNIT.MICRO) -> int:
-        return convert_step_to_value(step=0x8000, unit=unit, pga=PGA.MODE2)
+        return convert_step_to_value(step=0x8000, unit=unit, pga=PGA.MODE2, resolution=12)
 
     def get_athi(self, unit: UNIT = UNIT.MICRO) -> int:
-        return convert_step_to_value(step=0x7FFF, unit=unit, pga=PGA.MODE2)
+        return convert_step_to_value(step=0x7FFF, unit=unit, pga=PGA.MODE2, resolution=12)
 
 
 class Ads1013(Ads1x1x):
-    _has_pga = False
+    capabilities = ADS1013
+    _config_class = Ads1013Config
@@ -11,6 +11,7 @@ import logging
 from attrs import define
 
 from feeph.ads1xxx.ads1x1x import Ads1x1x, Ads1x1xConfig
+from feeph.ads1xxx.capabilities import ADS1015
 from feeph.ads1xxx.conversions import UNIT, convert_step_to_value, convert_value_to_step
 from feeph.ads1xxx.settings import CLAT, CMOD, CPOL, CQUE, DOM, DRS, MUX, PGA, SSC
 
@@ -47,21 +48,21 @@ class Ads1015Config(Ads1x1xConfig):
         return value
 
     def get_atlo(self, unit: UNIT = UNIT.MICRO) -> int:
-        return convert_step_to_value(step=self.atlo, unit=unit, pga=self.pga)
+        return convert_step_to_value(step=self.atlo, unit=unit, pga=self.pga, resolution=12)
 
     def set_atlo(self, value: int, unit: UNIT = UNIT.MICRO) -> bool:
         try:
-            self.atlo = convert_value_to_step(value=value, unit=unit, pga=self.pga)
+            self.atlo = convert_value_to_step(value=value, unit=unit, pga=self.pga, resolution=12)
             return True
         except ValueError:
             return False
 
     def get_athi(self, unit: UNIT = UNIT.MICRO) -> int:
-        return convert_step_to_value(step=self.athi, unit=unit, pga=self.pga)
+        return convert_step_to_value(step=self.athi, unit=unit, pga=self.pga, resolution=12)
 
     def set_athi(self, value: int, unit: UNIT = UNIT.MICRO) -> bool:
         try:
-            self.athi = convert_value_to_step(value=value, unit=unit, pga=self.pga)
+            self.athi = convert_value_to_step(value=value, unit=unit, pga=self.pga, resolution=12)
             return True
         except ValueError:
             return False
@@ -76,4 +77,5 @@ DEFAULTS = {
 
 
 class Ads1015(Ads1x1x):
-    _has_pga = True
+    capabilities = ADS1015
+    _config_class = Ads1015Config
@@ -11,6 +11,7 @@ import logging
 from attrs import define
 
 from feeph.ads1xxx.ads1x1x import Ads1x1x, Ads1x1xConfig
+from feeph.ads1xxx.capabilities import ADS1113
 from feeph.ads1xxx.conversions import UNIT, convert_step_to_value
 from feeph.ads1xxx.settings import CLAT, CMOD, CPOL, CQUE, DOM, DRS, MUX, PGA, SSC
 
@@ -50,4 +51,5 @@ class Ads1113Config(Ads1x1xConfig):
 
 
 class Ads1113(Ads1x1x):
-    _has_pga = False
+    capabilities = ADS1113
+    _config_class = Ads1113Config
@@ -11,6 +11,7 @@ import logging
 from attrs import define
 
 from feeph.ads1xxx.ads1x1x import Ads1x1x, Ads1x1xConfig
+from feeph.ads1xxx.capabilities import ADS1114
 from feeph.ads1xxx.conversions import UNIT, convert_step_to_value, convert_value_to_step
 from feeph.ads1xxx.settings import CLAT, CMOD, CPOL, CQUE, DOM, DRS, MUX, PGA, SSC
 
@@ -67,4 +68,5 @@ class Ads1114Config(Ads1x1xConfig):
 
 
 class Ads1114(Ads1x1x):
-    _has_pga = True
+    capabilities = ADS1114
+    _config_class = Ads1114Config
@@ -3,15 +3,34 @@
 abstract base class for ADS1113, ADS1114 and ADS1115
 """
 
+import functools
 import logging
+import sys
+import time
 from abc import ABC, abstractmethod
+from array import array
+from enum import Enum
+from typing import TYPE_CHECKING, Iterator, TypeVar
 
-# module busio provides no type hints
-import busio  # type: ignore
-from feeph.i2c import BurstHandler
+import attrs
+from attrs import field, frozen
 
-from feeph.ads1xxx.conversions import UNIT, convert_step_to_microvolts
-from feeph.ads1xxx.settings import DOM, PGA, SSC
+from feeph.ads1xxx.acquisition import Acquisition
+from feeph.ads1xxx.capabilities import CONVERSION_MARGIN, Capabilities
+from feeph.ads1xxx.conversions import UNIT, get_microvolt_table
+from feeph.ads1xxx.instrumentation import DeviceStatistics, InstrumentedBurstHandler, StatisticsReport, create_report
+from feeph.ads1xxx.oversampling import REDUCTION, OversampledMeasurement, combine_samples
+from feeph.ads1xxx.settings import CQUE, DOM, PGA, SETTING_MASKS, SSC, decode_setting
+
+if TYPE_CHECKING:
+    # module busio provides no type hints
+    import busio  # type: ignore
+    from feeph.i2c import BurstHandler
+
+    from feeph.ads1xxx.linux_i2c import LinuxBurstHandler, LinuxI2C
+
+    # module gpiod is only needed if the ALERT/RDY pin is used
+    from feeph.ads1xxx.alert import AlertReadyPin
 
 LH = logging.getLogger('feeph.ads1xxx')
 
@@ -23,9 +42,67 @@ DEFAULTS = {
     0x03: 0x7FFF,  # hi_thresh register  (2 bytes, rw)
 }
 
+# I²C bus addresses selectable with the ADDR pin
+I2C_ADDRESSES = (0x48, 0x49, 0x4A, 0x4B)
+
+# the pointer register selects the register for subsequent reads
+POINTER_CONVERSION = bytes([0x00])
+
+# wait for the conversion to complete before polling the OS bit, poll
+# at 1/10th of the conversion time and give up after twice the time
+POLL_BUDGET = 10
+POLL_TIMEOUT = 2.0  # multiple of the conversion time
+
+# buffer formats with 2-byte items accepted by 'capture()' (host byte order)
+SAMPLE_FORMATS = ('h', 'H', '@h', '@H')
+
+# give up if the I²C bus can't be locked in time (same as BurstHandler)
+LOCK_TIMEOUT = 0.5           # seconds
+LOCK_POLL_INTERVAL = 0.0001  # seconds
+
+
+C = TypeVar('C', bound='Ads1x1xConfig')
+
 
 class Ads1x1xConfig(ABC):
 
+    @classmethod
+    def from_uint16(cls: type[C], value: int, atlo: int | None = None, athi: int | None = None) -> C:
+        """
+        decode a config register value (e.g. read from the device)
+
+        The thresholds are stored in separate registers and can be provided
+        as steps. (The defaults are used otherwise.) Settings which are not
+        supported by the model are ignored.
+
+        The OS bit is ignored as well. When read from the device it reports
+        the conversion status (1 = no conversion in progress) and would
+        otherwise decode to 'SSC.START'.
+
+        raises ValueError if the value is out of range
+        """
+        if not 0x0000 <= value <= 0xFFFF:
+            raise ValueError(f"config register value is out of range ({value})")
+        kwargs: dict[str, Enum | int] = dict(_decode_settings(cls, value & ~SSC.START.value))
+        field_names = attrs.fields_dict(cls)  # type: ignore[arg-type]
+        if atlo is not None and 'atlo' in field_names:
+            kwargs['atlo'] = atlo
+        if athi is not None and 'athi' in field_names:
+            kwargs['athi'] = athi
+        return cls(**kwargs)
+
+    def freeze(self) -> 'FrozenConfig':
+        """
+        immutable and hashable copy with precomputed register values
+        """
+        return FrozenConfig(
+            config_class=type(self),
+            config_uint=self.as_uint16(),
+            atlo=self.get_atlo(unit=UNIT.STEPS),
+            athi=self.get_athi(unit=UNIT.STEPS),
+            config=attrs.evolve(self),  # type: ignore[misc]
+        )
+
     @abstractmethod
     def as_uint16(self) -> int:
         """
@@ -45,12 +122,103 @@ class Ads1x1xConfig(ABC):
         """
 
 
+@frozen
+class FrozenConfig(Ads1x1xConfig):
+    """
+    immutable and hashable configuration
+
+    The register values are computed once instead of on every use and
+    the configuration can be used as a dictionary key:
+    ```
+    config = Ads1115Config(mux=MUX.MODE4, pga=PGA.MODE1).freeze()
+    ads1115.get_ssc_measurement(config=config)
+    ```
+    Use 'thaw()' to get a mutable copy of the original configuration.
+    """
+    # fmt: off
+    config_class: type[Ads1x1xConfig]  # config class of the device model
+    config_uint:  int                  # config register
+    atlo:         int                  # lo_thresh register (steps)
+    athi:         int                  # hi_thresh register (steps)
+    _config:      Ads1x1xConfig = field(eq=False, repr=False)  # private copy (unit conversions)
+    # fmt: on
+
+    def freeze(self) -> 'FrozenConfig':
+        return self
+
+    def thaw(self) -> Ads1x1xConfig:
+        """
+        mutable copy of the original configuration
+        """
+        return attrs.evolve(self._config)  # type: ignore[misc]
+
+    def as_uint16(self) -> int:
+        return self.config_uint
+
+    def get_atlo(self, unit: UNIT = UNIT.MICRO) -> int:
+        if unit == UNIT.STEPS:
+            return self.atlo
+        return self._config.get_atlo(unit=unit)
+
+    def get_athi(self, unit: UNIT = UNIT.MICRO) -> int:
+        if unit == UNIT.STEPS:
+            return self.athi
+        return self._config.get_athi(unit=unit)
+
+
+@functools.lru_cache(maxsize=256)
+def _decode_settings(config_class: type[Ads1x1xConfig], config_uint: int) -> tuple[tuple[str, Enum], ...]:
+    """
+    decode the settings of a config register value (cached)
+    """
+    if not 0x0000 <= config_uint <= 0xFFFF:
+        raise ValueError(f"config register value is out of range ({config_uint})")
+    settings = []
+    for attribute in attrs.fields(config_class):  # type: ignore[arg-type]
+        if attribute.type in SETTING_MASKS:
+            settings.append((attribute.name, decode_setting(attribute.type, config_uint)))
+    return tuple(settings)
+
+
+def _swap_bytes(view: memoryview, first: int, last: int):
+    """
+    swap the bytes of the words 'first' to 'last' (exclusive)
+    """
+    words = view[first * 2:last * 2]
+    words[0::2], words[1::2] = bytes(words[1::2]), bytes(words[0::2])
+
+
 class Ads1x1x:
-    _has_pga = False
+    # provided by the device classes
+    capabilities: Capabilities
+    _config_class: type[Ads1x1xConfig]
 
-    def __init__(self, i2c_bus: busio.I2C):
+    def __init__(self, i2c_bus: 'busio.I2C | LinuxI2C', i2c_adr: int = 0x48):
+        # the I²C bus address is selected by connecting the ADDR pin:
+        # GND -> 0x48, VDD -> 0x49, SDA -> 0x4A, SCL -> 0x4B
+        if i2c_adr not in I2C_ADDRESSES:
+            raise ValueError(f"invalid I²C bus address (0x{i2c_adr:02X})")
         self._i2c_bus = i2c_bus
-        self._i2c_adr = 0x48  # the I²C bus address is hardcoded
+        self._i2c_adr = i2c_adr
+        # buses may provide their own burst handler (e.g. LinuxI2C)
+        burst_handler_class = getattr(i2c_bus, 'burst_handler_class', None)
+        if burst_handler_class is None:
+            # imported on first use - feeph.i2c imports busio, which
+            # performs the (slow) board detection of Blinka
+            from feeph.i2c import BurstHandler
+            burst_handler_class = BurstHandler
+        self._burst_handler_class = burst_handler_class
+        # shadow copy of the writeable registers (None if unknown)
+        self._shadow: dict[int, int | None] = {0x01: None, 0x02: None, 0x03: None}
+        # last known content of the pointer register (None if unknown)
+        self._pointer: int | None = None
+        self._buffer = bytearray(2)
+        # transaction statistics (None if disabled)
+        self._statistics: DeviceStatistics | None = None
+        # background acquisition (None if never started)
+        self._acquisition: Acquisition | None = None
+        # prepared measurements of frozen configurations
+        self._prepared: dict[FrozenConfig, PreparedMeasurement] = {}
 
     def reset_device_registers(self):
         """
@@ -60,83 +228,592 @@ class Ads1x1x:
         which is honored by this device, but this will reset ALL devices
         on the I²C bus.)
         """
-        with BurstHandler(i2c_bus=self._i2c_bus, i2c_adr=self._i2c_adr) as bh:
+        with self._get_burst_handler() as bh:
             for register, value in DEFAULTS.items():
                 if value is None:
                     # skip read-only registers
                     continue
                 bh.write_register(register, value, byte_count=2)
+                self._shadow[register] = value
+        # the OS bit started a conversion, it's not part of the configuration
+        self._shadow[0x01] = 0x0583
+
+    def invalidate_shadow_registers(self):
+        """
+        forget the shadow copy of the device's registers
+
+        Use this if the device's state is unknown, e.g. if it was power-
+        cycled or configured by other means. The next operation will read
+        or write the registers instead of relying on the shadow copy.
+        """
+        self._shadow = {0x01: None, 0x02: None, 0x03: None}
 
     def configure(self, config: Ads1x1xConfig) -> bool:
+        config_uint = config.as_uint16()
         # order is important!
-        with BurstHandler(i2c_bus=self._i2c_bus, i2c_adr=self._i2c_adr) as bh:
-            # 1) reset to a defined state and disable alerting
-            bh.write_register(0x01, 0x0583, byte_count=2)
-            # 2) configure thresholds
-            bh.write_register(0x10, config.get_atlo(unit=UNIT.STEPS), byte_count=2)
-            bh.write_register(0x11, config.get_athi(unit=UNIT.STEPS), byte_count=2)
+        with self._get_burst_handler() as bh:
+            self._update_thresholds(bh, config.get_atlo(unit=UNIT.STEPS), config.get_athi(unit=UNIT.STEPS))
             # 3) update config register
-            bh.write_register(0x01, config.as_uint16(), byte_count=2)
+            self._update_register(bh, 0x01, config_uint, force=bool(config_uint & SSC.START.value))
         return True
 
     def get_ssc_measurement(self, config: Ads1x1xConfig | None = None, unit: UNIT = UNIT.MICRO) -> int:
-        with BurstHandler(i2c_bus=self._i2c_bus, i2c_adr=self._i2c_adr) as bh:
-            if config is None:
-                config_uint = bh.read_register(0x01, byte_count=2)
-                config_atlo = None
-                config_athi = None
-            else:
-                config_uint = config.as_uint16()
-                config_atlo = config.get_atlo(unit=UNIT.STEPS)
-                config_athi = config.get_athi(unit=UNIT.STEPS)
-            if config_uint & DOM.SSM.value:
-                # 1) reset to a defined state and disable alerting
-                bh.write_register(0x01, 0x0583, byte_count=2)
-                # 2) configure thresholds
-                if config_atlo is not None:
-                    bh.write_register(0x10, config_atlo, byte_count=2)
-                if config_athi is not None:
-                    bh.write_register(0x11, config_athi, byte_count=2)
-                # 3) update config register
-                bh.write_register(0x01, config_uint | SSC.START.value, byte_count=2)
-                # TODO wait until measurement is ready
-                # (0b0..._...._...._.... -> 0b1..._...._...._....)
-                step = bh.read_register(0x00, byte_count=2)
-                if unit == UNIT.MICRO:
-                    if self._has_pga:
-                        pga_setting = config_uint & 0b0000_1110_0000_0000
-                        for pga_mode in PGA:
-                            if pga_setting == pga_mode.value:
-                                return convert_step_to_microvolts(step, pga_mode)
-                        else:
-                            raise RuntimeError('unable to identify PGA mode (0x{config_uint:08X})')
-                    else:
-                        # ADS1113 has a fixed voltage range of ±2.048V
-                        return convert_step_to_microvolts(step, PGA.MODE2)
-                else:
-                    return step
-            else:
-                raise RuntimeError("device is configured for continuous conversion")
+        with self._get_burst_handler() as bh:
+            config_uint = self._start_conversion(bh, config)
+            # 4) wait until measurement is ready
+            self._wait_for_conversion(bh, self.capabilities.get_conversion_time(config_uint))
+            step = bh.read_register(0x00, byte_count=2)
+        return self._convert_step(step, config_uint, unit)
 
     def get_ccm_measurement(self, unit: UNIT = UNIT.MICRO) -> int:
-        with BurstHandler(i2c_bus=self._i2c_bus, i2c_adr=self._i2c_adr) as bh:
-            config_uint = bh.read_register(0x01, byte_count=2)
+        with self._get_burst_handler() as bh:
+            config_uint = self._shadow[0x01]
+            if config_uint is None:
+                config_uint = bh.read_register(0x01, byte_count=2) & ~SSC.START.value
+                self._shadow[0x01] = config_uint
             if config_uint & DOM.SSM.value:
                 raise RuntimeError("device is configured for singleshot mode")
             else:
                 # TODO wait until measurement is ready
                 # (0b0..._...._...._.... -> 0b1..._...._...._....)
                 step = bh.read_register(0x00, byte_count=2)
-                if unit == UNIT.MICRO:
-                    if self._has_pga:
-                        pga_setting = config_uint & 0b0000_1110_0000_0000
-                        for pga_mode in PGA:
-                            if pga_setting == pga_mode.value:
-                                return convert_step_to_microvolts(step, pga_mode)
-                        else:
-                            raise RuntimeError('unable to identify PGA mode ({config_uint:08X})')
-                    else:
-                        # ADS1113 has a fixed voltage range of ±2.048V
-                        return convert_step_to_microvolts(step, PGA.MODE2)
-                else:
-                    return step
+                return self._convert_step(step, config_uint, unit)
+
+    def get_config(self) -> Ads1x1xConfig:
+        """
+        current configuration of the device
+
+        Uses the shadow registers if known and reads the registers
+        otherwise. The OS bit is a status bit when reading and is not
+        part of the returned configuration.
+        """
+        registers = {register: value for register, value in self._shadow.items() if value is not None}
+        if len(registers) < len(self._shadow):
+            with self._get_burst_handler() as bh:
+                for register in self._shadow:
+                    if register not in registers:
+                        value = bh.read_register(register, byte_count=2)
+                        if register == 0x01:
+                            value &= ~SSC.START.value
+                        registers[register] = value
+                        self._shadow[register] = value
+        return self._config_class.from_uint16(registers[0x01], atlo=registers[0x02], athi=registers[0x03])
+
+    def configure_rdy(self, config: Ads1x1xConfig) -> bool:
+        """
+        configure the ALERT/RDY pin as a conversion-ready signal
+
+        The comparator is used to signal that a conversion is completed
+        instead of comparing the measured values with the thresholds.
+        Setting the most-significant bit of hi_thresh to 1 and the most-
+        significant bit of lo_thresh to 0 enables this mode. The comparator
+        must be enabled, CQUE.DIS is replaced with CQUE.AA1.
+        """
+        if not self.capabilities.has_comparator:
+            raise RuntimeError("device has no ALERT/RDY pin")
+        config_uint = config.as_uint16() & ~SSC.START.value
+        if config_uint & CQUE.DIS.value == CQUE.DIS.value:
+            config_uint = (config_uint & ~CQUE.DIS.value) | CQUE.AA1.value
+        # order is important!
+        with self._get_burst_handler() as bh:
+            self._update_thresholds(bh, 0x0000, 0x8000)
+            # 3) update config register
+            self._update_register(bh, 0x01, config_uint)
+        return True
+
+    def get_rdy_measurement(self, alert: 'AlertReadyPin', unit: UNIT = UNIT.MICRO) -> int:
+        """
+        wait for the ALERT/RDY pin to assert and read the conversion register
+
+        The device must have been configured with 'configure_rdy()' first.
+        In single-shot mode a new conversion is started, in continuous
+        conversion mode we wait for the next conversion to complete.
+
+        raises RuntimeError if the pin does not assert in time
+        """
+        config_uint = self._shadow[0x01]
+        thresholds = (self._shadow[0x02], self._shadow[0x03])
+        if config_uint is None or config_uint & CQUE.DIS.value == CQUE.DIS.value or thresholds != (0x0000, 0x8000):
+            raise RuntimeError("device is not configured for conversion-ready mode")
+        timeout = self.capabilities.get_conversion_time(config_uint) * POLL_TIMEOUT
+        with self._get_burst_handler() as bh:
+            if config_uint & DOM.SSM.value:
+                alert.clear()
+                bh.write_register(0x01, config_uint | SSC.START.value, byte_count=2)
+            if not alert.wait(timeout=timeout):
+                raise RuntimeError("ALERT/RDY pin did not assert in time")
+            step = bh.read_register(0x00, byte_count=2)
+        return self._convert_step(step, config_uint, unit)
+
+    def get_hot_measurement(self, unit: UNIT = UNIT.MICRO) -> int:
+        """
+        read the conversion register without touching any other register
+
+        Requires the device to be configured for continuous conversion
+        mode by this instance. The config register is not read again and
+        the pointer register is only set if it doesn't point to the
+        conversion register already. Consecutive calls therefore result in
+        a single 2-byte read transaction each.
+
+        (The pointer register is tracked by this instance. Do not access
+        the device by other means while using this method.)
+        """
+        config_uint = self._shadow[0x01]
+        if config_uint is None:
+            raise RuntimeError("device configuration is unknown")
+        if config_uint & DOM.SSM.value:
+            raise RuntimeError("device is configured for singleshot mode")
+        step = self._read_conversion_register()
+        return self._convert_step(step, config_uint, unit)
+
+    def prepare(self, config: Ads1x1xConfig) -> 'PreparedMeasurement':
+        """
+        precompute everything needed for a single-shot measurement
+
+        The returned object contains the register values, the conversion
+        table and the expected conversion time. Calling 'measure()' on it
+        only performs the bus transactions and a table lookup.
+
+        The result is reused for frozen configurations ('config.freeze()').
+        """
+        if isinstance(config, FrozenConfig):
+            prepared = self._prepared.get(config)
+            if prepared is None:
+                prepared = self._prepare(config)
+                self._prepared[config] = prepared
+            return prepared
+        return self._prepare(config)
+
+    def _prepare(self, config: Ads1x1xConfig) -> 'PreparedMeasurement':
+        config_uint = config.as_uint16() & ~SSC.START.value
+        if not config_uint & DOM.SSM.value:
+            raise RuntimeError("config must use single-shot mode")
+        return PreparedMeasurement(
+            device=self,
+            config_uint=config_uint,
+            atlo=config.get_atlo(unit=UNIT.STEPS),
+            athi=config.get_athi(unit=UNIT.STEPS),
+            start_uint=config_uint | SSC.START.value,
+            shift=16 - self.capabilities.resolution,
+            microvolt_table=get_microvolt_table(self._get_pga(config_uint), resolution=self.capabilities.resolution),
+            conversion_time=self.capabilities.get_conversion_time(config_uint),
+        )
+
+    def stream(self, config: Ads1x1xConfig, count: int | None = None, unit: UNIT = UNIT.MICRO) -> Iterator[tuple[int, int]]:
+        """
+        configure continuous conversion mode and yield measurements
+
+        The device is configured once and each sample is a single read of
+        the conversion register. Samples are paced to the configured data
+        rate and provided as '(timestamp_ns, value)' tuples. The timestamp
+        uses the monotonic clock ('time.monotonic_ns()').
+
+        If the consumer falls behind, the missed samples are skipped
+        instead of returning the same conversion result multiple times.
+        Provide 'count' to limit the number of samples.
+        """
+        config_uint = config.as_uint16()
+        if config_uint & DOM.SSM.value:
+            raise RuntimeError("config must use continuous conversion mode")
+        self.configure(config=config)
+        # decode the PGA setting once instead of every sample
+        microvolt_table = get_microvolt_table(self._get_pga(config_uint), resolution=self.capabilities.resolution)
+        shift = 16 - self.capabilities.resolution
+        period_ns = 1_000_000_000 // self.capabilities.get_data_rate(config_uint)
+        # the first conversion is completed after the conversion time
+        next_sample = time.monotonic_ns() + round(self.capabilities.get_conversion_time(config_uint) * 1_000_000_000)
+        sample_count = 0
+        while count is None or sample_count < count:
+            delay_ns = next_sample - time.monotonic_ns()
+            if delay_ns > 0:
+                time.sleep(delay_ns / 1_000_000_000)
+            step = self._read_conversion_register()
+            timestamp = time.monotonic_ns()
+            if unit == UNIT.MICRO:
+                yield (timestamp, microvolt_table[step >> shift])
+            else:
+                yield (timestamp, step)
+            sample_count += 1
+            next_sample += period_ns
+            if next_sample <= timestamp:
+                # consumer fell behind - resynchronize
+                next_sample = timestamp + period_ns
+
+    def get_oversampled_measurement(self, config: Ads1x1xConfig, samples: int, reduction: REDUCTION = REDUCTION.MEAN,
+                                    unit: UNIT = UNIT.MICRO) -> OversampledMeasurement:
+        """
+        combine multiple conversions into a single low-noise measurement
+
+        The device is configured for continuous conversion mode and the
+        conversions are captured into a single buffer (no Python objects
+        per sample). The device is not reconfigured if the configuration
+        didn't change. Use a high data rate to reduce the duration.
+
+        The result contains the combined value, the noise of the individual
+        samples and an estimate of the effective resolution.
+
+        The samples are paced by the host, the device's oscillator is only
+        accurate to ±10%. Reading a conversion twice would understate the
+        noise and overstate the effective resolution. The period between
+        two reads is therefore padded by the same margin as the conversion
+        time. A device that is slower by up to 10% provides a new
+        conversion for each sample, a faster device has some conversions
+        skipped (the measurement takes up to 10% longer).
+        """
+        if samples < 1:
+            raise ValueError(f"samples must be at least 1 ({samples})")
+        config_uint = config.as_uint16() & ~SSC.START.value
+        if config_uint & DOM.SSM.value:
+            raise RuntimeError("config must use continuous conversion mode")
+        if self._shadow[0x01] != config_uint:
+            self.configure(config=config)
+            # wait for the first conversion with the new configuration
+            time.sleep(self.capabilities.get_conversion_time(config_uint))
+        buffer = bytearray(2 * samples)
+        self._capture(buffer, count=None, start=0, period_margin=CONVERSION_MARGIN)
+        return combine_samples(buffer, reduction, pga=self._get_pga(config_uint), resolution=self.capabilities.resolution,
+                               unit=unit)
+
+    def start_acquisition(self, config: Ads1x1xConfig, buffer_size: int = 1024) -> Acquisition:
+        """
+        configure continuous conversion mode and start a reader thread
+
+        The reader thread reads each conversion and stores it with its
+        timestamp in a ring buffer of 'buffer_size' samples. Use
+        'read_available()' on the returned object to fetch the samples
+        and 'stop()' to stop the thread.
+
+        (Do not access the device by other means while the acquisition
+        is running.)
+        """
+        if self._acquisition is not None and self._acquisition.running:
+            raise RuntimeError("acquisition is running already")
+        config_uint = config.as_uint16()
+        if config_uint & DOM.SSM.value:
+            raise RuntimeError("config must use continuous conversion mode")
+        self.configure(config=config)
+        acquisition = Acquisition(
+            device=self,
+            buffer_size=buffer_size,
+            period_ns=1_000_000_000 // self.capabilities.get_data_rate(config_uint),
+            # the first conversion is completed after the conversion time
+            first_sample_ns=time.monotonic_ns() + round(self.capabilities.get_conversion_time(config_uint) * 1_000_000_000),
+            microvolt_table=get_microvolt_table(self._get_pga(config_uint), resolution=self.capabilities.resolution),
+            shift=16 - self.capabilities.resolution,
+        )
+        acquisition.start()
+        self._acquisition = acquisition
+        return acquisition
+
+    def enable_statistics(self):
+        """
+        start counting the bus transactions of this device
+
+        Has no effect if statistics are enabled already. Use
+        'get_statistics()' to query the statistics.
+        """
+        if self._statistics is None:
+            self._statistics = DeviceStatistics()
+
+    def disable_statistics(self):
+        """
+        stop counting and discard the statistics
+        """
+        self._statistics = None
+
+    def reset_statistics(self):
+        if self._statistics is not None:
+            self._statistics.reset()
+
+    def get_statistics(self) -> StatisticsReport | None:
+        """
+        snapshot of the transaction statistics (None if disabled)
+
+        The configured sample rate is derived from the last known
+        configuration of this device.
+        """
+        statistics = self._statistics
+        if statistics is None:
+            return None
+        config_uint = self._shadow[0x01]
+        configured_sample_rate = self.capabilities.get_data_rate(config_uint) if config_uint is not None else None
+        return create_report(statistics, configured_sample_rate)
+
+    def capture(self, buffer, count: int | None = None, start: int = 0) -> int:
+        """
+        read raw conversion results into a caller-supplied buffer
+
+        The buffer can be any writable buffer with 1-byte items or native
+        16-bit integers (e.g. 'bytearray', 'array('h')' or a memoryview of
+        either) and is treated as a ring of 2-byte words. The
+        conversion register is read straight into the buffer, no Python
+        objects are created per sample. Samples are paced to the
+        configured data rate.
+
+        Buffers with 2-byte items (e.g. 'array('h')', 'array('H')' or an
+        int16 numpy array) receive the words as numbers in host byte order.
+        Byte buffers (e.g. 'bytearray') receive the words as transmitted by
+        the device (big-endian). The vectorized conversions follow the same
+        rule. Convert the words afterwards with a single vectorized pass:
+        ```
+        ring = array('h', bytes(2 * 3300))
+        index = ads1115.capture(ring)
+        values = convert_steps_to_microvolts(ring, pga=PGA.MODE2)
+        ```
+        (Use 'resolution=12' for the ADS101x.)
+
+        Writes 'count' samples (default: the buffer's capacity) starting
+        with the word at index 'start' and wraps around at the end of the
+        buffer. Returns the index of the next word, which can be used as
+        'start' for the next call.
+
+        Requires the device to be configured for continuous conversion
+        mode by this instance (see 'get_hot_measurement()').
+
+        raises ValueError if the buffer has other items (e.g. 'array('i')')
+        raises TypeError if the buffer is read-only
+        """
+        return self._capture(buffer, count=count, start=start, period_margin=1.0)
+
+    def _capture(self, buffer, count: int | None, start: int, period_margin: float) -> int:
+        """
+        implementation of 'capture()' with the pacing period padded by the
+        provided factor
+
+        A padded period is measured from the previous read. A late read
+        is therefore never followed by a read of the same conversion (if
+        the padding covers the deviation of the device's oscillator).
+        """
+        config_uint = self._shadow[0x01]
+        if config_uint is None:
+            raise RuntimeError("device configuration is unknown")
+        if config_uint & DOM.SSM.value:
+            raise RuntimeError("device is configured for singleshot mode")
+        source = memoryview(buffer)
+        if source.itemsize != 1 and (source.itemsize != 2 or source.format not in SAMPLE_FORMATS):
+            raise ValueError(f"buffer must have 1-byte or 2-byte integer items (format '{source.format}')")
+        view = source.cast('B')
+        if view.readonly:
+            raise TypeError("buffer must be writable")
+        capacity = len(view) // 2
+        if capacity == 0:
+            raise ValueError("buffer must hold at least one sample")
+        if not 0 <= start < capacity:
+            raise ValueError(f"start must be between 0 and {capacity - 1}")
+        if count is None:
+            count = capacity
+        period_ns = round(1_000_000_000 * period_margin) // self.capabilities.get_data_rate(config_uint)
+        next_sample = time.monotonic_ns()
+        index = start
+        for _ in range(count):
+            delay_ns = next_sample - time.monotonic_ns()
+            if delay_ns > 0:
+                time.sleep(delay_ns / 1_000_000_000)
+            elif delay_ns < -period_ns:
+                # fell behind - resynchronize instead of reading the same conversion repeatedly
+                next_sample -= delay_ns
+            self._read_conversion_into(view, index * 2)
+            index += 1
+            if index == capacity:
+                index = 0
+            next_sample += period_ns
+            if period_margin > 1.0:
+                next_sample = max(next_sample, time.monotonic_ns() + period_ns)
+        if source.itemsize == 2 and sys.byteorder == 'little':
+            # the device transmits big-endian words
+            if count >= capacity:
+                _swap_bytes(view, 0, capacity)
+            elif start + count <= capacity:
+                _swap_bytes(view, start, start + count)
+            else:
+                _swap_bytes(view, start, capacity)
+                _swap_bytes(view, 0, start + count - capacity)
+        return index
+
+    def _get_burst_handler(self) -> 'BurstHandler | LinuxBurstHandler | InstrumentedBurstHandler':
+        # any register access moves the pointer register
+        self._pointer = None
+        burst_handler = self._burst_handler_class(i2c_bus=self._i2c_bus, i2c_adr=self._i2c_adr)
+        if self._statistics is None:
+            return burst_handler
+        else:
+            return InstrumentedBurstHandler(burst_handler, self._statistics)
+
+    def _update_register(self, bh, register: int, value: int, force: bool = False):
+        """
+        write the register unless the shadow copy shows it's already set
+        """
+        if force or self._shadow[register] != value:
+            bh.write_register(register, value, byte_count=2)
+            self._shadow[register] = value & ~SSC.START.value if register == 0x01 else value
+
+    def _update_thresholds(self, bh, atlo: int, athi: int):
+        if self._shadow[0x02] != atlo or self._shadow[0x03] != athi:
+            # 1) reset to a defined state and disable alerting
+            self._update_register(bh, 0x01, 0x0583)
+            # 2) configure thresholds
+            self._update_register(bh, 0x02, atlo)
+            self._update_register(bh, 0x03, athi)
+
+    def _read_conversion_register(self) -> int:
+        """
+        read the conversion register using the preallocated buffer
+        """
+        self._read_conversion_into(self._buffer, 0)
+        return (self._buffer[0] << 8) | self._buffer[1]
+
+    def _read_conversion_into(self, buffer, offset: int):
+        """
+        read the conversion register into 'buffer[offset:offset + 2]'
+
+        The pointer register is written only if it's not pointing to the
+        conversion register already.
+        """
+        if self._statistics is not None:
+            self._read_conversion_into_instrumented(buffer, offset, self._statistics)
+            return
+        i2c_bus = self._lock_bus()
+        try:
+            if self._pointer != 0x00:
+                i2c_bus.writeto(self._i2c_adr, POINTER_CONVERSION)
+                self._pointer = 0x00
+            i2c_bus.readfrom_into(self._i2c_adr, buffer, start=offset, end=offset + 2)
+        finally:
+            i2c_bus.unlock()
+
+    def _lock_bus(self):
+        """
+        lock the I²C bus (without creating a burst handler)
+
+        raises RuntimeError if the bus can't be locked in time
+        """
+        i2c_bus = self._i2c_bus
+        if i2c_bus.try_lock():
+            return i2c_bus
+        deadline = time.monotonic() + LOCK_TIMEOUT
+        while not i2c_bus.try_lock():
+            if time.monotonic() >= deadline:
+                raise RuntimeError("unable to lock the I²C bus")
+            time.sleep(LOCK_POLL_INTERVAL)
+        return i2c_bus
+
+    def _read_conversion_into_instrumented(self, buffer, offset: int, statistics: DeviceStatistics):
+        i2c_bus = self._lock_bus()
+        try:
+            if self._pointer != 0x00:
+                time_start = time.perf_counter_ns()
+                i2c_bus.writeto(self._i2c_adr, POINTER_CONVERSION)
+                statistics.record_pointer_write(time.perf_counter_ns() - time_start)
+                self._pointer = 0x00
+            time_start = time.perf_counter_ns()
+            i2c_bus.readfrom_into(self._i2c_adr, buffer, start=offset, end=offset + 2)
+            statistics.record_read(0x00, time.perf_counter_ns() - time_start)
+        except Exception:
+            statistics.record_error()
+            raise
+        finally:
+            i2c_bus.unlock()
+
+    def _get_pga(self, config_uint: int) -> PGA:
+        if self.capabilities.has_pga:
+            return decode_setting(PGA, config_uint)
+        else:
+            # ADS1013 and ADS1113 have a fixed voltage range of ±2.048V
+            return PGA.MODE2
+
+    def _convert_step(self, step: int, config_uint: int, unit: UNIT) -> int:
+        if unit == UNIT.MICRO:
+            resolution = self.capabilities.resolution
+            return get_microvolt_table(self._get_pga(config_uint), resolution=resolution)[step >> (16 - resolution)]
+        else:
+            return step
+
+    def _start_conversion(self, bh, config: Ads1x1xConfig | None) -> int:
+        """
+        start a single-shot conversion
+
+        returns the config register (without the OS bit)
+        """
+        if config is None:
+            config_uint = self._shadow[0x01]
+            if config_uint is None:
+                config_uint = bh.read_register(0x01, byte_count=2) & ~SSC.START.value
+                self._shadow[0x01] = config_uint
+            config_atlo = None
+            config_athi = None
+        else:
+            config_uint = config.as_uint16() & ~SSC.START.value
+            config_atlo = config.get_atlo(unit=UNIT.STEPS)
+            config_athi = config.get_athi(unit=UNIT.STEPS)
+        if config_uint & DOM.SSM.value:
+            if config_atlo is not None and config_athi is not None:
+                self._update_thresholds(bh, config_atlo, config_athi)
+            # 3) update config register and start the conversion
+            bh.write_register(0x01, config_uint | SSC.START.value, byte_count=2)
+            self._shadow[0x01] = config_uint
+            return config_uint
+        else:
+            raise RuntimeError("device is configured for continuous conversion")
+
+    def _wait_for_conversion(self, bh, conversion_time: float):
+        """
+        wait until the single-shot conversion is completed
+
+        Sleeps for the expected conversion time and then polls the OS bit
+        until the device reports it's no longer performing a conversion:
+        (0b0..._...._...._.... -> 0b1..._...._...._....)
+
+        raises RuntimeError if the conversion does not complete in time
+        """
+        time.sleep(conversion_time)
+        self._poll_for_conversion(bh, conversion_time)
+
+    def _poll_for_conversion(self, bh, conversion_time: float):
+        """
+        poll the OS bit until the single-shot conversion is completed
+
+        raises RuntimeError if the conversion does not complete in time
+        """
+        poll_interval = conversion_time / POLL_BUDGET
+        deadline = time.monotonic() + conversion_time * POLL_TIMEOUT
+        for _ in range(POLL_BUDGET):
+            if bh.read_register(0x01, byte_count=2) & SSC.START.value:
+                return
+            if self._statistics is not None:
+                self._statistics.record_retry()
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(poll_interval)
+        raise RuntimeError('conversion did not complete in time')
+
+
+@frozen
+class PreparedMeasurement:
+    """
+    single-shot measurement with all values precomputed
+
+    (use 'Ads1x1x.prepare()' to create)
+    """
+    # fmt: off
+    device:          Ads1x1x
+    config_uint:     int    # config register (without the OS bit)
+    atlo:            int    # lo_thresh register
+    athi:            int    # hi_thresh register
+    start_uint:      int    # config register (with the OS bit)
+    shift:           int    # number of unused lower bits (12-bit: 4)
+    conversion_time: float  # seconds
+    microvolt_table: array = field(repr=False)  # step -> microvolts
+    # fmt: on
+
+    def measure(self, unit: UNIT = UNIT.MICRO) -> int:
+        device = self.device
+        with device._get_burst_handler() as bh:
+            device._update_thresholds(bh, self.atlo, self.athi)
+            bh.write_register(0x01, self.start_uint, byte_count=2)
+            device._shadow[0x01] = self.config_uint
+            device._wait_for_conversion(bh, self.conversion_time)
+            step = bh.read_register(0x00, byte_count=2)
+        if unit == UNIT.MICRO:
+            return self.microvolt_table[step >> self.shift]
+        else:
+            return step
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+asyncio interface for the ADS1xxx family
+
+The conversion time is awaited with 'asyncio.sleep()' instead of
+blocking. Only the short bus transactions are offloaded to a dedicated
+executor (one worker thread per I²C bus), which serializes the access
+to each bus. The bus is not locked while waiting for a conversion, so
+other devices on the same bus can be used in the meantime.
+
+usage:
+```
+ads1115 = AsyncAds1x1x(device=Ads1115(i2c_bus=i2c_bus))
+value = await ads1115.get_ssc_measurement(config=config)
+```
+
+The devices may be used by multiple event loops (e.g. consecutive
+'asyncio.run()' calls or one loop per thread).
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from feeph.ads1xxx.ads1x1x import POLL_BUDGET, POLL_TIMEOUT, Ads1x1x, Ads1x1xConfig
+from feeph.ads1xxx.conversions import UNIT
+from feeph.ads1xxx.settings import SSC
+
+if TYPE_CHECKING:
+    # module busio provides no type hints
+    import busio  # type: ignore
+
+    from feeph.ads1xxx.linux_i2c import LinuxI2C
+
+LH = logging.getLogger('feeph.ads1xxx')
+
+
+class _LoopLocks:
+    """
+    one 'asyncio.Lock' per event loop
+
+    An 'asyncio.Lock' is bound to the event loop it's first used in and
+    can't be shared by multiple loops (e.g. consecutive 'asyncio.run()'
+    calls).
+    """
+
+    def __init__(self) -> None:
+        self._locks: dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+        self._mutex = threading.Lock()
+
+    def get(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            with self._mutex:
+                # forget the locks of closed event loops
+                self._locks = {other: lock for other, lock in self._locks.items() if not other.is_closed()}
+                lock = self._locks.setdefault(loop, asyncio.Lock())
+        return lock
+
+
+class _BusResources:
+    """
+    worker thread and locks of a single I²C bus
+
+    The worker thread serializes the bus transactions of all event loops.
+    The locks keep the transactions of a single loop in order.
+    """
+
+    def __init__(self, i2c_bus: 'busio.I2C | LinuxI2C'):
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='feeph.ads1xxx')
+        self.locks = _LoopLocks()
+        # stop the worker thread once the bus is gone
+        weakref.finalize(i2c_bus, self.executor.shutdown, wait=False)
+
+
+# one worker thread per I²C bus
+_BUS_RESOURCES: 'weakref.WeakKeyDictionary[busio.I2C | LinuxI2C, _BusResources]' = weakref.WeakKeyDictionary()
+_BUS_RESOURCES_LOCK = threading.Lock()
+
+
+def _get_bus_resources(i2c_bus: 'busio.I2C | LinuxI2C') -> _BusResources:
+    with _BUS_RESOURCES_LOCK:
+        resources = _BUS_RESOURCES.get(i2c_bus)
+        if resources is None:
+            resources = _BusResources(i2c_bus)
+            _BUS_RESOURCES[i2c_bus] = resources
+        return resources
+
+
+class AsyncAds1x1x:
+    """
+    asyncio wrapper for an ADS1xxx device
+    """
+
+    def __init__(self, device: Ads1x1x):
+        self._device = device
+        resources = _get_bus_resources(device._i2c_bus)
+        self._bus_locks = resources.locks
+        self._executor = resources.executor
+        # a measurement consists of multiple bus transactions
+        self._device_locks = _LoopLocks()
+
+    async def reset_device_registers(self):
+        async with self._device_locks.get():
+            await self._run(self._device.reset_device_registers)
+
+    async def configure(self, config: Ads1x1xConfig) -> bool:
+        async with self._device_locks.get():
+            return await self._run(self._device.configure, config)
+
+    async def get_ssc_measurement(self, config: Ads1x1xConfig | None = None, unit: UNIT = UNIT.MICRO) -> int:
+        device = self._device
+        async with self._device_locks.get():
+            config_uint = await self._run(self._start_conversion, config)
+            conversion_time = device.capabilities.get_conversion_time(config_uint)
+            await asyncio.sleep(conversion_time)
+            # poll the OS bit without blocking the event loop
+            poll_interval = conversion_time / POLL_BUDGET
+            deadline = time.monotonic() + conversion_time * POLL_TIMEOUT
+            for _ in range(POLL_BUDGET):
+                step = await self._run(self._read_conversion)
+                if step is not None:
+                    return device._convert_step(step, config_uint, unit)
+                if time.monotonic() >= deadline:
+                    break
+                await asyncio.sleep(poll_interval)
+            raise RuntimeError('conversion did not complete in time')
+
+    async def get_ccm_measurement(self, unit: UNIT = UNIT.MICRO) -> int:
+        async with self._device_locks.get():
+            return await self._run(self._device.get_ccm_measurement, unit)
+
+    async def _run(self, func, *args):
+        async with self._bus_locks.get():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+
+    # the following methods are executed by the worker thread
+
+    def _start_conversion(self, config: Ads1x1xConfig | None) -> int:
+        with self._device._get_burst_handler() as bh:
+            return self._device._start_conversion(bh, config)
+
+    def _read_conversion(self) -> int | None:
+        """
+        read the conversion register if the conversion is completed
+        """
+        with self._device._get_burst_handler() as bh:
+            if bh.read_register(0x01, byte_count=2) & SSC.START.value:
+                return bh.read_register(0x00, byte_count=2)
+            else:
+                if self._device._statistics is not None:
+                    self._device._statistics.record_retry()
+                return None
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+ALERT/RDY pin - wait for conversions using GPIO edge events
+
+The ALERT/RDY pin of the ADS1014, ADS1015, ADS1114 and ADS1115 can be
+configured as a conversion-ready signal. Instead of polling the device
+over I²C we can wait for the pin to assert and read the conversion
+register afterwards.
+
+The pin is an open-drain output and needs a pull-up resistor. If there
+is no external pull-up the internal pull-up of the GPIO line is used.
+
+This module is not imported by 'feeph.ads1xxx' to avoid loading gpiod
+unless it's actually needed:
+```
+from feeph.ads1xxx.alert import AlertReadyPin
+```
+"""
+
+import logging
+
+import gpiod
+from gpiod.line import Bias, Edge
+
+from feeph.ads1xxx.settings import CPOL
+
+LH = logging.getLogger('feeph.ads1xxx')
+
+
+class AlertReadyPin:
+    """
+    GPIO line connected to the ALERT/RDY pin of the device
+
+    The edge to wait for depends on the configured comparator polarity:
+    CPOL.ALO -> falling edge
+    CPOL.AHI -> rising edge
+    """
+
+    def __init__(self, chip_path: str, line_offset: int, cpol: CPOL = CPOL.ALO, consumer: str = 'feeph.ads1xxx'):
+        if cpol == CPOL.ALO:
+            edge_detection = Edge.FALLING
+        else:
+            edge_detection = Edge.RISING
+        settings = gpiod.LineSettings(edge_detection=edge_detection, bias=Bias.PULL_UP)
+        self._request = gpiod.request_lines(chip_path, consumer=consumer, config={line_offset: settings})
+
+    def __enter__(self) -> 'AlertReadyPin':
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+    def clear(self):
+        """
+        discard all pending edge events
+        """
+        while self._request.wait_edge_events(timeout=0):
+            self._request.read_edge_events()
+
+    def wait(self, timeout: float) -> bool:
+        """
+        wait until the pin asserts (timeout in seconds)
+
+        returns False if the pin did not assert in time
+        """
+        if self._request.wait_edge_events(timeout=timeout):
+            # consume the event(s) so the next call waits for a new one
+            self._request.read_edge_events()
+            return True
+        else:
+            return False
+
+    def close(self):
+        """
+        release the GPIO line
+        """
+        self._request.release()
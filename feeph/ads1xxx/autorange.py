@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+select the programmable gain amplifier automatically (ADS1x14, ADS1x15)
+
+Each measurement uses the last good gain of its channel (input
+multiplexer). The gain is adjusted after the measurement:
+ - the result is close to the full-scale range -> lower the gain
+ - the result would fit a higher gain           -> raise the gain
+The thresholds leave a gap (hysteresis) so a steady signal does not
+flip between two gains. Only a clipped result (the signal exceeds the
+full-scale range) is measured again with a lower gain. A steady signal
+therefore costs a single conversion per measurement.
+
+usage:
+```
+auto_range = AutoRange(device=ads1115)
+config = Ads1115Config(mux=MUX.MODE4, drs=DRS.MODE7)
+result = auto_range.measure(config=config)
+print(result.value, result.pga)
+```
+
+(Use 'min_gain=PGA.MODE1' if the supply voltage is below 5.9V. The
+inputs must not exceed the supply voltage.)
+"""
+
+import logging
+
+from attrs import frozen
+
+from feeph.ads1xxx.ads1x1x import Ads1x1x, Ads1x1xConfig
+from feeph.ads1xxx.conversions import PGA_FACTOR, UNIT, convert_sint16_to_number, convert_step_to_microvolts
+from feeph.ads1xxx.settings import DOM, MUX, PGA, SETTING_MASKS, SSC
+
+LH = logging.getLogger('feeph.ads1xxx')
+
+# gains with distinct full-scale ranges (lowest gain first)
+# (PGA.MODE6 and PGA.MODE7 are the same as PGA.MODE5)
+GAINS = (PGA.MODE0, PGA.MODE1, PGA.MODE2, PGA.MODE3, PGA.MODE4, PGA.MODE5)
+
+# lower the gain if the result exceeds this fraction of the full-scale range
+STEP_DOWN_FRACTION = 0.9
+# raise the gain if the result stays below this fraction of the higher
+# gain's full-scale range (must be lower than STEP_DOWN_FRACTION)
+STEP_UP_FRACTION = 0.75
+
+FULL_SCALE = 32768
+
+
+@frozen
+class AutoRangeMeasurement:
+    """
+    result of 'AutoRange.measure()'
+    """
+    # fmt: off
+    value:       int   # microvolts or step (depends on the gain)
+    pga:         PGA   # gain used for this measurement
+    conversions: int   # number of conversions (>1 if the signal clipped)
+    clipped:     bool  # signal exceeds the full-scale range of the lowest gain
+    # fmt: on
+
+
+class AutoRange:
+    """
+    single-shot measurements with automatic gain selection
+
+    The gain of each channel is remembered between measurements. A new
+    channel starts with the gain of the provided config.
+
+    (Measurements of the same channel with different configurations
+    share the same gain.)
+    """
+
+    def __init__(self, device: Ads1x1x, min_gain: PGA = PGA.MODE0, max_gain: PGA = PGA.MODE5):
+        if not device.capabilities.has_pga:
+            raise ValueError("device has no programmable gain amplifier")
+        if min_gain not in GAINS or max_gain not in GAINS or GAINS.index(min_gain) > GAINS.index(max_gain):
+            raise ValueError(f"invalid gain range ({min_gain.name} - {max_gain.name})")
+        self._device = device
+        self._pgas = GAINS[GAINS.index(min_gain):GAINS.index(max_gain) + 1]
+        # a clipped 12-bit result is 0x7FF0 (the lower 4 bits are zero)
+        self._clip_limit = FULL_SCALE - (1 << (16 - device.capabilities.resolution))
+        self._step_down_limit = int(FULL_SCALE * STEP_DOWN_FRACTION)
+        # gain index -> [(higher gain index, max. absolute number), ...]
+        self._step_up_limits: list[list[tuple[int, int]]] = []
+        for index, pga in enumerate(self._pgas):
+            limits = []
+            for higher_index in range(index + 1, len(self._pgas)):
+                ratio = PGA_FACTOR[self._pgas[higher_index]] / PGA_FACTOR[pga]
+                limits.append((higher_index, int(FULL_SCALE * STEP_UP_FRACTION * ratio)))
+            self._step_up_limits.append(limits)
+        # input multiplexer bits -> gain index
+        self._gains: dict[int, int] = {}
+
+    def get_gain(self, mux: MUX = MUX.MODE0) -> PGA | None:
+        """
+        gain for the next measurement of this channel (None if unknown)
+        """
+        index = self._gains.get(mux.value)
+        return self._pgas[index] if index is not None else None
+
+    def reset(self):
+        """
+        forget the gains of all channels
+        """
+        self._gains.clear()
+
+    def measure(self, config: Ads1x1xConfig, unit: UNIT = UNIT.MICRO) -> AutoRangeMeasurement:
+        """
+        perform a single-shot measurement with the channel's gain
+
+        The gain of the provided config is replaced. The thresholds are not
+        written (they depend on the gain).
+
+        raises RuntimeError if the config uses continuous conversion mode
+        """
+        config_uint = config.as_uint16() & ~(SSC.START.value | SETTING_MASKS[PGA])
+        if not config_uint & DOM.SSM.value:
+            raise RuntimeError("config must use single-shot mode")
+        channel = config_uint & SETTING_MASKS[MUX]
+        index = self._gains.get(channel)
+        if index is None:
+            index = self._get_initial_index(config.as_uint16())
+        device = self._device
+        conversion_time = device.capabilities.get_conversion_time(config_uint)
+        conversions = 0
+        with device._get_burst_handler() as bh:
+            while True:
+                pga_uint = config_uint | self._pgas[index].value
+                bh.write_register(0x01, pga_uint | SSC.START.value, byte_count=2)
+                device._shadow[0x01] = pga_uint
+                device._wait_for_conversion(bh, conversion_time)
+                step = bh.read_register(0x00, byte_count=2)
+                conversions += 1
+                number = convert_sint16_to_number(step)
+                clipped = number >= self._clip_limit or number == -FULL_SCALE
+                if clipped and index > 0:
+                    # the result is unusable - measure again with a lower gain
+                    index -= 1
+                    continue
+                break
+        pga = self._pgas[index]
+        if clipped:
+            LH.warning("Signal exceeds the full-scale range of %s.", pga.name)
+        self._gains[channel] = self._get_next_index(index, abs(number))
+        if unit == UNIT.MICRO:
+            value = convert_step_to_microvolts(step, pga, resolution=device.capabilities.resolution)
+        else:
+            value = step
+        return AutoRangeMeasurement(value=value, pga=pga, conversions=conversions, clipped=clipped)
+
+    def _get_initial_index(self, config_uint: int) -> int:
+        pga_uint = config_uint & SETTING_MASKS[PGA]
+        for index, pga in enumerate(self._pgas):
+            if pga.value >= pga_uint:
+                return index
+        return len(self._pgas) - 1
+
+    def _get_next_index(self, index: int, magnitude: int) -> int:
+        if magnitude >= self._step_down_limit:
+            return max(index - 1, 0)
+        next_index = index
+        for higher_index, limit in self._step_up_limits[index]:
+            if magnitude > limit:
+                break
+            next_index = higher_index
+        return next_index
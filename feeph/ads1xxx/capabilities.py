@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+machine-readable capabilities of each device
+
+Each device class provides its descriptor as 'capabilities':
+```
+Ads1115.capabilities.drs_sps[DRS.MODE7]          # -> 860
+Ads1115.capabilities.conversion_time[DRS.MODE7]  # -> 0.001304
+Ads1013.capabilities.has_mux                     # -> False
+```
+
+The lookup tables are computed once and allow O(1) lookups by setting
+or by the raw config register value.
+"""
+
+from attrs import field, frozen
+
+from feeph.ads1xxx.settings import DRS
+
+# samples per second for each data rate setting
+DRS_SPS_ADS101X = {
+    DRS.MODE0: 128,
+    DRS.MODE1: 250,
+    DRS.MODE2: 490,
+    DRS.MODE3: 920,
+    DRS.MODE4: 1600,
+    DRS.MODE5: 2400,
+    DRS.MODE6: 3300,
+    DRS.MODE7: 3300,
+}
+DRS_SPS_ADS111X = {
+    DRS.MODE0: 8,
+    DRS.MODE1: 16,
+    DRS.MODE2: 32,
+    DRS.MODE3: 64,
+    DRS.MODE4: 128,
+    DRS.MODE5: 250,
+    DRS.MODE6: 475,
+    DRS.MODE7: 860,
+}
+
+# the internal oscillator has a tolerance of ±10% and the device needs
+# about 25µs to wake up from power-down before it starts a conversion
+CONVERSION_MARGIN = 1.1
+CONVERSION_WAKEUP = 0.000_025  # seconds
+
+DRS_MASK = 0b0000_0000_1110_0000
+
+
+@frozen
+class Capabilities:
+    """
+    capabilities of a single device model
+    """
+    # fmt: off
+    name:           str
+    resolution:     int             # bits (ADS101x: 12-bit, left-aligned)
+    drs_sps:        dict[DRS, int]  # samples per second for each data rate setting
+    has_mux:        bool            # input multiplexer (4 inputs)
+    has_pga:        bool            # programmable gain amplifier
+    has_comparator: bool            # comparator and ALERT/RDY pin
+    # fmt: on
+    # derived lookup tables
+    conversion_time: dict[DRS, float] = field(init=False)  # seconds
+    _sps_by_bits:    dict[int, int] = field(init=False, repr=False)
+    _time_by_bits:   dict[int, float] = field(init=False, repr=False)
+
+    @conversion_time.default
+    def _build_conversion_time(self) -> dict[DRS, float]:
+        return {drs: CONVERSION_MARGIN / sps + CONVERSION_WAKEUP for drs, sps in self.drs_sps.items()}
+
+    @_sps_by_bits.default
+    def _build_sps_by_bits(self) -> dict[int, int]:
+        return {drs.value: sps for drs, sps in self.drs_sps.items()}
+
+    @_time_by_bits.default
+    def _build_time_by_bits(self) -> dict[int, float]:
+        return {drs.value: conversion_time for drs, conversion_time in self.conversion_time.items()}
+
+    def get_data_rate(self, config_uint: int) -> int:
+        """
+        configured data rate of the config register (in samples per second)
+        """
+        return self._sps_by_bits[config_uint & DRS_MASK]
+
+    def get_conversion_time(self, config_uint: int) -> float:
+        """
+        expected duration of a single conversion (in seconds)
+        """
+        return self._time_by_bits[config_uint & DRS_MASK]
+
+
+ADS1013 = Capabilities(
+    name='ADS1013',
+    resolution=12,
+    drs_sps=DRS_SPS_ADS101X,
+    has_mux=False,
+    has_pga=False,
+    has_comparator=False,
+)
+
+ADS1014 = Capabilities(
+    name='ADS1014',
+    resolution=12,
+    drs_sps=DRS_SPS_ADS101X,
+    has_mux=False,
+    has_pga=True,
+    has_comparator=True,
+)
+
+ADS1015 = Capabilities(
+    name='ADS1015',
+    resolution=12,
+    drs_sps=DRS_SPS_ADS101X,
+    has_mux=True,
+    has_pga=True,
+    has_comparator=True,
+)
+
+ADS1113 = Capabilities(
+    name='ADS1113',
+    resolution=16,
+    drs_sps=DRS_SPS_ADS111X,
+    has_mux=False,
+    has_pga=False,
+    has_comparator=False,
+)
+
+ADS1114 = Capabilities(
+    name='ADS1114',
+    resolution=16,
+    drs_sps=DRS_SPS_ADS111X,
+    has_mux=False,
+    has_pga=True,
+    has_comparator=True,
+)
+
+ADS1115 = Capabilities(
+    name='ADS1115',
+    resolution=16,
+    drs_sps=DRS_SPS_ADS111X,
+    has_mux=True,
+    has_pga=True,
+    has_comparator=True,
+)
@@ -1,9 +1,16 @@
 #!/usr/bin/env python3
 
+import functools
+from array import array
 from enum import Enum
+from typing import TYPE_CHECKING, Any
 
 from feeph.ads1xxx.settings import PGA
 
+if TYPE_CHECKING:
+    # module numpy is only needed for the vectorized conversions
+    import numpy
+
 
 class UNIT(Enum):
     STEPS = 0
@@ -21,6 +28,12 @@ PGA_FACTOR = {
     PGA.MODE7: 256,  # same as MODE5
 }
 
+# supported resolutions (in bits)
+# ADS111x: 16-bit result
+# ADS101x: 12-bit result, left-aligned in a 16-bit register (the lower
+#          4 bits are always zero)
+RESOLUTIONS = (12, 16)
+
 
 def convert_number_to_sint16(value: int) -> int:
     """
@@ -46,47 +59,125 @@ def convert_sint16_to_number(value: int) -> int:
         raise ValueError('')
 
 
-def convert_step_to_microvolts(step: int, pga: PGA) -> int:
+def convert_step_to_microvolts(step: int, pga: PGA, resolution: int = 16) -> int:
     """
     convert the step value to microvolts
     ```
-    PGA.MODE2:
-     -32768 -> -2048000µV
-     +32767 -> +2048000µV
+    16-bit, PGA.MODE2:
+     0x8000 -> -2048000µV
+     0x7FFF -> +2048000µV
+    12-bit, PGA.MODE2:
+     0x8000 -> -2048000µV
+     0x7FF0 -> +2047000µV
+    ```
+
+    raises ValueError if the step or the resolution is out of range
+    """
+    if not 0x0000 <= step <= 0xFFFF:
+        raise ValueError(f"step '{step}' is out of range")
+    # a single lookup in the precomputed table
+    return get_microvolt_table(pga, resolution=resolution)[step >> (16 - resolution)]
+
+
+def get_microvolts_per_step(pga: PGA, resolution: int = 16) -> float:
+    """
+    size of a single step in microvolts
+    ```
+    16-bit, PGA.MODE2: 62.5µV
+    12-bit, PGA.MODE2: 1000µV
     ```
+
+    raises ValueError if the resolution is not supported
+    """
+    _verify_resolution(resolution)
+    if resolution == 12:
+        return PGA_FACTOR[pga] * 1000 // 2048
+    else:
+        return PGA_FACTOR[pga] * 1000 / 32767
+
+
+def get_microvolt_table(pga: PGA, resolution: int = 16) -> array:
     """
-    # it doesn't make much sense to return a floating point value
-    #  1 step at the highest precision level (PGA.MODE5) is 7.8µV
-    number = convert_sint16_to_number(step)
-    return round(number * (PGA_FACTOR[pga] * 1000 / 32767))
+    lookup table to convert steps to microvolts
+
+    The table contains the microvolts of all possible steps (rounded to
+    the nearest microvolt) and is used by all step conversions. It's built
+    on first use and cached afterwards.
+    (PGA.MODE5, PGA.MODE6 and PGA.MODE7 share the same table.)
 
+    16-bit: 65536 entries, use 'table[step]'
+    12-bit: 4096 entries, use 'table[step >> 4]'
 
-def convert_microvolts_to_step(value: int, pga: PGA) -> int:
+    raises ValueError if the resolution is not supported
+    """
+    _verify_resolution(resolution)
+    if resolution == 12:
+        return _build_microvolt_table12(PGA_FACTOR[pga])
+    else:
+        return _build_microvolt_table(PGA_FACTOR[pga])
+
+
+@functools.cache
+def _build_microvolt_table(pga_factor: int) -> array:
+    scale = pga_factor * 1000 / 32767
+    # 0x0000 ≤ step ≤ 0x7FFF -> 0 ≤ number ≤ 32767
+    # 0x8000 ≤ step ≤ 0xFFFF -> -32768 ≤ number ≤ -1
+    numbers = list(range(0, 32768)) + list(range(-32768, 0))
+    return array('i', [round(number * scale) for number in numbers])
+
+
+@functools.cache
+def _build_microvolt_table12(pga_factor: int) -> array:
+    scale = pga_factor * 1000 // 2048
+    # 0x000 ≤ step >> 4 ≤ 0x7FF -> 0 ≤ number ≤ 2047
+    # 0x800 ≤ step >> 4 ≤ 0xFFF -> -2048 ≤ number ≤ -1
+    numbers = list(range(0, 2048)) + list(range(-2048, 0))
+    return array('i', [number * scale for number in numbers])
+
+
+def _verify_resolution(resolution: int):
+    if resolution not in RESOLUTIONS:
+        raise ValueError(f"unsupported resolution ({resolution} bits)")
+
+
+def convert_microvolts_to_step(value: int, pga: PGA, resolution: int = 16) -> int:
     """
     convert the microvolt value to steps
     ```
-    PGA.MODE2:
-     -2048000µV -> -32768
-     +2048000µV -> +32767
+    16-bit, PGA.MODE2:
+     -2048000µV -> 0x8000
+     +2048000µV -> 0x7FFF
+    12-bit, PGA.MODE2:
+     -2048000µV -> 0x8000
+     +2047000µV -> 0x7FF0
     ```
+
+    raises ValueError if the value or the resolution is out of range
     """
+    _verify_resolution(resolution)
+    if resolution == 12:
+        # left-aligned, the lower 4 bits are zero
+        number = round(value / (PGA_FACTOR[pga] * 1000 // 2048))
+        if not -2048 <= number <= 2047:
+            raise ValueError("out of range")
+        return convert_number_to_sint16(number << 4)
     number = round(value / (PGA_FACTOR[pga] / 2048) * 32767 / 2048000)
     return convert_number_to_sint16(number)
 
 
-def convert_step_to_value(step: int, unit: UNIT, pga: PGA) -> int:
+def convert_step_to_value(step: int, unit: UNIT, pga: PGA, resolution: int = 16) -> int:
     if 0x0000 <= step <= 0xFFFF:
         if unit == UNIT.STEPS:
             return step
         elif unit == UNIT.MICRO:
-            return convert_step_to_microvolts(step=step, pga=pga)
+            return convert_step_to_microvolts(step=step, pga=pga, resolution=resolution)
         else:
             raise ValueError(f"invalid unit '{unit}'")
     else:
         raise ValueError(f"step '{step}' is out of range")
 
 
-def convert_value_to_step(value: int, unit: UNIT, pga: PGA) -> int:
+def convert_value_to_step(value: int, unit: UNIT, pga: PGA, resolution: int = 16) -> int:
     """
     convert the provided value to microvolts
 
@@ -95,10 +186,138 @@ def convert_value_to_step(value: int, unit: UNIT, pga: PGA) -> int:
     if unit == UNIT.STEPS:
         step = value
     elif unit == UNIT.MICRO:
-        step = convert_microvolts_to_step(value=value, pga=pga)
+        step = convert_microvolts_to_step(value=value, pga=pga, resolution=resolution)
     else:
         raise ValueError("usage error - invalid value '{unit}'")
     if step is not None and 0x0000 <= step <= 0xFFFF:
         return step
     else:
         raise ValueError("invalid value or out of range")
+
+
+# -------------------------------------------------------------------------
+# packed 12-bit samples (ADS101x)
+# -------------------------------------------------------------------------
+
+
+def pack_steps12(steps: Any) -> bytes:
+    """
+    pack 12-bit steps into 3 bytes per 2 steps
+
+    The lower 4 bits of a 12-bit step are always zero and are dropped.
+    Accepts an iterable of steps (e.g. an 'array('h')' filled by
+    'Ads1x1x.capture()') or a byte buffer of big-endian words. An odd
+    number of steps is padded with a zero step.
+    """
+    if _is_byte_buffer(steps):
+        data = memoryview(steps).cast('B')
+        codes = [((data[i] << 8) | data[i + 1]) >> 4 for i in range(0, len(data) - 1, 2)]
+    else:
+        # signed numbers (array('h')) are converted to steps
+        codes = [(step & 0xFFFF) >> 4 for step in steps]
+    if len(codes) % 2:
+        codes.append(0)
+    packed = bytearray(len(codes) // 2 * 3)
+    for i in range(0, len(codes), 2):
+        code1 = codes[i]
+        code2 = codes[i + 1]
+        offset = i // 2 * 3
+        packed[offset] = code1 >> 4
+        packed[offset + 1] = ((code1 & 0x0F) << 4) | (code2 >> 8)
+        packed[offset + 2] = code2 & 0xFF
+    return bytes(packed)
+
+
+def unpack_steps12(data: bytes, count: int | None = None) -> array:
+    """
+    unpack steps packed with pack_steps12()
+
+    Returns an array('H') of left-aligned steps. Provide 'count' to drop
+    the padding of an odd number of steps.
+    """
+    if len(data) % 3:
+        raise ValueError("packed data must be a multiple of 3 bytes")
+    steps = array('H', bytes(len(data) // 3 * 4))
+    for i in range(0, len(data), 3):
+        j = i // 3 * 2
+        steps[j] = ((data[i] << 4) | (data[i + 1] >> 4)) << 4
+        steps[j + 1] = (((data[i + 1] & 0x0F) << 8) | data[i + 2]) << 4
+    if count is not None:
+        if count > len(steps):
+            raise ValueError(f"packed data contains less than {count} steps")
+        del steps[count:]
+    return steps
+
+
+# -------------------------------------------------------------------------
+# vectorized conversions (require numpy)
+# -------------------------------------------------------------------------
+
+
+def convert_steps_to_microvolts(steps: Any, pga: PGA, resolution: int = 16) -> 'numpy.ndarray':
+    """
+    vectorized variant of convert_step_to_microvolts()
+
+    Accepts a numpy array or array('H') of steps (0x0000 ≤ x ≤ 0xFFFF),
+    an array('h') or int16 numpy array of already signed numbers (host
+    byte order) or a byte buffer ('bytes', 'bytearray' or a memoryview
+    with 1-byte items) of big-endian words. Both match what
+    'Ads1x1x.capture()' stores in the respective buffer. Returns an int32
+    numpy array with the same rounding as the scalar conversion.
+
+    raises ValueError if a step or the resolution is out of range
+    """
+    np = _import_numpy()
+    # a single lookup in the precomputed table
+    table = _get_numpy_table(PGA_FACTOR[pga], resolution)
+    steps = _as_sint16_array(np, steps).astype(np.uint16)
+    if resolution == 12:
+        return table[steps >> 4]
+    return table[steps]
+
+
+def convert_steps_to_volts(steps: Any, pga: PGA, resolution: int = 16) -> 'numpy.ndarray':
+    """
+    vectorized conversion of steps to volts
+
+    Same input as convert_steps_to_microvolts(). Returns a float64 numpy
+    array.
+    """
+    return convert_steps_to_microvolts(steps, pga, resolution=resolution) / 1_000_000
+
+
+def _is_byte_buffer(steps: Any) -> bool:
+    # byte buffers hold the raw conversion register content (big-endian),
+    # buffers with 2-byte items hold numbers (host byte order)
+    return isinstance(steps, (bytes, bytearray)) or (isinstance(steps, memoryview) and steps.itemsize == 1)
+
+
+def _as_sint16_array(np: Any, steps: Any) -> 'numpy.ndarray':
+    if _is_byte_buffer(steps):
+        return np.frombuffer(steps, dtype='>i2')
+    values = np.asarray(steps)
+    if values.dtype == np.int16:
+        # already signed
+        return values
+    if values.dtype.kind not in 'iu':
+        raise ValueError(f"invalid data type '{values.dtype}'")
+    if values.size > 0 and (values.min() < 0x0000 or values.max() > 0xFFFF):
+        raise ValueError("step is out of range")
+    return values.astype(np.uint16).view(np.int16)
+
+
+@functools.cache
+def _get_numpy_table(pga_factor: int, resolution: int) -> 'numpy.ndarray':
+    _verify_resolution(resolution)
+    np = _import_numpy()
+    if resolution == 12:
+        return np.array(_build_microvolt_table12(pga_factor), dtype=np.int32)
+    return np.array(_build_microvolt_table(pga_factor), dtype=np.int32)
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("vectorized conversions require numpy (pip install feeph.ads1xxx[numpy])") from e
+    return numpy
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+measure multiple devices on the same I²C bus in parallel
+
+Up to four devices can share an I²C bus (one per bus address). The
+single-shot conversions are started on all devices back-to-back, after
+which we wait once and read all results. The conversions run in
+parallel and a snapshot of all devices takes about one conversion time
+instead of one per device.
+
+usage:
+```
+group = DeviceGroup(devices=[
+    Ads1115(i2c_bus=i2c_bus, i2c_adr=0x48),
+    Ads1115(i2c_bus=i2c_bus, i2c_adr=0x49),
+])
+values = group.get_ssc_measurements(configs=[config1, config2])
+```
+"""
+
+import logging
+import time
+
+from feeph.ads1xxx.ads1x1x import I2C_ADDRESSES, Ads1x1x, Ads1x1xConfig
+from feeph.ads1xxx.conversions import UNIT
+
+LH = logging.getLogger('feeph.ads1xxx')
+
+
+class DeviceGroup:
+    """
+    a group of devices on the same I²C bus
+
+    raises ValueError if the devices use different buses or share an
+    I²C bus address
+    """
+
+    def __init__(self, devices: list[Ads1x1x]):
+        if not devices:
+            raise ValueError("at least one device is required")
+        if len(devices) > len(I2C_ADDRESSES):
+            raise ValueError(f"a bus can't have more than {len(I2C_ADDRESSES)} devices")
+        if any(device._i2c_bus is not devices[0]._i2c_bus for device in devices):
+            raise ValueError("devices must share the same I²C bus")
+        addresses = [device._i2c_adr for device in devices]
+        if len(set(addresses)) != len(addresses):
+            raise ValueError("devices must use different I²C bus addresses")
+        self._devices = devices
+
+    def get_ssc_measurements(self, configs: list[Ads1x1xConfig | None] | None = None, unit: UNIT = UNIT.MICRO) -> list[int]:
+        """
+        perform a single-shot measurement on all devices at once
+
+        Provide one configuration per device (or None to use the device's
+        previous configuration).
+        """
+        devices = self._devices
+        if configs is None:
+            configs = [None] * len(devices)
+        elif len(configs) != len(devices):
+            raise ValueError("number of configs does not match the number of devices")
+        # 1) start the conversions back-to-back
+        config_uints = []
+        for device, config in zip(devices, configs):
+            with device._get_burst_handler() as bh:
+                config_uints.append(device._start_conversion(bh, config))
+        conversion_times = [device.capabilities.get_conversion_time(config_uint)
+                            for device, config_uint in zip(devices, config_uints)]
+        # 2) wait once for the slowest conversion
+        time.sleep(max(conversion_times))
+        # 3) read the results
+        values = []
+        for device, config_uint, conversion_time in zip(devices, config_uints, conversion_times):
+            with device._get_burst_handler() as bh:
+                device._poll_for_conversion(bh, conversion_time)
+                step = bh.read_register(0x00, byte_count=2)
+            values.append(device._convert_step(step, config_uint, unit))
+        return values
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+opt-in instrumentation of the I²C bus transactions
+
+Statistics are disabled by default. Once enabled, every bus transaction
+of the device is counted per register and its latency is recorded. The
+statistics can be queried at any time:
+```
+ads1115.enable_statistics()
+...
+report = ads1115.get_statistics()
+print(report.reads, report.latency.percentile(0.99), report.achieved_sample_rate)
+```
+
+When statistics are disabled the only overhead is a single 'is None'
+check per burst.
+"""
+
+import bisect
+import logging
+import time
+from types import MappingProxyType
+from typing import Mapping
+
+from attrs import frozen
+
+LH = logging.getLogger('feeph.ads1xxx')
+
+# upper bounds of the latency buckets (in nanoseconds)
+# 16µs, 32µs, 64µs, ... 16.384ms (plus one bucket for everything above)
+LATENCY_BUCKETS = tuple(2 ** exponent * 1000 for exponent in range(4, 15))
+
+
+class LatencyHistogram:
+    """
+    latency histogram with logarithmic buckets
+    """
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns: int | None = None
+        self.max_ns: int | None = None
+
+    def record(self, duration_ns: int):
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, duration_ns)] += 1
+        self.count += 1
+        self.total_ns += duration_ns
+        if self.min_ns is None or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if self.max_ns is None or duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+
+    def copy(self) -> 'LatencyHistogram':
+        histogram = LatencyHistogram()
+        histogram.counts = list(self.counts)
+        histogram.count = self.count
+        histogram.total_ns = self.total_ns
+        histogram.min_ns = self.min_ns
+        histogram.max_ns = self.max_ns
+        return histogram
+
+    @property
+    def mean_ns(self) -> float | None:
+        if self.count:
+            return self.total_ns / self.count
+        else:
+            return None
+
+    def percentile(self, quantile: float) -> int | None:
+        """
+        upper bound of the bucket containing the requested quantile (0..1)
+
+        The highest bucket has no upper bound, the maximum is used instead.
+        """
+        if not 0 <= quantile <= 1:
+            raise ValueError(f"quantile must be between 0 and 1 ({quantile})")
+        if not self.count:
+            return None
+        threshold = quantile * self.count
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= threshold and count:
+                if index < len(LATENCY_BUCKETS):
+                    return LATENCY_BUCKETS[index]
+                else:
+                    return self.max_ns
+        return self.max_ns
+
+
+class DeviceStatistics:
+    """
+    counters for a single device (updated by the device)
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.reads: dict[int, int] = {}   # register -> number of reads
+        self.writes: dict[int, int] = {}  # register -> number of writes
+        self.pointer_writes = 0           # writes of the pointer register only (no data)
+        self.latency = LatencyHistogram()
+        self.errors = 0                   # failed transactions
+        self.retries = 0                  # status polls that found the conversion still running
+        self.samples = 0                  # reads of the conversion register
+        self.first_sample_ns: int | None = None
+        self.last_sample_ns: int | None = None
+
+    def record_read(self, register: int, duration_ns: int):
+        self.reads[register] = self.reads.get(register, 0) + 1
+        self.latency.record(duration_ns)
+        if register == 0x00:
+            self.record_sample()
+
+    def record_write(self, register: int, duration_ns: int):
+        self.writes[register] = self.writes.get(register, 0) + 1
+        self.latency.record(duration_ns)
+
+    def record_pointer_write(self, duration_ns: int):
+        self.pointer_writes += 1
+        self.latency.record(duration_ns)
+
+    def record_error(self):
+        self.errors += 1
+
+    def record_retry(self):
+        self.retries += 1
+
+    def record_sample(self):
+        timestamp = time.monotonic_ns()
+        if self.first_sample_ns is None:
+            self.first_sample_ns = timestamp
+        self.last_sample_ns = timestamp
+        self.samples += 1
+
+
+@frozen
+class StatisticsReport:
+    """
+    snapshot of the statistics of a single device
+
+    (use 'Ads1x1x.get_statistics()' to create)
+    """
+    # fmt: off
+    reads:                  Mapping[int, int]  # register -> number of reads (read-only)
+    writes:                 Mapping[int, int]  # register -> number of writes (read-only)
+    pointer_writes:         int                # writes of the pointer register only (no data)
+    latency:                LatencyHistogram   # latency of all transactions
+    errors:                 int                # failed transactions
+    retries:                int                # status polls that found the conversion still running
+    samples:                int                # reads of the conversion register
+    achieved_sample_rate:   float | None       # samples per second (None if unknown)
+    configured_sample_rate: int | None         # samples per second (None if unknown)
+    # fmt: on
+
+    @property
+    def transactions(self) -> int:
+        return sum(self.reads.values()) + sum(self.writes.values()) + self.pointer_writes
+
+    @property
+    def transactions_per_sample(self) -> float | None:
+        if self.samples:
+            return self.transactions / self.samples
+        else:
+            return None
+
+
+def create_report(statistics: DeviceStatistics, configured_sample_rate: int | None) -> StatisticsReport:
+    first_sample_ns = statistics.first_sample_ns
+    last_sample_ns = statistics.last_sample_ns
+    achieved_sample_rate: float | None
+    if first_sample_ns is not None and last_sample_ns is not None and last_sample_ns > first_sample_ns:
+        achieved_sample_rate = (statistics.samples - 1) * 1_000_000_000 / (last_sample_ns - first_sample_ns)
+    else:
+        achieved_sample_rate = None
+    return StatisticsReport(
+        reads=MappingProxyType(dict(statistics.reads)),
+        writes=MappingProxyType(dict(statistics.writes)),
+        pointer_writes=statistics.pointer_writes,
+        latency=statistics.latency.copy(),
+        errors=statistics.errors,
+        retries=statistics.retries,
+        samples=statistics.samples,
+        achieved_sample_rate=achieved_sample_rate,
+        configured_sample_rate=configured_sample_rate,
+    )
+
+
+class InstrumentedBurst:
+    """
+    records all register accesses of a burst
+    """
+
+    def __init__(self, burst, statistics: DeviceStatistics):
+        self._burst = burst
+        self._statistics = statistics
+
+    def read_register(self, register: int, byte_count: int = 1) -> int:
+        time_start = time.perf_counter_ns()
+        try:
+            value = self._burst.read_register(register, byte_count=byte_count)
+        except Exception:
+            self._statistics.record_error()
+            raise
+        self._statistics.record_read(register, time.perf_counter_ns() - time_start)
+        return value
+
+    def write_register(self, register: int, value: int, byte_count: int = 1):
+        time_start = time.perf_counter_ns()
+        try:
+            self._burst.write_register(register, value, byte_count=byte_count)
+        except Exception:
+            self._statistics.record_error()
+            raise
+        self._statistics.record_write(register, time.perf_counter_ns() - time_start)
+
+
+class InstrumentedBurstHandler:
+    """
+    drop-in replacement for 'feeph.i2c.BurstHandler'
+    """
+
+    def __init__(self, burst_handler, statistics: DeviceStatistics):
+        self._burst_handler = burst_handler
+        self._statistics = statistics
+
+    def __enter__(self) -> InstrumentedBurst:
+        return InstrumentedBurst(self._burst_handler.__enter__(), self._statistics)
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        return self._burst_handler.__exit__(exc_type, exc_value, exc_tb)
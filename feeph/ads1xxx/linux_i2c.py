@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+direct access to a Linux I²C bus (/dev/i2c-N)
+
+LinuxI2C talks to the kernel's i2c-dev interface using the I2C_RDWR
+ioctl and bypasses Blinka and 'feeph.i2c'. Reading a register is a
+single ioctl with two messages (write pointer, read data) joined by a
+repeated start. The message structures are allocated once per bus.
+
+usage:
+```
+with LinuxI2C(bus=1) as i2c_bus:
+    ads1115 = Ads1115(i2c_bus=i2c_bus)
+    ads1115.get_ssc_measurement()
+```
+
+LinuxI2C implements the subset of 'busio.I2C' used by this library and
+provides its own burst handler. All devices share the same API. As with
+'busio.I2C' the caller must hold the lock ('try_lock()') while using the
+busio methods, including 'scan()'. They share the preallocated buffers.
+
+(The i2c-dev kernel module must be loaded and the user needs access to
+the device file, usually by being a member of the 'i2c' group.)
+"""
+
+import ctypes
+import fcntl
+import logging
+import os
+import threading
+
+LH = logging.getLogger('feeph.ads1xxx')
+
+# linux/i2c-dev.h
+I2C_FUNCS = 0x0705
+I2C_RDWR = 0x0707
+# linux/i2c.h
+I2C_M_RD = 0x0001
+I2C_FUNC_I2C = 0x0000_0001
+
+# valid 7-bit addresses (0x00-0x07 and 0x78-0x7F are reserved)
+SCAN_ADDRESSES = range(0x08, 0x78)
+
+
+class I2cMsg(ctypes.Structure):
+    """
+    struct i2c_msg (linux/i2c.h)
+    """
+    _fields_ = [
+        ('addr', ctypes.c_uint16),
+        ('flags', ctypes.c_uint16),
+        ('len', ctypes.c_uint16),
+        ('buf', ctypes.POINTER(ctypes.c_uint8)),
+    ]
+
+
+class I2cRdwrIoctlData(ctypes.Structure):
+    """
+    struct i2c_rdwr_ioctl_data (linux/i2c-dev.h)
+    """
+    _fields_ = [
+        ('msgs', ctypes.POINTER(I2cMsg)),
+        ('nmsgs', ctypes.c_uint32),
+    ]
+
+
+class _Buffer:
+    """
+    preallocated message buffer (the ctypes array shares the bytearray's memory)
+    """
+
+    def __init__(self, size: int):
+        self.data = bytearray(size)
+        self.array = (ctypes.c_uint8 * size).from_buffer(self.data)
+        self.pointer = ctypes.cast(self.array, ctypes.POINTER(ctypes.c_uint8))
+
+
+class LinuxI2C:
+    """
+    an I²C bus accessed through /dev/i2c-N
+
+    Provide the bus number or the path of the device file.
+
+    raises OSError if the device file can't be opened
+    raises RuntimeError if the adapter does not support plain I²C
+    """
+
+    def __init__(self, bus: int | str = 1):
+        self.path = f'/dev/i2c-{bus}' if isinstance(bus, int) else bus
+        self._fd: int | None = os.open(self.path, os.O_RDWR)
+        self._lock = threading.Lock()
+        # preallocated ioctl structures and buffers
+        self._msgs = (I2cMsg * 2)()
+        self._rdwr = I2cRdwrIoctlData(msgs=self._msgs, nmsgs=0)
+        self._buffer_out = _Buffer(3)
+        # reads are copied into the caller's buffer (sizes must match)
+        self._buffers_in = {size: _Buffer(size) for size in (1, 2)}
+        try:
+            funcs = ctypes.c_ulong()
+            fcntl.ioctl(self._fd, I2C_FUNCS, funcs)
+            if not funcs.value & I2C_FUNC_I2C:
+                raise RuntimeError(f"adapter '{self.path}' does not support plain I²C transfers")
+        except Exception:
+            self.deinit()
+            raise
+
+    # ---------------------------------------------------------------------
+    # busio.I2C
+    # ---------------------------------------------------------------------
+
+    def try_lock(self) -> bool:
+        return self._lock.acquire(blocking=False)
+
+    def unlock(self):
+        self._lock.release()
+
+    def deinit(self):
+        """
+        close the device file
+        """
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> 'LinuxI2C':
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.deinit()
+
+    def scan(self) -> list[int]:
+        """
+        addresses of all devices which acknowledge a 1-byte read
+
+        (The caller must hold the lock.)
+        """
+        buffer = bytearray(1)
+        addresses = []
+        for address in SCAN_ADDRESSES:
+            try:
+                self.readfrom_into(address, buffer)
+                addresses.append(address)
+            except OSError:
+                pass
+        return addresses
+
+    def writeto(self, address: int, buffer, *, start: int = 0, end: int | None = None):
+        buffer_out, length = self._get_buffer_out(buffer, start, end)
+        self._set_msg(0, address, 0, buffer_out, length)
+        self._transfer(1)
+
+    def readfrom_into(self, address: int, buffer, *, start: int = 0, end: int | None = None):
+        end = len(buffer) if end is None else end
+        buffer_in = self._get_buffer_in(end - start)
+        self._set_msg(0, address, I2C_M_RD, buffer_in, end - start)
+        self._transfer(1)
+        buffer[start:end] = buffer_in.data
+
+    def writeto_then_readfrom(self, address: int, buffer_out, buffer_in, *,
+                              out_start: int = 0, out_end: int | None = None, in_start: int = 0, in_end: int | None = None):
+        # a single transfer - the messages are joined by a repeated start
+        c_buffer_out, length = self._get_buffer_out(buffer_out, out_start, out_end)
+        in_end = len(buffer_in) if in_end is None else in_end
+        c_buffer_in = self._get_buffer_in(in_end - in_start)
+        self._set_msg(0, address, 0, c_buffer_out, length)
+        self._set_msg(1, address, I2C_M_RD, c_buffer_in, in_end - in_start)
+        self._transfer(2)
+        buffer_in[in_start:in_end] = c_buffer_in.data
+
+    # ---------------------------------------------------------------------
+    # register access (used by LinuxBurstHandler)
+    # ---------------------------------------------------------------------
+
+    def read_register(self, address: int, register: int, byte_count: int) -> int:
+        """
+        read a big-endian register (write pointer, repeated start, read data)
+        """
+        buffer_in = self._get_buffer_in(byte_count)
+        buffer_out = self._buffer_out
+        buffer_out.data[0] = register
+        self._set_msg(0, address, 0, buffer_out, 1)
+        self._set_msg(1, address, I2C_M_RD, buffer_in, byte_count)
+        self._transfer(2)
+        return int.from_bytes(buffer_in.data, 'big')
+
+    def write_register(self, address: int, register: int, value: int, byte_count: int):
+        """
+        write a big-endian register (pointer and data in a single message)
+        """
+        if byte_count < len(self._buffer_out.data):
+            buffer_out = self._buffer_out
+        else:
+            buffer_out = _Buffer(byte_count + 1)
+        data = buffer_out.data
+        data[0] = register
+        for i in range(byte_count):
+            data[byte_count - i] = (value >> (8 * i)) & 0xFF
+        self._set_msg(0, address, 0, buffer_out, byte_count + 1)
+        self._transfer(1)
+
+    @property
+    def burst_handler_class(self) -> type['LinuxBurstHandler']:
+        # picked up by 'Ads1x1x' instead of 'feeph.i2c.BurstHandler'
+        return LinuxBurstHandler
+
+    def _get_buffer_in(self, length: int) -> _Buffer:
+        buffer_in = self._buffers_in.get(length)
+        return buffer_in if buffer_in is not None else _Buffer(length)
+
+    def _get_buffer_out(self, buffer, start: int, end: int | None) -> tuple[_Buffer, int]:
+        """
+        copy 'buffer[start:end]' into the message buffer (no intermediate copy)
+        """
+        end = len(buffer) if end is None else end
+        length = end - start
+        buffer_out = self._buffer_out if length <= len(self._buffer_out.data) else _Buffer(length)
+        if start == 0 and end == len(buffer):
+            buffer_out.data[:length] = buffer
+        else:
+            buffer_out.data[:length] = memoryview(buffer)[start:end]
+        return buffer_out, length
+
+    def _set_msg(self, index: int, address: int, flags: int, buffer: _Buffer, length: int):
+        msg = self._msgs[index]
+        msg.addr = address
+        msg.flags = flags
+        msg.len = length
+        msg.buf = buffer.pointer
+
+    def _transfer(self, nmsgs: int):
+        if self._fd is None:
+            raise RuntimeError(f"bus '{self.path}' is closed")
+        self._rdwr.nmsgs = nmsgs
+        fcntl.ioctl(self._fd, I2C_RDWR, self._rdwr)
+
+
+class LinuxBurst:
+    """
+    register access of a single device (see 'LinuxBurstHandler')
+    """
+
+    def __init__(self, i2c_bus: LinuxI2C, i2c_adr: int):
+        self._i2c_bus = i2c_bus
+        self._i2c_adr = i2c_adr
+
+    def read_register(self, register: int, byte_count: int = 1) -> int:
+        return self._i2c_bus.read_register(self._i2c_adr, register, byte_count)
+
+    def write_register(self, register: int, value: int, byte_count: int = 1):
+        self._i2c_bus.write_register(self._i2c_adr, register, value, byte_count)
+
+
+class LinuxBurstHandler:
+    """
+    drop-in replacement for 'feeph.i2c.BurstHandler'
+
+    Locks the bus for the duration of the burst.
+
+    raises RuntimeError if the bus can't be locked in time
+    """
+
+    def __init__(self, i2c_bus: LinuxI2C, i2c_adr: int, timeout_ms: int = 500):
+        self._i2c_bus = i2c_bus
+        self._i2c_adr = i2c_adr
+        self._timeout = timeout_ms / 1000
+
+    def __enter__(self) -> LinuxBurst:
+        if not self._i2c_bus._lock.acquire(timeout=self._timeout):
+            raise RuntimeError(f"unable to lock the I²C bus '{self._i2c_bus.path}'")
+        return LinuxBurst(self._i2c_bus, self._i2c_adr)
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self._i2c_bus._lock.release()
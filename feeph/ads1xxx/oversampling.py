@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+combine multiple conversions into a single low-noise measurement
+
+Oversampling trades bandwidth for precision: N conversions are taken
+at a high data rate in continuous conversion mode and reduced to a
+single value. With at least ~1 LSB of noise (which dithers the
+quantization), averaging N samples reduces the noise by √N and gains
+½·log2(N) bits of effective resolution.
+
+usage:
+```
+config = Ads1115Config(dom=DOM.CCM, drs=DRS.MODE7)
+result = ads1115.get_oversampled_measurement(config=config, samples=256, reduction=REDUCTION.MEDIAN)
+print(result.value, result.noise, result.effective_resolution)
+```
+
+Large sample counts are reduced with numpy (if installed) instead of
+per-sample Python code.
+"""
+
+import functools
+import math
+import statistics
+import sys
+from array import array
+from enum import Enum
+from typing import Any
+
+from attrs import frozen
+
+from feeph.ads1xxx.conversions import UNIT, convert_number_to_sint16, get_microvolts_per_step
+from feeph.ads1xxx.settings import PGA
+
+
+class REDUCTION(Enum):
+    MEAN = 0          # average (lowest noise)
+    MEDIAN = 1        # robust against spikes
+    TRIMMED_MEAN = 2  # average without the lowest and highest 10%
+
+
+# fraction of the samples removed at each end (REDUCTION.TRIMMED_MEAN)
+TRIM_FRACTION = 0.1
+
+# relative efficiency of the estimator for gaussian noise
+# (the median needs ~1.57x the samples to reach the noise of the mean)
+EFFICIENCY = {
+    REDUCTION.MEAN:         1.0,
+    REDUCTION.MEDIAN:       2 / math.pi,
+    REDUCTION.TRIMMED_MEAN: 0.94,
+}
+
+# use numpy (if installed) for at least this many samples
+VECTORIZE_THRESHOLD = 64
+
+
+@frozen
+class OversampledMeasurement:
+    """
+    result of 'Ads1x1x.get_oversampled_measurement()'
+    """
+    # fmt: off
+    value:                int    # combined value (microvolts or step)
+    noise:                int    # standard deviation of the individual samples (microvolts or LSB)
+    samples:              int    # number of samples
+    effective_resolution: float  # bits (estimate)
+    # fmt: on
+
+
+def combine_samples(buffer, reduction: REDUCTION, pga: PGA, resolution: int = 16,
+                    unit: UNIT = UNIT.MICRO) -> OversampledMeasurement:
+    """
+    reduce a buffer of conversion results (see 'Ads1x1x.capture()')
+
+    Byte buffers contain big-endian words, buffers with 2-byte items
+    (e.g. 'array('h')') contain numbers in host byte order.
+
+    raises ValueError if the buffer is empty
+    """
+    sample_count = memoryview(buffer).nbytes // 2
+    if sample_count == 0:
+        raise ValueError("buffer contains no samples")
+    np = _get_numpy() if sample_count >= VECTORIZE_THRESHOLD else None
+    if np is not None:
+        number, stddev = _reduce_vectorized(np, buffer, reduction)
+    else:
+        number, stddev = _reduce(buffer, reduction)
+    # the lower bits of a 12-bit result are zero, scale to the device's LSB
+    lsb = 1 << (16 - resolution)
+    number /= lsb
+    stddev /= lsb
+    effective_resolution = float(resolution)
+    if stddev >= 0.5:
+        # the noise dithers the quantization - each 4x oversampling yields 1 bit
+        effective_resolution += max(0.5 * math.log2(sample_count * EFFICIENCY[reduction]), 0.0)
+    if unit == UNIT.MICRO:
+        microvolts_per_step = get_microvolts_per_step(pga, resolution=resolution)
+        value = round(number * microvolts_per_step)
+        noise = round(stddev * microvolts_per_step)
+    else:
+        value = convert_number_to_sint16(round(number) * lsb)
+        noise = round(stddev)
+    return OversampledMeasurement(value=value, noise=noise, samples=sample_count, effective_resolution=effective_resolution)
+
+
+def _reduce(buffer, reduction: REDUCTION) -> tuple[float, float]:
+    view = memoryview(buffer)
+    numbers = array('h', view.tobytes())
+    if view.itemsize == 1 and sys.byteorder == 'little':
+        numbers.byteswap()
+    if reduction == REDUCTION.MEAN:
+        number = statistics.fmean(numbers)
+    elif reduction == REDUCTION.MEDIAN:
+        number = statistics.median(numbers)
+    else:
+        trim = int(len(numbers) * TRIM_FRACTION)
+        number = statistics.fmean(sorted(numbers)[trim:len(numbers) - trim])
+    return number, statistics.pstdev(numbers)
+
+
+def _reduce_vectorized(np: Any, buffer, reduction: REDUCTION) -> tuple[float, float]:
+    dtype = '>i2' if memoryview(buffer).itemsize == 1 else '=i2'
+    numbers = np.frombuffer(buffer, dtype=dtype).astype(np.int32)
+    if reduction == REDUCTION.MEAN:
+        number = numbers.mean()
+    elif reduction == REDUCTION.MEDIAN:
+        number = np.median(numbers)
+    else:
+        trim = int(len(numbers) * TRIM_FRACTION)
+        number = np.sort(numbers)[trim:len(numbers) - trim].mean()
+    return float(number), float(numbers.std())
+
+
+@functools.cache
+def _get_numpy() -> Any:
+    # module numpy is optional
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+scan multiple input channels of an ADS1015 or ADS1115
+
+The channels are measured round-robin in single-shot mode. Only the
+config register is written for each channel (the thresholds remain
+untouched) and the next conversion is started right after reading the
+previous result. The conversion of the next channel therefore overlaps
+with the post-processing of the current one.
+
+usage:
+```
+scan_list = ScanList(device=ads1115, channels=[
+    (MUX.MODE4, PGA.MODE1, DRS.MODE7),  # AIN0»GND
+    (MUX.MODE5, PGA.MODE1, DRS.MODE7),  # AIN1»GND
+])
+result = scan_list.scan(rounds=10)
+```
+"""
+
+import logging
+import time
+
+from attrs import define, frozen
+
+from feeph.ads1xxx.ads1x1x import Ads1x1x
+from feeph.ads1xxx.conversions import UNIT, get_microvolt_table
+from feeph.ads1xxx.settings import CLAT, CMOD, CPOL, CQUE, DOM, DRS, MUX, PGA, SSC
+
+LH = logging.getLogger('feeph.ads1xxx')
+
+
+@frozen
+class ScanChannel:
+    """
+    precomputed values for a single channel
+    """
+    # fmt: off
+    start_uint:      int    # config register (with the OS bit)
+    pga:             PGA    # programmable gain amplifier
+    conversion_time: float  # seconds
+    # fmt: on
+
+
+@define
+class ScanResult:
+    """
+    measurements per channel and the achieved rate
+    """
+    # fmt: off
+    values:   list[list[int]]  # one list of measurements per channel
+    duration: float            # seconds
+    # fmt: on
+
+    @property
+    def sample_rate(self) -> float:
+        """
+        achieved aggregate rate (samples per second)
+        """
+        return sum(len(values) for values in self.values) / self.duration
+
+    @property
+    def scan_rate(self) -> float:
+        """
+        achieved rate per channel (rounds per second)
+        """
+        return min(len(values) for values in self.values) / self.duration
+
+
+class ScanList:
+    """
+    measure a list of channels round-robin with minimal register writes
+
+    Each channel is defined by its input multiplexer, programmable gain
+    amplifier and data rate setting. (The highest data rate yields the
+    highest aggregate rate.)
+    """
+
+    def __init__(self, device: Ads1x1x, channels: list[tuple[MUX, PGA, DRS]]):
+        if not device.capabilities.has_mux:
+            raise ValueError("device has no input multiplexer")
+        if not channels:
+            raise ValueError("at least one channel is required")
+        self._device = device
+        # comparator is disabled, the thresholds are irrelevant
+        base_uint = DOM.SSM.value | CMOD.TRD.value | CPOL.ALO.value | CLAT.NLC.value | CQUE.DIS.value
+        self._channels = []
+        for mux, pga, drs in channels:
+            config_uint = base_uint | mux.value | pga.value | drs.value
+            self._channels.append(ScanChannel(
+                start_uint=config_uint | SSC.START.value,
+                pga=pga,
+                conversion_time=device.capabilities.get_conversion_time(config_uint),
+            ))
+
+    def scan(self, rounds: int = 1, unit: UNIT = UNIT.MICRO) -> ScanResult:
+        """
+        measure all channels 'rounds' times
+
+        The I²C bus is locked for the duration of the scan.
+        """
+        if rounds < 1:
+            raise ValueError("at least one round is required")
+        device = self._device
+        channels = self._channels
+        channel_count = len(channels)
+        steps: list[list[int]] = [[] for _ in channels]
+        # the config register changes with every channel, its shadow copy
+        # is unknown until the scan is completed
+        device._shadow[0x01] = None
+        with device._get_burst_handler() as bh:
+            time_start = time.perf_counter()
+            bh.write_register(0x01, channels[0].start_uint, byte_count=2)
+            for i in range(rounds * channel_count):
+                channel = channels[i % channel_count]
+                device._wait_for_conversion(bh, channel.conversion_time)
+                step = bh.read_register(0x00, byte_count=2)
+                # pipeline: start the next conversion before doing anything else
+                if i + 1 < rounds * channel_count:
+                    bh.write_register(0x01, channels[(i + 1) % channel_count].start_uint, byte_count=2)
+                steps[i % channel_count].append(step)
+            duration = time.perf_counter() - time_start
+        device._shadow[0x01] = channels[(rounds * channel_count - 1) % channel_count].start_uint & ~SSC.START.value
+        if unit == UNIT.MICRO:
+            values = []
+            shift = 16 - device.capabilities.resolution
+            for channel, channel_steps in zip(channels, steps):
+                microvolt_table = get_microvolt_table(channel.pga, resolution=device.capabilities.resolution)
+                values.append([microvolt_table[step >> shift] for step in channel_steps])
+        else:
+            values = steps
+        return ScanResult(values=values, duration=duration)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 from enum import Enum
+from typing import TypeVar, cast
 
 
 class CQUE(Enum):
@@ -60,14 +61,14 @@ class DRS(Enum):
     data rate setting (config[5:7])
     ```
                  ADS101x ADS111x
-    DRS.MODE0 ->      8     128 samples per second
-    DRS.MODE1 ->     16     250 samples per second
-    DRS.MODE2 ->     32     490 samples per second
-    DRS.MODE3 ->     64     920 samples per second
-    DRS.MODE4 ->    128    1600 samples per second
-    DRS.MODE5 ->    250    2400 samples per second
-    DRS.MODE6 ->    475    3300 samples per second
-    DRS.MODE7 ->    860    3300 samples per second
+    DRS.MODE0 ->    128       8 samples per second
+    DRS.MODE1 ->    250      16 samples per second
+    DRS.MODE2 ->    490      32 samples per second
+    DRS.MODE3 ->    920      64 samples per second
+    DRS.MODE4 ->   1600     128 samples per second
+    DRS.MODE5 ->   2400     250 samples per second
+    DRS.MODE6 ->   3300     475 samples per second
+    DRS.MODE7 ->   3300     860 samples per second
     ```
     """
     MODE0 = 0b0000_0000_0000_0000
@@ -150,3 +151,34 @@ class SSC(Enum):
     """
     NO_OP = 0b0000_0000_0000_0000
     START = 0b1000_0000_0000_0000
+
+
+# bit mask of each setting within the config register
+SETTING_MASKS: dict[type[Enum], int] = {
+    SSC:  0b1000_0000_0000_0000,
+    MUX:  0b0111_0000_0000_0000,
+    PGA:  0b0000_1110_0000_0000,
+    DOM:  0b0000_0001_0000_0000,
+    DRS:  0b0000_0000_1110_0000,
+    CMOD: 0b0000_0000_0001_0000,
+    CPOL: 0b0000_0000_0000_1000,
+    CLAT: 0b0000_0000_0000_0100,
+    CQUE: 0b0000_0000_0000_0011,
+}
+
+# masked bits -> mode (one lookup instead of scanning the enum)
+SETTING_TABLES: dict[type[Enum], dict[int, Enum]] = {
+    setting: {mode.value: mode for mode in setting} for setting in SETTING_MASKS
+}
+
+S = TypeVar('S', bound=Enum)
+
+
+def decode_setting(setting: type[S], config_uint: int) -> S:
+    """
+    extract a setting from the config register
+    ```
+    decode_setting(PGA, 0x8583) -> PGA.MODE2
+    ```
+    """
+    return cast(S, SETTING_TABLES[setting][config_uint & SETTING_MASKS[setting]])
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+share the samples of a single device with multiple processes
+
+A single process (the daemon) owns the I²C bus and writes timestamped
+raw samples into a ring buffer in shared memory. Any number of
+processes attach to the ring and read the samples without copying.
+
+run the daemon:
+```
+python -m feeph.ads1xxx.shm --bus 1 --model ADS1115 --mux MODE4 --drs MODE7 --name ads1115
+```
+
+read the samples:
+```
+with SharedRingReader(name='ads1115') as reader:
+    while ...:
+        samples = reader.read_available()
+        values = samples.get_values()
+```
+
+Memory layout:
+ - header       (64 bytes) magic, version, capacity, config register,
+                           resolution, data rate and sequence counter
+ - timestamps   (8 bytes per sample, 'time.monotonic_ns()')
+ - steps        (2 bytes per sample, conversion register)
+
+The sequence counter is the total number of samples written. The
+writer publishes a sample by incrementing the counter after storing
+it. Readers detect overwritten samples by comparing the counter with
+the sequence number of the samples they are looking at.
+
+The counter is a 32-bit word which wraps around. Only an aligned 32-bit
+word is stored and loaded in a single access on all supported platforms
+(a 64-bit counter may tear on 32-bit ARM). Readers extend the counter to
+the full sample count, which assumes they read at least once every 2^32
+samples (more than 15 days at 3300 SPS). The capacity must be a power of
+two so that the slot of a sample does not change when the counter wraps.
+
+Weakly ordered CPUs (e.g. ARM) may make the stores of a process visible
+to other processes in a different order. The writer therefore places a
+memory barrier between storing a sample and publishing the counter, and
+readers place one between processing the samples and checking the
+counter again ('is_intact()'). Python has no fence, a lock operation is
+used instead (it implies a full barrier).
+"""
+
+import argparse
+import logging
+import signal
+import struct
+import sys
+import threading
+from multiprocessing import resource_tracker, shared_memory
+from typing import TYPE_CHECKING, cast
+
+from attrs import field, frozen
+
+from feeph.ads1xxx.conversions import UNIT, get_microvolt_table
+from feeph.ads1xxx.settings import DOM, DRS, MUX, PGA, decode_setting
+
+if TYPE_CHECKING:
+    from feeph.ads1xxx.ads1x1x import Ads1x1x, Ads1x1xConfig
+
+LH = logging.getLogger('feeph.ads1xxx')
+
+MAGIC = b'ADS1XXX\x00'
+VERSION = 1
+
+# magic, version, capacity, config register, resolution, data rate
+HEADER = struct.Struct('<8sIIHHI')
+SEQUENCE_OFFSET = 32
+SEQUENCE_MASK = 0xFFFF_FFFF  # 32-bit counter
+DATA_OFFSET = 64
+
+# command line name -> class name
+MODELS = {
+    'ADS1013': 'Ads1013',
+    'ADS1014': 'Ads1014',
+    'ADS1015': 'Ads1015',
+    'ADS1113': 'Ads1113',
+    'ADS1114': 'Ads1114',
+    'ADS1115': 'Ads1115',
+}
+
+# names of the blocks created by this process
+_WRITERS: set[str] = set()
+
+# only used for its memory barrier
+_BARRIER = threading.Lock()
+
+
+def _memory_barrier():
+    """
+    order the memory accesses before and after this call
+
+    Releasing the lock orders all prior accesses, acquiring it again
+    orders all subsequent accesses.
+    """
+    _BARRIER.acquire()
+    _BARRIER.release()
+    _BARRIER.acquire()
+    _BARRIER.release()
+
+
+def _get_size(capacity: int) -> int:
+    return DATA_OFFSET + capacity * 8 + capacity * 2
+
+
+def _get_buffer(shm: shared_memory.SharedMemory) -> memoryview:
+    # 'buf' is only None after closing the block
+    return cast(memoryview, shm.buf)
+
+
+class _SharedRing:
+    """
+    views of the shared memory block (writer and reader)
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, capacity: int):
+        self.shm = shm
+        self.capacity = capacity
+        buf = _get_buffer(shm)
+        self._sequence_view = buf[SEQUENCE_OFFSET:SEQUENCE_OFFSET + 4].cast('I')
+        self._timestamps = buf[DATA_OFFSET:DATA_OFFSET + capacity * 8].cast('q')
+        self._steps = buf[DATA_OFFSET + capacity * 8:DATA_OFFSET + capacity * 10].cast('H')
+
+    def _release(self):
+        self._sequence_view.release()
+        self._timestamps.release()
+        self._steps.release()
+
+
+class SharedRingWriter(_SharedRing):
+    """
+    create the shared memory block and write samples into it
+
+    raises FileExistsError if a block with this name exists already
+    raises ValueError if the capacity is not a power of two
+    """
+
+    def __init__(self, name: str, capacity: int, config_uint: int, resolution: int, sample_rate: int):
+        if capacity < 2:
+            raise ValueError(f"ring buffer must hold at least 2 samples ({capacity})")
+        if capacity & (capacity - 1):
+            raise ValueError(f"capacity must be a power of two ({capacity})")
+        shm = shared_memory.SharedMemory(name=name, create=True, size=_get_size(capacity))
+        HEADER.pack_into(_get_buffer(shm), 0, MAGIC, VERSION, capacity, config_uint, resolution, sample_rate)
+        super().__init__(shm, capacity)
+        _WRITERS.add(shm.name)
+        self._sequence = 0
+        self._sequence_view[0] = 0
+
+    def put(self, timestamp: int, step: int):
+        sequence = self._sequence
+        index = sequence % self.capacity
+        self._timestamps[index] = timestamp
+        self._steps[index] = step
+        # the sample must be visible before the counter publishes it
+        _memory_barrier()
+        self._sequence = sequence + 1
+        self._sequence_view[0] = (sequence + 1) & SEQUENCE_MASK
+
+    @property
+    def sequence(self) -> int:
+        """
+        total number of samples written
+        """
+        return self._sequence
+
+    def close(self):
+        """
+        release and remove the shared memory block
+        """
+        self._release()
+        self.shm.close()
+        self.shm.unlink()
+        _WRITERS.discard(self.shm.name)
+
+    def __enter__(self) -> 'SharedRingWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+
+@frozen
+class SharedSamples:
+    """
+    samples returned by 'SharedRingReader.read_available()'
+
+    The chunks are views of the shared memory (no copy). They may be
+    overwritten by the writer if they're not processed in time. Use
+    'is_intact()' after processing to make sure they weren't. Release
+    the views before closing the reader.
+    """
+    # fmt: off
+    chunks:   list[tuple[memoryview, memoryview]]  # (timestamps, steps) - two chunks if the ring wrapped
+    first:    int                                  # sequence number of the first sample
+    count:    int                                  # number of samples
+    overruns: int                                  # samples lost since the previous read
+    _reader:  'SharedRingReader' = field(repr=False)
+    # fmt: on
+
+    def is_intact(self) -> bool:
+        """
+        True if the writer did not overwrite any of the samples yet
+        """
+        # the samples must be processed before the counter is checked
+        _memory_barrier()
+        return self._reader.sequence - self._reader.capacity < self.first
+
+    def get_values(self, unit: UNIT = UNIT.MICRO) -> list[int]:
+        if unit == UNIT.MICRO:
+            table = self._reader.microvolt_table
+            shift = self._reader.shift
+            return [table[step >> shift] for _, steps in self.chunks for step in steps]
+        else:
+            return [step for _, steps in self.chunks for step in steps]
+
+    def release(self):
+        for timestamps, steps in self.chunks:
+            timestamps.release()
+            steps.release()
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class SharedRingReader(_SharedRing):
+    """
+    attach to a shared memory block created by 'SharedRingWriter'
+
+    Only samples written after attaching are returned.
+
+    raises FileNotFoundError if there is no block with this name
+    raises RuntimeError if the block has an unknown format
+    """
+
+    def __init__(self, name: str):
+        shm = shared_memory.SharedMemory(name=name, create=False)
+        if shm.name not in _WRITERS:
+            # the resource tracker would remove the block when this process
+            # exits but it belongs to the writer (fixed in Python 3.13)
+            resource_tracker.unregister(shm._name, 'shared_memory')  # type: ignore[attr-defined]
+        magic, version, capacity, config_uint, resolution, sample_rate = HEADER.unpack_from(_get_buffer(shm), 0)
+        if magic != MAGIC or version != VERSION:
+            shm.close()
+            raise RuntimeError(f"shared memory '{name}' has an unknown format")
+        super().__init__(shm, capacity)
+        self.config_uint = config_uint
+        self.resolution = resolution
+        self.sample_rate = sample_rate
+        self.shift = 16 - resolution
+        self.microvolt_table = get_microvolt_table(decode_setting(PGA, config_uint), resolution=resolution)
+        self.overruns = 0
+        self._read = self._sequence_view[0]
+
+    @property
+    def sequence(self) -> int:
+        """
+        total number of samples written (as seen by this reader)
+        """
+        # extend the wrapping 32-bit counter (it's never behind the reader)
+        read = self._read
+        return read + ((self._sequence_view[0] - read) & SEQUENCE_MASK)
+
+    def read_available(self, max_count: int | None = None) -> SharedSamples:
+        """
+        samples written since the previous read
+        """
+        sequence = self.sequence
+        # the writer may be overwriting the oldest slot right now
+        first = max(self._read, sequence - self.capacity + 1)
+        count = sequence - first
+        if max_count is not None:
+            count = min(count, max_count)
+        lost = first - self._read
+        start = first % self.capacity
+        end = start + count
+        if end <= self.capacity:
+            chunks = [(self._timestamps[start:end], self._steps[start:end])]
+        else:
+            end -= self.capacity
+            chunks = [
+                (self._timestamps[start:], self._steps[start:]),
+                (self._timestamps[:end], self._steps[:end]),
+            ]
+        self._read = first + count
+        self.overruns += lost
+        return SharedSamples(chunks=chunks, first=first, count=count, overruns=lost, reader=self)
+
+    def close(self):
+        """
+        detach from the shared memory block (the block remains)
+        """
+        self._release()
+        self.shm.close()
+
+    def __enter__(self) -> 'SharedRingReader':
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+
+# -------------------------------------------------------------------------
+# daemon
+# -------------------------------------------------------------------------
+
+
+def run_daemon(device: 'Ads1x1x', config: 'Ads1x1xConfig', writer: SharedRingWriter, count: int | None = None):
+    """
+    stream the samples of the device into the shared memory ring
+    """
+    put = writer.put
+    for timestamp, step in device.stream(config=config, count=count, unit=UNIT.STEPS):
+        put(timestamp, step)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="share the samples of an ADS1xxx device via shared memory")
+    parser.add_argument('--bus', type=int, default=1, help="I²C bus number (default: %(default)d)")
+    parser.add_argument('--address', type=lambda value: int(value, 0), default=0x48, help="I²C address (default: 0x48)")
+    parser.add_argument('--model', choices=MODELS, default='ADS1115', help="device model (default: %(default)s)")
+    parser.add_argument('--mux', choices=[mode.name for mode in MUX], default=MUX.MODE0.name, help="input multiplexer")
+    parser.add_argument('--pga', choices=[mode.name for mode in PGA], default=PGA.MODE2.name, help="gain amplifier")
+    parser.add_argument('--drs', choices=[mode.name for mode in DRS], default=DRS.MODE4.name, help="data rate setting")
+    parser.add_argument('--name', default='ads1xxx', help="name of the shared memory block (default: %(default)s)")
+    parser.add_argument('--capacity', type=int, default=65536, help="number of samples, a power of two (default: %(default)d)")
+    args = parser.parse_args(argv)
+    if args.capacity < 2 or args.capacity & (args.capacity - 1):
+        parser.error(f"capacity must be a power of two ({args.capacity})")
+
+    # imported on use (keeps the import of this module cheap for readers)
+    import feeph.ads1xxx as ads1xxx
+    from feeph.ads1xxx.linux_i2c import LinuxI2C
+
+    device_class = getattr(ads1xxx, MODELS[args.model])
+    config_class = getattr(ads1xxx, f'{MODELS[args.model]}Config')
+    capabilities = device_class.capabilities
+    settings = {'dom': DOM.CCM, 'drs': DRS[args.drs]}
+    if capabilities.has_mux:
+        settings['mux'] = MUX[args.mux]
+    if capabilities.has_pga:
+        settings['pga'] = PGA[args.pga]
+    config = config_class(**settings)
+    config_uint = config.as_uint16()
+
+    # stop cleanly (and remove the shared memory block) on SIGTERM
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    with LinuxI2C(bus=args.bus) as i2c_bus:
+        device = device_class(i2c_bus=i2c_bus, i2c_adr=args.address)
+        with SharedRingWriter(name=args.name, capacity=args.capacity, config_uint=config_uint,
+                              resolution=capabilities.resolution,
+                              sample_rate=capabilities.get_data_rate(config_uint)) as writer:
+            try:
+                run_daemon(device, config, writer)
+            except KeyboardInterrupt:
+                pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+simulated ADS1x1x device for benchmarks and tests
+
+SimulatedAds1x1x is a stand-in for an I²C bus with a single ADS1x1x
+device. Unlike 'feeph.i2c.EmulatedI2C' (a static register dict) it
+models the behavior of the device:
+ - conversion timing depending on the data rate and the chip family
+ - the OS bit of the config register (single-shot mode)
+ - continuous conversion mode
+ - the pointer register (plain reads return the selected register)
+ - the comparator and the ALERT/RDY pin (incl. conversion-ready mode)
+ - the input signal (constant, sine, noise or a recorded trace)
+
+usage:
+```
+i2c_bus = SimulatedAds1x1x(drs_sps=DRS_SPS_ADS111X, signals={MUX.MODE4: SineSignal(amplitude=1.0, frequency=50)})
+ads1115 = Ads1115(i2c_bus=i2c_bus)
+```
+"""
+
+import logging
+import math
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Sequence
+
+from feeph.ads1xxx.ads1x1x import DEFAULTS
+from feeph.ads1xxx.capabilities import DRS_SPS_ADS111X, Capabilities
+from feeph.ads1xxx.conversions import PGA_FACTOR, convert_number_to_sint16, convert_sint16_to_number
+from feeph.ads1xxx.settings import CLAT, CMOD, CQUE, DOM, DRS, MUX, PGA, SSC, decode_setting
+
+LH = logging.getLogger('feeph.ads1xxx')
+
+# Linux reports a missing device as 'Remote I/O error'
+EREMOTEIO = 121
+
+# comparator queue -> number of conversions before asserting
+CQUE_COUNT = {
+    CQUE.AA1.value: 1,
+    CQUE.AA2.value: 2,
+    CQUE.AA4.value: 4,
+}
+
+# in continuous conversion mode we only simulate the most recent
+# conversions if the device wasn't accessed for a long time
+MAX_CATCH_UP = 4
+
+
+class Signal(ABC):
+    """
+    input signal of a simulated device
+    """
+
+    @abstractmethod
+    def get_voltage(self, timestamp: float) -> float:
+        """
+        voltage (in volts) at the provided time (in seconds)
+        """
+
+
+class ConstantSignal(Signal):
+
+    def __init__(self, voltage: float = 0.0):
+        self.voltage = voltage
+
+    def get_voltage(self, timestamp: float) -> float:
+        return self.voltage
+
+
+class SineSignal(Signal):
+
+    def __init__(self, amplitude: float, frequency: float, offset: float = 0.0, phase: float = 0.0):
+        self.amplitude = amplitude
+        self.frequency = frequency
+        self.offset = offset
+        self.phase = phase
+
+    def get_voltage(self, timestamp: float) -> float:
+        return self.offset + self.amplitude * math.sin(2 * math.pi * self.frequency * timestamp + self.phase)
+
+
+class NoiseSignal(Signal):
+    """
+    gaussian noise around a constant voltage
+    """
+
+    def __init__(self, voltage: float = 0.0, stddev: float = 0.001, seed: int | None = None):
+        self.voltage = voltage
+        self.stddev = stddev
+        self._random = random.Random(seed)
+
+    def get_voltage(self, timestamp: float) -> float:
+        return self._random.gauss(self.voltage, self.stddev)
+
+
+class TraceSignal(Signal):
+    """
+    replay a recorded trace (voltages sampled at a fixed rate)
+    """
+
+    def __init__(self, voltages: Sequence[float], sample_rate: float, loop: bool = True):
+        if not voltages:
+            raise ValueError("trace must not be empty")
+        self.voltages = voltages
+        self.sample_rate = sample_rate
+        self.loop = loop
+
+    def get_voltage(self, timestamp: float) -> float:
+        index = int(timestamp * self.sample_rate)
+        if self.loop:
+            return self.voltages[index % len(self.voltages)]
+        else:
+            return self.voltages[min(index, len(self.voltages) - 1)]
+
+
+class SimulatedAds1x1x:
+    """
+    an I²C bus with a single simulated ADS1x1x device
+
+    Implements the subset of 'busio.I2C' used by this library.
+    """
+
+    def __init__(self, drs_sps: dict[DRS, int] = DRS_SPS_ADS111X, resolution: int = 16, i2c_adr: int = 0x48,
+                 signals: dict[MUX, Signal] | None = None, clock: Callable[[], float] = time.monotonic):
+        if resolution not in (12, 16):
+            raise ValueError(f"unsupported resolution ({resolution})")
+        # decode the config register the same way as the device classes
+        self._capabilities = Capabilities(name='SIMULATED', resolution=resolution, drs_sps=drs_sps,
+                                          has_mux=True, has_pga=True, has_comparator=True)
+        self._resolution = resolution
+        self._i2c_adr = i2c_adr
+        self._signals = signals if signals is not None else {}
+        self._clock = clock
+        self._epoch = clock()
+        self._lock = threading.Lock()
+        # device state
+        self.pointer = 0x00
+        self._registers = {register: value for register, value in DEFAULTS.items() if value is not None}
+        self._registers[0x00] = 0x0000
+        self._registers[0x01] &= ~SSC.START.value  # the OS bit is a status
+        self._next_completion: float | None = None  # None if idle
+        self._comparator_count = 0                  # consecutive conversions beyond the threshold(s)
+        self.alert_asserted = False                 # logical state of the ALERT/RDY pin
+        self.alert_events = 0                       # number of times the ALERT/RDY pin asserted
+        # statistics
+        self.transactions = 0
+        self.conversions = 0
+
+    # ---------------------------------------------------------------------
+    # busio.I2C
+    # ---------------------------------------------------------------------
+
+    def try_lock(self) -> bool:
+        return self._lock.acquire(blocking=False)
+
+    def unlock(self):
+        self._lock.release()
+
+    def scan(self) -> list[int]:
+        return [self._i2c_adr]
+
+    def writeto(self, address: int, buffer, *, start: int = 0, end: int | None = None):
+        self._verify_address(address)
+        self.transactions += 1
+        self._write(bytes(buffer[start:end]))
+
+    def readfrom_into(self, address: int, buffer, *, start: int = 0, end: int | None = None):
+        self._verify_address(address)
+        self.transactions += 1
+        self._read(buffer, start, len(buffer) if end is None else end)
+
+    def writeto_then_readfrom(self, address: int, buffer_out, buffer_in, *,
+                              out_start: int = 0, out_end: int | None = None, in_start: int = 0, in_end: int | None = None):
+        # repeated start - a single transaction
+        self._verify_address(address)
+        self.transactions += 1
+        self._write(bytes(buffer_out[out_start:out_end]))
+        self._read(buffer_in, in_start, len(buffer_in) if in_end is None else in_end)
+
+    # ---------------------------------------------------------------------
+    # device
+    # ---------------------------------------------------------------------
+
+    def get_register(self, register: int) -> int:
+        """
+        inspect a register without affecting the device's state
+        """
+        self._update(self._clock())
+        return self._get_register(register)
+
+    def _verify_address(self, address: int):
+        if address != self._i2c_adr:
+            raise OSError(EREMOTEIO, f"no device at address 0x{address:02X}")
+
+    def _write(self, data: bytes):
+        now = self._clock()
+        self._update(now)
+        self.pointer = data[0]
+        if len(data) == 3:
+            value = (data[1] << 8) | data[2]
+            if self.pointer == 0x01:
+                self._write_config(value, now)
+            elif self.pointer in (0x02, 0x03):
+                self._registers[self.pointer] = value
+            # the conversion register is read-only
+
+    def _read(self, buffer, start: int, end: int):
+        self._update(self._clock())
+        value = self._get_register(self.pointer)
+        if self.pointer == 0x00 and self._registers[0x01] & CLAT.LAT.value:
+            # reading the conversion register clears a latched alert
+            self.alert_asserted = False
+        data = value.to_bytes(2, 'big')
+        for i in range(start, end):
+            buffer[i] = data[(i - start) % 2]
+
+    def _get_register(self, register: int) -> int:
+        if register == 0x01:
+            value = self._registers[0x01]
+            if value & DOM.SSM.value and self._next_completion is None:
+                # device is not performing a conversion
+                value |= SSC.START.value
+            return value
+        else:
+            return self._registers[register]
+
+    def _write_config(self, value: int, now: float):
+        was_continuous = not self._registers[0x01] & DOM.SSM.value
+        self._registers[0x01] = value & ~SSC.START.value
+        period = 1 / self._get_data_rate()
+        if value & DOM.SSM.value:
+            if was_continuous:
+                # continuous conversion is stopped, device powers down
+                self._next_completion = None
+            if value & SSC.START.value and self._next_completion is None:
+                self._next_completion = now + period
+        else:
+            # (re-)start continuous conversion
+            self._next_completion = now + period
+
+    def _get_data_rate(self) -> int:
+        return self._capabilities.get_data_rate(self._registers[0x01])
+
+    def _update(self, now: float):
+        """
+        complete all conversions that should have finished by now
+        """
+        next_completion = self._next_completion
+        if next_completion is None or next_completion > now:
+            return
+        if self._registers[0x01] & DOM.SSM.value:
+            self._complete_conversion(next_completion)
+            self._next_completion = None
+        else:
+            period = 1 / self._get_data_rate()
+            pending = int((now - next_completion) / period) + 1
+            if pending > MAX_CATCH_UP:
+                next_completion += (pending - MAX_CATCH_UP) * period
+            while next_completion <= now:
+                self._complete_conversion(next_completion)
+                next_completion += period
+            self._next_completion = next_completion
+
+    def _complete_conversion(self, timestamp: float):
+        config_uint = self._registers[0x01]
+        number = self._sample(config_uint, timestamp)
+        self._registers[0x00] = convert_number_to_sint16(number)
+        self.conversions += 1
+        self._update_comparator(config_uint, number)
+
+    def _sample(self, config_uint: int, timestamp: float) -> int:
+        mux = decode_setting(MUX, config_uint)
+        pga = decode_setting(PGA, config_uint)
+        signal = self._signals.get(mux)
+        voltage = signal.get_voltage(timestamp - self._epoch) if signal is not None else 0.0
+        if self._resolution == 12:
+            # the 12-bit result is left-aligned, the lower 4 bits are zero
+            number = round(voltage * 1_000_000 / (PGA_FACTOR[pga] * 1000 // 2048))
+            return max(-2048, min(2047, number)) << 4
+        number = round(voltage * 1_000_000 / (PGA_FACTOR[pga] * 1000 / 32767))
+        return max(-32768, min(32767, number))
+
+    def _update_comparator(self, config_uint: int, number: int):
+        cque = config_uint & CQUE.DIS.value
+        if cque == CQUE.DIS.value:
+            # ALERT/RDY pin is in high-impedance state
+            self.alert_asserted = False
+            self._comparator_count = 0
+            return
+        lo_thresh = self._registers[0x02]
+        hi_thresh = self._registers[0x03]
+        if hi_thresh & 0x8000 and not lo_thresh & 0x8000:
+            # conversion-ready mode
+            self.alert_asserted = True
+            self.alert_events += 1
+            return
+        lo_number = convert_sint16_to_number(lo_thresh)
+        hi_number = convert_sint16_to_number(hi_thresh)
+        if config_uint & CMOD.WND.value:
+            beyond = number > hi_number or number < lo_number
+            within = not beyond
+        else:
+            beyond = number > hi_number
+            within = number < lo_number
+        if beyond:
+            self._comparator_count += 1
+            if self._comparator_count >= CQUE_COUNT[cque] and not self.alert_asserted:
+                self.alert_asserted = True
+                self.alert_events += 1
+        else:
+            self._comparator_count = 0
+            if within and not config_uint & CLAT.LAT.value:
+                self.alert_asserted = False
+
+
+class SimulatedAlertReadyPin:
+    """
+    stand-in for 'feeph.ads1xxx.alert.AlertReadyPin' connected to a
+    simulated device
+    """
+
+    def __init__(self, device: SimulatedAds1x1x):
+        self._device = device
+        self._seen = device.alert_events
+
+    def clear(self):
+        self._device.get_register(0x01)  # bring the simulation up to date
+        self._seen = self._device.alert_events
+
+    def wait(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while True:
+            self._device.get_register(0x01)  # bring the simulation up to date
+            if self._device.alert_events > self._seen:
+                self._seen = self._device.alert_events
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(remaining, 0.000_1))
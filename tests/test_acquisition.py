@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+test the background acquisition
+"""
+
+import time
+import unittest
+
+import feeph.ads1xxx as sut  # sytem under test
+import feeph.ads1xxx.simulation as sim
+from feeph.ads1xxx.acquisition import SampleRing
+from feeph.ads1xxx.settings import DOM, DRS, MUX
+
+
+class TestSampleRing(unittest.TestCase):
+
+    def test_get(self):
+        ring = SampleRing(size=4)
+        for i in range(3):
+            ring.put(timestamp=i, step=0x1000 + i)
+        self.assertEqual(len(ring), 3)
+        # -----------------------------------------------------------------
+        timestamps, steps, lost = ring.get()
+        # -----------------------------------------------------------------
+        self.assertEqual(list(timestamps), [0, 1, 2])
+        self.assertEqual(list(steps), [0x1000, 0x1001, 0x1002])
+        self.assertEqual(lost, 0)
+        self.assertEqual(len(ring), 0)
+
+    def test_wrap_around(self):
+        ring = SampleRing(size=4)
+        for i in range(3):
+            ring.put(timestamp=i, step=i)
+        ring.get()
+        for i in range(3, 6):
+            ring.put(timestamp=i, step=i)
+        # -----------------------------------------------------------------
+        timestamps, steps, lost = ring.get()
+        # -----------------------------------------------------------------
+        self.assertEqual(list(steps), [3, 4, 5])
+        self.assertEqual(lost, 0)
+
+    def test_max_count(self):
+        ring = SampleRing(size=4)
+        for i in range(3):
+            ring.put(timestamp=i, step=i)
+        self.assertEqual(list(ring.get(max_count=2)[1]), [0, 1])
+        self.assertEqual(list(ring.get(max_count=2)[1]), [2])
+
+    def test_overrun(self):
+        ring = SampleRing(size=4)
+        for i in range(10):
+            ring.put(timestamp=i, step=i)
+        # -----------------------------------------------------------------
+        timestamps, steps, lost = ring.get()
+        # -----------------------------------------------------------------
+        # the oldest sample in the ring may be overwritten by the producer
+        # while copying and is discarded as well
+        self.assertEqual(list(steps), [7, 8, 9])
+        self.assertEqual(lost, 7)
+        self.assertEqual(ring.overruns, 7)
+
+    def test_invalid_size(self):
+        self.assertRaises(ValueError, SampleRing, size=1)
+
+
+class TestAcquisition(unittest.TestCase):
+
+    def setUp(self):
+        self.i2c_bus = sim.SimulatedAds1x1x(signals={MUX.MODE0: sim.ConstantSignal(voltage=1.0)})
+        # no reset - it would start a (slow) conversion
+        self.ads1115 = sut.Ads1115(i2c_bus=self.i2c_bus)
+        self.config = sut.Ads1115Config(dom=DOM.CCM, drs=DRS.MODE7)
+
+    # ---------------------------------------------------------------------
+
+    def test_acquisition(self):
+        with self.ads1115.start_acquisition(config=self.config, buffer_size=256) as acquisition:
+            time.sleep(0.05)
+            batch = acquisition.read_available()
+        # -----------------------------------------------------------------
+        self.assertFalse(acquisition.running)
+        self.assertGreater(len(batch), 0)
+        self.assertEqual(list(batch.timestamps), sorted(batch.timestamps))
+        for value in batch.get_values():
+            self.assertAlmostEqual(value, 1_000_000, delta=100)
+        self.assertEqual(batch.get_values(unit=sut.UNIT.STEPS), list(batch.steps))
+
+    def test_samples_remain_available(self):
+        acquisition = self.ads1115.start_acquisition(config=self.config)
+        time.sleep(0.02)
+        acquisition.stop()
+        # -----------------------------------------------------------------
+        self.assertGreater(len(acquisition.read_available()), 0)
+        self.assertEqual(len(acquisition.read_available()), 0)
+
+    def test_already_running(self):
+        with self.ads1115.start_acquisition(config=self.config):
+            self.assertRaises(RuntimeError, self.ads1115.start_acquisition, config=self.config)
+        # can be restarted once stopped
+        self.ads1115.start_acquisition(config=self.config).stop()
+
+    def test_single_shot_mode(self):
+        config = sut.Ads1115Config(dom=DOM.SSM)
+        self.assertRaises(RuntimeError, self.ads1115.start_acquisition, config=config)
+
+    def test_reader_error(self):
+        ads1115 = sut.Ads1115(i2c_bus=self.i2c_bus)
+        acquisition = ads1115.start_acquisition(config=self.config)
+        # the device disappears from the bus
+        self.i2c_bus._i2c_adr = 0x49
+        acquisition._thread.join(timeout=1.0)
+        # -----------------------------------------------------------------
+        self.assertFalse(acquisition.running)
+        self.assertIsInstance(acquisition.error, OSError)
+        with self.assertRaises(RuntimeError):
+            # samples acquired before the error are returned first
+            while True:
+                acquisition.read_available()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -54,3 +54,9 @@ class TestAds1013Config(unittest.TestCase):
             computed = sut.Ads1115Config(drs=mode).as_uint16()
             expected = config_uint16
             self.assertEqual(computed, expected)
+
+    def test_from_uint16(self):
+        # settings not supported by the ADS1013 are ignored
+        computed = sut.Ads1013Config.from_uint16(0x75E0)
+        expected = sut.Ads1013Config(drs=DRS.MODE7)
+        self.assertEqual(computed, expected)
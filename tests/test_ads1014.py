@@ -76,10 +76,10 @@ class TestAds1014(unittest.TestCase):
 
     @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
     def test_ssc_measurement_in_microvolts(self):
-        self.i2c_bus._state[0x48][0x00] = 0x0001
+        self.i2c_bus._state[0x48][0x00] = 0x0010
         # -----------------------------------------------------------------
         computed = self.ads1014.get_ssc_measurement()
-        expected = 63  # microvolts
+        expected = 1000  # microvolts (12-bit, left-aligned)
         # -----------------------------------------------------------------
         self.assertEqual(expected, computed)
 
@@ -137,8 +137,8 @@ class TestAds1014(unittest.TestCase):
         # -----------------------------------------------------------------
         with BurstHandler(i2c_bus=self.i2c_bus, i2c_adr=self.i2c_adr) as bh:
             self.assertIn(bh.read_register(0x01, byte_count=2), [0x0483, 0x8483])
-            self.assertEqual(bh.read_register(0x10, byte_count=2), 0xA000)
-            self.assertEqual(bh.read_register(0x11, byte_count=2), 0x5FFF)
+            self.assertEqual(bh.read_register(0x02, byte_count=2), 0xA000)
+            self.assertEqual(bh.read_register(0x03, byte_count=2), 0x5FFF)
 
     @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
     def test_ccm_measurement(self):
@@ -156,7 +156,7 @@ class TestAds1014(unittest.TestCase):
         self.ads1014.configure(config=sut.Ads1014Config(dom=sut.DOM.CCM, pga=sut.PGA.MODE1))
         # -----------------------------------------------------------------
         computed = self.ads1014.get_ccm_measurement(unit=UNIT.MICRO)
-        expected = 582518
+        expected = 582000
         # -----------------------------------------------------------------
         self.assertEqual(expected, computed)
 
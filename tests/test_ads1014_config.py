@@ -125,14 +125,14 @@ class TestAds1014Config(unittest.TestCase):
 
     def test_get_atlo_as_microvolts(self):
         computed = sut.Ads1014Config(atlo=0x9FFF).get_atlo(unit=UNIT.MICRO)
-        expected = -1536109
+        expected = -1537000
         self.assertEqual(computed, expected)
 
     def test_set_atlo_using_steps(self):
         config = sut.Ads1014Config()
         config.set_atlo(0x9FFF, unit=UNIT.STEPS)
         computed = config.get_atlo()
-        expected = -1536109
+        expected = -1537000
         self.assertEqual(computed, expected)
 
     def test_set_atlo_using_steps_oor(self):
@@ -142,9 +142,16 @@ class TestAds1014Config(unittest.TestCase):
 
     def test_set_atlo_using_microvolts(self):
         config = sut.Ads1014Config()
-        config.set_atlo(-1536109, unit=UNIT.MICRO)
+        config.set_atlo(-1536000, unit=UNIT.MICRO)
         computed = config.get_atlo()
-        expected = -1536109
+        expected = -1536000
+        self.assertEqual(computed, expected)
+
+    def test_set_atlo_using_microvolts_12bit(self):
+        config = sut.Ads1014Config()
+        config.set_atlo(-1536400, unit=UNIT.MICRO)
+        computed = config.get_atlo(unit=UNIT.STEPS)
+        expected = 0xA000  # 12-bit, left-aligned
         self.assertEqual(computed, expected)
 
     def test_get_athi_as_steps(self):
@@ -154,14 +161,14 @@ class TestAds1014Config(unittest.TestCase):
 
     def test_get_athi_as_microvolts(self):
         computed = sut.Ads1014Config(atlo=0x6000).get_atlo(unit=UNIT.MICRO)
-        expected = 1536047
+        expected = 1536000
         self.assertEqual(computed, expected)
 
     def test_set_athi_using_steps(self):
         config = sut.Ads1014Config()
         config.set_athi(0x6000, unit=UNIT.STEPS)
         computed = config.get_athi()
-        expected = 1536047
+        expected = 1536000
         self.assertEqual(computed, expected)
 
     def test_set_athi_using_steps_oor(self):
@@ -171,7 +178,14 @@ class TestAds1014Config(unittest.TestCase):
 
     def test_set_athi_using_microvolts(self):
         config = sut.Ads1014Config()
-        config.set_athi(1536047, unit=UNIT.MICRO)
+        config.set_athi(1536000, unit=UNIT.MICRO)
         computed = config.get_athi()
-        expected = 1536047
+        expected = 1536000
+        self.assertEqual(computed, expected)
+
+    def test_set_athi_using_microvolts_12bit(self):
+        config = sut.Ads1014Config()
+        config.set_athi(2047000, unit=UNIT.MICRO)
+        computed = config.get_athi(unit=UNIT.STEPS)
+        expected = 0x7FF0  # 12-bit, left-aligned
         self.assertEqual(computed, expected)
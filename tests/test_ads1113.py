@@ -135,8 +135,8 @@ class TestAds1113(unittest.TestCase):
         # -----------------------------------------------------------------
         with BurstHandler(i2c_bus=self.i2c_bus, i2c_adr=self.i2c_adr) as bh:
             self.assertIn(bh.read_register(0x01, byte_count=2), [0x0483, 0x8483])
-            self.assertEqual(bh.read_register(0x10, byte_count=2), 0x8000)
-            self.assertEqual(bh.read_register(0x11, byte_count=2), 0x7FFF)
+            self.assertEqual(bh.read_register(0x02, byte_count=2), 0x8000)
+            self.assertEqual(bh.read_register(0x03, byte_count=2), 0x7FFF)
 
     @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
     def test_ccm_measurement(self):
@@ -164,3 +164,12 @@ class TestAds1113(unittest.TestCase):
         # -----------------------------------------------------------------
         # -----------------------------------------------------------------
         self.assertRaises(RuntimeError, self.ads1113.get_ccm_measurement)
+
+    # ---------------------------------------------------------------------
+
+    def test_configure_rdy(self):
+        config = sut.Ads1113Config()
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        # device has no ALERT/RDY pin
+        self.assertRaises(RuntimeError, self.ads1113.configure_rdy, config=config)
@@ -137,8 +137,8 @@ class TestAds1114(unittest.TestCase):
         # -----------------------------------------------------------------
         with BurstHandler(i2c_bus=self.i2c_bus, i2c_adr=self.i2c_adr) as bh:
             self.assertIn(bh.read_register(0x01, byte_count=2), [0x0483, 0x8483])
-            self.assertEqual(bh.read_register(0x10, byte_count=2), 0xA000)
-            self.assertEqual(bh.read_register(0x11, byte_count=2), 0x5FFF)
+            self.assertEqual(bh.read_register(0x02, byte_count=2), 0xA000)
+            self.assertEqual(bh.read_register(0x03, byte_count=2), 0x5FFF)
 
     @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
     def test_ccm_measurement(self):
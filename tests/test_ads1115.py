@@ -9,7 +9,10 @@ use hardware device:
 """
 
 import os
+import time
 import unittest
+from array import array
+from unittest import mock
 
 # modules board and busio provide no type hints
 import board  # type: ignore
@@ -18,7 +21,13 @@ from feeph.i2c import BurstHandler, EmulatedI2C
 
 import feeph.ads1xxx as sut  # sytem under test
 from feeph.ads1xxx.ads1x1x import DEFAULTS
-from feeph.ads1xxx.conversions import UNIT
+from feeph.ads1xxx.conversions import UNIT, convert_steps_to_microvolts
+
+try:
+    import numpy
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 if os.environ.get('TEST_ADS1115_CHIP', 'n') == 'y':
     HAS_HARDWARE = True
@@ -26,6 +35,49 @@ else:
     HAS_HARDWARE = False
 
 
+class PointerAwareI2C(EmulatedI2C):
+    # EmulatedI2C with a pointer register and a transaction counter
+    # (plain reads return the register selected by the previous write)
+
+    def __init__(self, state: dict[int, dict[int, int]]):
+        super().__init__(state=state)
+        self.pointer: dict[int, int] = {}
+        self.transactions = 0
+
+    def writeto(self, address: int, buffer, *, start: int = 0, end: int | None = None):
+        self.transactions += 1
+        data = bytes(buffer[start:end])
+        self.pointer[address] = data[0]
+        if len(data) > 1:
+            self._state[address][data[0]] = int.from_bytes(data[1:], 'big')
+
+    def readfrom_into(self, address: int, buffer, *, start: int = 0, end: int | None = None):
+        self.transactions += 1
+        end = len(buffer) if end is None else end
+        value = self._state[address][self.pointer[address]]
+        buffer[start:end] = value.to_bytes(end - start, 'big')
+
+    def writeto_then_readfrom(self, address: int, buffer_out, buffer_in, *,
+                              out_start: int = 0, out_end: int | None = None, in_start: int = 0, in_end: int | None = None):
+        # repeated start: a single transaction
+        self.writeto(address, buffer_out, start=out_start, end=out_end)
+        self.readfrom_into(address, buffer_in, start=in_start, end=in_end)
+        self.transactions -= 1
+
+
+class FakeAlertReadyPin:
+    # stand-in for feeph.ads1xxx.alert.AlertReadyPin (no GPIO required)
+
+    def __init__(self, asserts: bool = True):
+        self.asserts = asserts
+
+    def clear(self):
+        pass
+
+    def wait(self, timeout: float) -> bool:
+        return self.asserts
+
+
 class TestAds1115(unittest.TestCase):
 
     def setUp(self):
@@ -37,7 +89,7 @@ class TestAds1115(unittest.TestCase):
             for register, default_value in registers.items():
                 if default_value is None:
                     registers[register] = 0x0000
-            self.i2c_bus = EmulatedI2C(state={self.i2c_adr: registers})
+            self.i2c_bus = PointerAwareI2C(state={self.i2c_adr: registers})
         self.ads1115 = sut.Ads1115(i2c_bus=self.i2c_bus)
 
     def tearDown(self):
@@ -47,6 +99,19 @@ class TestAds1115(unittest.TestCase):
 
     # ---------------------------------------------------------------------
 
+    def test_i2c_address(self):
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        for i2c_adr in [0x48, 0x49, 0x4A, 0x4B]:
+            sut.Ads1115(i2c_bus=self.i2c_bus, i2c_adr=i2c_adr)
+
+    def test_i2c_address_invalid(self):
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        self.assertRaises(ValueError, sut.Ads1115, i2c_bus=self.i2c_bus, i2c_adr=0x4C)
+
+    # ---------------------------------------------------------------------
+
     def test_reset(self):
         with BurstHandler(i2c_bus=self.i2c_bus, i2c_adr=self.i2c_adr) as bh:
             # change writeable registers to non-default values
@@ -137,8 +202,8 @@ class TestAds1115(unittest.TestCase):
         # -----------------------------------------------------------------
         with BurstHandler(i2c_bus=self.i2c_bus, i2c_adr=self.i2c_adr) as bh:
             self.assertIn(bh.read_register(0x01, byte_count=2), [0x0483, 0x8483])
-            self.assertEqual(bh.read_register(0x10, byte_count=2), 0xA000)
-            self.assertEqual(bh.read_register(0x11, byte_count=2), 0x5FFF)
+            self.assertEqual(bh.read_register(0x02, byte_count=2), 0xA000)
+            self.assertEqual(bh.read_register(0x03, byte_count=2), 0x5FFF)
 
     @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
     def test_ccm_measurement(self):
@@ -166,3 +231,385 @@ class TestAds1115(unittest.TestCase):
         # -----------------------------------------------------------------
         # -----------------------------------------------------------------
         self.assertRaises(RuntimeError, self.ads1115.get_ccm_measurement)
+
+    # ---------------------------------------------------------------------
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_wait_for_conversion(self):
+        with BurstHandler(i2c_bus=self.i2c_bus, i2c_adr=self.i2c_adr) as bh:
+            # conversion completed (OS bit is set)
+            bh.write_register(0x01, 0x85E3, byte_count=2)
+            self.ads1115._wait_for_conversion(bh, 0.001304)
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_wait_for_conversion_timeout(self):
+        with BurstHandler(i2c_bus=self.i2c_bus, i2c_adr=self.i2c_adr) as bh:
+            # conversion never completes (OS bit is never set)
+            bh.write_register(0x01, 0x05E3, byte_count=2)
+            self.assertRaises(RuntimeError, self.ads1115._wait_for_conversion, bh, 0.001304)
+
+    # ---------------------------------------------------------------------
+
+    def test_configure_rdy(self):
+        config = sut.Ads1115Config(dom=sut.DOM.CCM)
+        self.assertTrue(self.ads1115.configure_rdy(config=config))
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        with BurstHandler(i2c_bus=self.i2c_bus, i2c_adr=self.i2c_adr) as bh:
+            # comparator is enabled (CQUE.DIS -> CQUE.AA1)
+            self.assertIn(bh.read_register(0x01, byte_count=2), [0x0480, 0x8480])
+            self.assertEqual(bh.read_register(0x02, byte_count=2), 0x0000)
+            self.assertEqual(bh.read_register(0x03, byte_count=2), 0x8000)
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_rdy_measurement(self):
+        self.i2c_bus._state[0x48][0x00] = 0x1234
+        self.ads1115.configure_rdy(config=sut.Ads1115Config())
+        # -----------------------------------------------------------------
+        computed = self.ads1115.get_rdy_measurement(alert=FakeAlertReadyPin(), unit=UNIT.STEPS)  # type: ignore [arg-type]
+        expected = 0x1234
+        # -----------------------------------------------------------------
+        self.assertEqual(expected, computed)
+
+    def test_rdy_measurement_timeout(self):
+        self.ads1115.configure_rdy(config=sut.Ads1115Config(drs=sut.DRS.MODE7))
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        self.assertRaises(RuntimeError, self.ads1115.get_rdy_measurement, alert=FakeAlertReadyPin(asserts=False))
+
+    def test_rdy_measurement_unconfigured(self):
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        self.assertRaises(RuntimeError, self.ads1115.get_rdy_measurement, alert=FakeAlertReadyPin())
+
+    # ---------------------------------------------------------------------
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_stream(self):
+        self.i2c_bus._state[0x48][0x00] = 0x1234
+        config = sut.Ads1115Config(dom=sut.DOM.CCM, pga=sut.PGA.MODE1, drs=sut.DRS.MODE7)
+        # -----------------------------------------------------------------
+        start = time.monotonic_ns()
+        computed = list(self.ads1115.stream(config=config, count=10))
+        # -----------------------------------------------------------------
+        self.assertEqual([value for _, value in computed], [582518] * 10)
+        # samples are paced to the data rate (860 SPS -> 1.16ms)
+        # (a late read shortens the following interval, but no sample is
+        # read before its slot in the schedule)
+        period_ns = 1_000_000_000 // 860
+        for i, (timestamp, _) in enumerate(computed):
+            self.assertGreaterEqual(timestamp - start, (i + 1) * period_ns)
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_stream_steps(self):
+        self.i2c_bus._state[0x48][0x00] = 0x1234
+        config = sut.Ads1115Config(dom=sut.DOM.CCM, drs=sut.DRS.MODE7)
+        # -----------------------------------------------------------------
+        computed = [value for _, value in self.ads1115.stream(config=config, count=2, unit=UNIT.STEPS)]
+        expected = [0x1234, 0x1234]
+        # -----------------------------------------------------------------
+        self.assertEqual(expected, computed)
+
+    def test_stream_conflict(self):
+        config = sut.Ads1115Config(dom=sut.DOM.SSM)
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        # can't stream in singleshot mode
+        self.assertRaises(RuntimeError, next, self.ads1115.stream(config=config))
+
+    # ---------------------------------------------------------------------
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_hot_measurement(self):
+        self.i2c_bus._state[0x48][0x00] = 0x1234
+        self.ads1115.configure(config=sut.Ads1115Config(dom=sut.DOM.CCM, pga=sut.PGA.MODE1))
+        # -----------------------------------------------------------------
+        computed = self.ads1115.get_hot_measurement()
+        expected = 582518
+        # -----------------------------------------------------------------
+        self.assertEqual(expected, computed)
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_hot_measurement_transactions(self):
+        self.ads1115.configure(config=sut.Ads1115Config(dom=sut.DOM.CCM))
+        self.i2c_bus.transactions = 0
+        # -----------------------------------------------------------------
+        for _ in range(3):
+            self.ads1115.get_hot_measurement(unit=UNIT.STEPS)
+        # -----------------------------------------------------------------
+        # pointer is written once, followed by a plain read per sample
+        self.assertEqual(self.i2c_bus.transactions, 4)
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_hot_measurement_pointer_moved(self):
+        self.i2c_bus._state[0x48][0x00] = 0x1234
+        self.ads1115.configure(config=sut.Ads1115Config(dom=sut.DOM.CCM))
+        self.ads1115.get_hot_measurement(unit=UNIT.STEPS)
+        self.ads1115.configure(config=sut.Ads1115Config(dom=sut.DOM.CCM))  # moves the pointer
+        # -----------------------------------------------------------------
+        computed = self.ads1115.get_hot_measurement(unit=UNIT.STEPS)
+        expected = 0x1234
+        # -----------------------------------------------------------------
+        self.assertEqual(expected, computed)
+
+    def test_hot_measurement_unconfigured(self):
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        self.assertRaises(RuntimeError, self.ads1115.get_hot_measurement)
+
+    def test_hot_measurement_conflict(self):
+        self.ads1115.configure(config=sut.Ads1115Config(dom=sut.DOM.SSM))
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        self.assertRaises(RuntimeError, self.ads1115.get_hot_measurement)
+
+    @unittest.skipIf(HAS_HARDWARE, "requires an emulated bus")
+    def test_hot_measurement_bus_locked(self):
+        self.ads1115.configure(config=sut.Ads1115Config(dom=sut.DOM.CCM))
+        # the bus is held by someone else and never released
+        self.i2c_bus.try_lock = lambda: False
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        with mock.patch('feeph.ads1xxx.ads1x1x.LOCK_TIMEOUT', 0.01):
+            self.assertRaises(RuntimeError, self.ads1115.get_hot_measurement)
+            self.ads1115.enable_statistics()
+            self.assertRaises(RuntimeError, self.ads1115.get_hot_measurement)
+        del self.i2c_bus.try_lock
+
+    # ---------------------------------------------------------------------
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_capture_bytearray(self):
+        self.i2c_bus._state[0x48][0x00] = 0x1234
+        self.ads1115.configure(config=sut.Ads1115Config(dom=sut.DOM.CCM, drs=sut.DRS.MODE7))
+        buffer = bytearray(6)
+        # -----------------------------------------------------------------
+        computed = self.ads1115.capture(buffer)
+        # -----------------------------------------------------------------
+        self.assertEqual(computed, 0)  # wrapped around
+        self.assertEqual(buffer, bytearray([0x12, 0x34] * 3))
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_capture_array_ring(self):
+        self.ads1115.configure(config=sut.Ads1115Config(dom=sut.DOM.CCM, drs=sut.DRS.MODE7))
+        ring = array('h', [0] * 4)
+        # -----------------------------------------------------------------
+        self.i2c_bus._state[0x48][0x00] = 0x0001
+        index = self.ads1115.capture(ring, count=3)
+        self.i2c_bus._state[0x48][0x00] = 0x0002
+        computed = self.ads1115.capture(ring, count=2, start=index)
+        # -----------------------------------------------------------------
+        self.assertEqual(computed, 1)
+        # samples are stored as numbers (host byte order)
+        self.assertEqual(list(ring), [2, 1, 1, 2])
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_capture_array_overwritten(self):
+        self.i2c_bus._state[0x48][0x00] = 0x8001
+        self.ads1115.configure(config=sut.Ads1115Config(dom=sut.DOM.CCM, drs=sut.DRS.MODE7))
+        ring = array('H', [0] * 3)
+        # -----------------------------------------------------------------
+        self.ads1115.capture(ring, count=5, start=2)
+        # -----------------------------------------------------------------
+        self.assertEqual(list(ring), [0x8001] * 3)
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    @unittest.skipUnless(HAS_NUMPY, "requires numpy")
+    def test_capture_convert(self):
+        self.i2c_bus._state[0x48][0x00] = 0x8000
+        self.ads1115.configure(config=sut.Ads1115Config(dom=sut.DOM.CCM, drs=sut.DRS.MODE7))
+        expected = [-2048063, -2048063]
+        for buffer in [array('h', [0, 0]), array('H', [0, 0]), bytearray(4), numpy.zeros(2, dtype=numpy.int16)]:
+            with self.subTest(buffer=type(buffer)):
+                # ---------------------------------------------------------
+                self.ads1115.capture(buffer)
+                computed = convert_steps_to_microvolts(buffer, pga=sut.PGA.MODE2).tolist()
+                # ---------------------------------------------------------
+                self.assertEqual(computed, expected)
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_capture_transactions(self):
+        self.ads1115.configure(config=sut.Ads1115Config(dom=sut.DOM.CCM, drs=sut.DRS.MODE7))
+        self.i2c_bus.transactions = 0
+        # -----------------------------------------------------------------
+        self.ads1115.capture(bytearray(8))
+        # -----------------------------------------------------------------
+        # pointer is written once, followed by a plain read per sample
+        self.assertEqual(self.i2c_bus.transactions, 5)
+
+    def test_capture_invalid(self):
+        self.ads1115.configure(config=sut.Ads1115Config(dom=sut.DOM.CCM))
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        self.assertRaises(ValueError, self.ads1115.capture, bytearray(1))
+        self.assertRaises(ValueError, self.ads1115.capture, bytearray(4), start=2)
+        self.assertRaises(TypeError, self.ads1115.capture, bytes(4))  # read-only
+        self.assertRaises(ValueError, self.ads1115.capture, array('i', [0, 0]))  # 4-byte items
+
+    def test_capture_conflict(self):
+        self.ads1115.configure(config=sut.Ads1115Config(dom=sut.DOM.SSM))
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        self.assertRaises(RuntimeError, self.ads1115.capture, bytearray(4))
+
+    # ---------------------------------------------------------------------
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_shadow_registers_ssc(self):
+        config = sut.Ads1115Config()
+        self.ads1115.get_ssc_measurement(config=config)
+        self.i2c_bus.transactions = 0
+        # -----------------------------------------------------------------
+        self.ads1115.get_ssc_measurement(config=config)
+        # -----------------------------------------------------------------
+        # start conversion, poll OS bit, read conversion register
+        self.assertEqual(self.i2c_bus.transactions, 3)
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_shadow_registers_mux_scan(self):
+        config1 = sut.Ads1115Config(mux=sut.MUX.MODE4)
+        config2 = sut.Ads1115Config(mux=sut.MUX.MODE5)
+        self.ads1115.get_ssc_measurement(config=config1)
+        self.i2c_bus.transactions = 0
+        # -----------------------------------------------------------------
+        self.ads1115.get_ssc_measurement(config=config2)
+        self.ads1115.get_ssc_measurement(config=config1)
+        # -----------------------------------------------------------------
+        # thresholds are unchanged and need not be written
+        self.assertEqual(self.i2c_bus.transactions, 6)
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_shadow_registers_configure(self):
+        config = sut.Ads1115Config(dom=sut.DOM.CCM)
+        self.ads1115.configure(config=config)
+        self.i2c_bus.transactions = 0
+        # -----------------------------------------------------------------
+        self.ads1115.configure(config=config)
+        # -----------------------------------------------------------------
+        self.assertEqual(self.i2c_bus.transactions, 0)
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_shadow_registers_thresholds(self):
+        config = sut.Ads1115Config(dom=sut.DOM.CCM)
+        self.ads1115.configure(config=config)
+        config.set_athi(0x5FFF, unit=UNIT.STEPS)
+        self.i2c_bus.transactions = 0
+        # -----------------------------------------------------------------
+        self.ads1115.configure(config=config)
+        # -----------------------------------------------------------------
+        # disable alerting, write hi_thresh, restore config register
+        self.assertEqual(self.i2c_bus.transactions, 3)
+        with BurstHandler(i2c_bus=self.i2c_bus, i2c_adr=self.i2c_adr) as bh:
+            self.assertEqual(bh.read_register(0x01, byte_count=2), 0x0483)
+            self.assertEqual(bh.read_register(0x03, byte_count=2), 0x5FFF)
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_shadow_registers_invalidate(self):
+        config = sut.Ads1115Config(dom=sut.DOM.CCM)
+        self.ads1115.configure(config=config)
+        # device is reconfigured behind our back
+        with BurstHandler(i2c_bus=self.i2c_bus, i2c_adr=self.i2c_adr) as bh:
+            bh.write_register(0x01, 0x0583, byte_count=2)
+        # -----------------------------------------------------------------
+        self.ads1115.invalidate_shadow_registers()
+        self.ads1115.configure(config=config)
+        # -----------------------------------------------------------------
+        with BurstHandler(i2c_bus=self.i2c_bus, i2c_adr=self.i2c_adr) as bh:
+            self.assertEqual(bh.read_register(0x01, byte_count=2), 0x0483)
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_shadow_registers_reset(self):
+        self.ads1115.configure(config=sut.Ads1115Config(dom=sut.DOM.CCM))
+        self.ads1115.reset_device_registers()
+        self.i2c_bus.transactions = 0
+        # -----------------------------------------------------------------
+        self.ads1115.configure(config=sut.Ads1115Config())
+        # -----------------------------------------------------------------
+        # registers are known to contain their defaults
+        self.assertEqual(self.i2c_bus.transactions, 0)
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_get_config_from_shadow_registers(self):
+        config = sut.Ads1115Config(dom=sut.DOM.CCM, drs=sut.DRS.MODE7, atlo=0x9FFF, athi=0x5FFF)
+        self.ads1115.configure(config=config)
+        self.i2c_bus.transactions = 0
+        # -----------------------------------------------------------------
+        computed = self.ads1115.get_config()
+        # -----------------------------------------------------------------
+        self.assertEqual(computed, config)
+        self.assertEqual(self.i2c_bus.transactions, 0)
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_get_config_from_device(self):
+        # device is configured behind our back
+        with BurstHandler(i2c_bus=self.i2c_bus, i2c_adr=self.i2c_adr) as bh:
+            bh.write_register(0x01, 0x8483, byte_count=2)
+            bh.write_register(0x02, 0x9FFF, byte_count=2)
+        self.ads1115.invalidate_shadow_registers()
+        # -----------------------------------------------------------------
+        computed = self.ads1115.get_config()
+        # -----------------------------------------------------------------
+        # the OS bit is a status bit and not part of the configuration
+        expected = sut.Ads1115Config(dom=sut.DOM.CCM, atlo=0x9FFF)
+        self.assertEqual(computed, expected)
+
+    # ---------------------------------------------------------------------
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_prepared_measurement(self):
+        self.i2c_bus._state[0x48][0x00] = 0x1234
+        prepared = self.ads1115.prepare(config=sut.Ads1115Config(pga=sut.PGA.MODE1))
+        # -----------------------------------------------------------------
+        computed = prepared.measure()
+        expected = 582518
+        # -----------------------------------------------------------------
+        self.assertEqual(expected, computed)
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_prepared_measurement_negative(self):
+        self.i2c_bus._state[0x48][0x00] = 0x8000
+        prepared = self.ads1115.prepare(config=sut.Ads1115Config())
+        # -----------------------------------------------------------------
+        computed = prepared.measure()
+        expected = -2048063
+        # -----------------------------------------------------------------
+        self.assertEqual(expected, computed)
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_prepared_measurement_steps(self):
+        self.i2c_bus._state[0x48][0x00] = 0x1234
+        prepared = self.ads1115.prepare(config=sut.Ads1115Config())
+        # -----------------------------------------------------------------
+        computed = prepared.measure(unit=UNIT.STEPS)
+        expected = 0x1234
+        # -----------------------------------------------------------------
+        self.assertEqual(expected, computed)
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_prepared_measurement_frozen(self):
+        self.i2c_bus._state[0x48][0x00] = 0x1234
+        config = sut.Ads1115Config(pga=sut.PGA.MODE1).freeze()
+        # -----------------------------------------------------------------
+        prepared = self.ads1115.prepare(config=config)
+        # -----------------------------------------------------------------
+        # frozen configurations are prepared once
+        self.assertIs(self.ads1115.prepare(config=sut.Ads1115Config(pga=sut.PGA.MODE1).freeze()), prepared)
+        self.assertEqual(prepared.measure(), 582518)
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_prepared_measurement_transactions(self):
+        prepared = self.ads1115.prepare(config=sut.Ads1115Config())
+        prepared.measure()
+        self.i2c_bus.transactions = 0
+        # -----------------------------------------------------------------
+        prepared.measure()
+        # -----------------------------------------------------------------
+        # start conversion, poll OS bit, read conversion register
+        self.assertEqual(self.i2c_bus.transactions, 3)
+
+    def test_prepared_measurement_conflict(self):
+        config_ccm = sut.Ads1115Config(dom=sut.DOM.CCM)
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        # can't use singleshot with continuous conversion mode
+        self.assertRaises(RuntimeError, self.ads1115.prepare, config=config_ccm)
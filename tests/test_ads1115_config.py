@@ -118,6 +118,39 @@ class TestAds1115Config(unittest.TestCase):
             expected = config_uint16
             self.assertEqual(computed, expected)
 
+    # ---------------------------------------------------------------------
+    # decode
+    # ---------------------------------------------------------------------
+
+    def test_from_uint16_default(self):
+        computed = sut.Ads1115Config.from_uint16(0x0583)
+        expected = sut.Ads1115Config()
+        self.assertEqual(computed, expected)
+
+    def test_from_uint16_roundtrip(self):
+        configs = [
+            sut.Ads1115Config(mux=MUX.MODE7, pga=PGA.MODE5, dom=DOM.CCM, drs=DRS.MODE7),
+            sut.Ads1115Config(cmod=CMOD.WND, cpol=CPOL.AHI, clat=CLAT.LAT, cque=CQUE.AA4),
+        ]
+        for config in configs:
+            computed = sut.Ads1115Config.from_uint16(config.as_uint16())
+            self.assertEqual(computed, config)
+
+    def test_from_uint16_status(self):
+        # OS bit set = no conversion in progress (not a request to start one)
+        computed = sut.Ads1115Config.from_uint16(0x8583)
+        self.assertEqual(computed.ssc, SSC.NO_OP)
+        self.assertEqual(computed, sut.Ads1115Config())
+
+    def test_from_uint16_thresholds(self):
+        config = sut.Ads1115Config.from_uint16(0x0583, atlo=0x9FFF, athi=0x5FFF)
+        self.assertEqual(config.get_atlo(unit=UNIT.STEPS), 0x9FFF)
+        self.assertEqual(config.get_athi(unit=UNIT.STEPS), 0x5FFF)
+
+    def test_from_uint16_out_of_range(self):
+        self.assertRaises(ValueError, sut.Ads1115Config.from_uint16, 0x10000)
+        self.assertRaises(ValueError, sut.Ads1115Config.from_uint16, -1)
+
     def test_get_atlo_as_steps(self):
         computed = sut.Ads1115Config(atlo=0x9FFF).get_atlo(unit=UNIT.STEPS)
         expected = 0x9FFF
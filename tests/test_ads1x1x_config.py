@@ -3,6 +3,9 @@
 import unittest
 
 import feeph.ads1xxx.ads1x1x as sut  # sytem under test
+from feeph.ads1xxx.ads1015 import Ads1015Config
+from feeph.ads1xxx.ads1115 import Ads1115Config
+from feeph.ads1xxx.settings import DOM, MUX, PGA
 
 
 class IncompleteConfig(sut.Ads1x1xConfig):
@@ -38,3 +41,40 @@ class TestAds1x1xConfig(unittest.TestCase):
 
     def test_abstract_method3(self):
         self.assertRaises(TypeError, IncompleteConfig().get_athi(unit=sut.UNIT.STEPS))
+
+
+class TestFrozenConfig(unittest.TestCase):
+
+    def test_register_values(self):
+        config = Ads1115Config(mux=MUX.MODE4, pga=PGA.MODE1, atlo=0x9FFF, athi=0x5FFF)
+        frozen = config.freeze()
+        self.assertEqual(frozen.as_uint16(), config.as_uint16())
+        self.assertEqual(frozen.get_atlo(unit=sut.UNIT.STEPS), 0x9FFF)
+        self.assertEqual(frozen.get_athi(unit=sut.UNIT.STEPS), 0x5FFF)
+        self.assertEqual(frozen.get_atlo(unit=sut.UNIT.MICRO), config.get_atlo(unit=sut.UNIT.MICRO))
+        self.assertEqual(frozen.get_athi(unit=sut.UNIT.MICRO), config.get_athi(unit=sut.UNIT.MICRO))
+
+    def test_immutable(self):
+        config = Ads1115Config()
+        frozen = config.freeze()
+        # changing the original does not affect the frozen copy
+        config.dom = DOM.CCM
+        self.assertEqual(frozen.as_uint16(), 0x0583)
+        self.assertRaises(AttributeError, setattr, frozen, 'config_uint', 0x0483)
+
+    def test_hashable(self):
+        configs = {
+            Ads1115Config(mux=MUX.MODE4).freeze(): 'AIN0',
+            Ads1115Config(mux=MUX.MODE5).freeze(): 'AIN1',
+        }
+        self.assertEqual(configs[Ads1115Config(mux=MUX.MODE5).freeze()], 'AIN1')
+        # same register values, different resolution
+        self.assertNotEqual(Ads1115Config().freeze(), Ads1015Config().freeze())
+
+    def test_freeze_and_thaw(self):
+        config = Ads1115Config(mux=MUX.MODE4)
+        frozen = config.freeze()
+        self.assertIs(frozen.freeze(), frozen)
+        thawed = frozen.thaw()
+        self.assertEqual(thawed, config)
+        self.assertIsNot(thawed, config)
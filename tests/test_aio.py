@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+test AsyncAds1x1x
+
+use simulated device:
+  pdm run pytest
+use hardware device:
+  TEST_ADS1115_CHIP=y pdm run pytest
+"""
+
+import asyncio
+import gc
+import os
+import unittest
+
+# modules board and busio provide no type hints
+import board  # type: ignore
+import busio  # type: ignore
+from feeph.i2c import BurstHandler, EmulatedI2C
+
+import feeph.ads1xxx as sut  # sytem under test
+import feeph.ads1xxx.aio as aio
+from feeph.ads1xxx.ads1x1x import DEFAULTS
+from feeph.ads1xxx.aio import AsyncAds1x1x
+from feeph.ads1xxx.conversions import UNIT
+
+if os.environ.get('TEST_ADS1115_CHIP', 'n') == 'y':
+    HAS_HARDWARE = True
+else:
+    HAS_HARDWARE = False
+
+
+class TestAsyncAds1x1x(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.i2c_adr = 0x48
+        if HAS_HARDWARE:
+            self.i2c_bus = busio.I2C(scl=board.SCL, sda=board.SDA)
+        else:
+            registers = DEFAULTS.copy()
+            for register, default_value in registers.items():
+                if default_value is None:
+                    registers[register] = 0x0000
+            self.i2c_bus = EmulatedI2C(state={self.i2c_adr: registers})
+        self.ads1115 = AsyncAds1x1x(device=sut.Ads1115(i2c_bus=self.i2c_bus))
+
+    async def asyncTearDown(self):
+        # restore original state after each run
+        # (hardware is not stateless)
+        await self.ads1115.reset_device_registers()
+
+    # ---------------------------------------------------------------------
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    async def test_ssc_measurement(self):
+        self.i2c_bus._state[0x48][0x00] = 0x1234
+        # -----------------------------------------------------------------
+        computed = await self.ads1115.get_ssc_measurement(config=sut.Ads1115Config(pga=sut.PGA.MODE1))
+        expected = 582518
+        # -----------------------------------------------------------------
+        self.assertEqual(expected, computed)
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    async def test_ssc_measurement_concurrent(self):
+        self.i2c_bus._state[0x48][0x00] = 0x1234
+        config = sut.Ads1115Config()
+        # -----------------------------------------------------------------
+        computed = await asyncio.gather(*[self.ads1115.get_ssc_measurement(config=config, unit=UNIT.STEPS) for _ in range(4)])
+        expected = [0x1234] * 4
+        # -----------------------------------------------------------------
+        self.assertEqual(expected, computed)
+
+    async def test_ssc_measurement_conflict(self):
+        config_ccm = sut.Ads1115Config(dom=sut.DOM.CCM)
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        with self.assertRaises(RuntimeError):
+            await self.ads1115.get_ssc_measurement(config=config_ccm)
+
+    async def test_ssc_measurement_timeout(self):
+        config = sut.Ads1115Config(drs=sut.DRS.MODE7)
+        await self.ads1115.get_ssc_measurement(config=config)
+        # conversion never completes (OS bit is never set)
+        self.ads1115._start_conversion = lambda config: 0x05E3  # type: ignore [method-assign]
+        with BurstHandler(i2c_bus=self.i2c_bus, i2c_adr=self.i2c_adr) as bh:
+            bh.write_register(0x01, 0x05E3, byte_count=2)
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        with self.assertRaises(RuntimeError):
+            await self.ads1115.get_ssc_measurement()
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    async def test_ccm_measurement(self):
+        self.i2c_bus._state[0x48][0x00] = 0x1234
+        await self.ads1115.configure(config=sut.Ads1115Config(dom=sut.DOM.CCM))
+        # -----------------------------------------------------------------
+        computed = await self.ads1115.get_ccm_measurement(unit=UNIT.STEPS)
+        expected = 0x1234
+        # -----------------------------------------------------------------
+        self.assertEqual(expected, computed)
+
+
+class TestEventLoops(unittest.TestCase):
+
+    def test_consecutive_event_loops(self):
+        registers = {register: 0x0000 if value is None else value for register, value in DEFAULTS.items()}
+        registers[0x00] = 0x1234
+        i2c_bus = EmulatedI2C(state={0x48: registers, 0x49: registers.copy()})
+        devices = [AsyncAds1x1x(device=sut.Ads1115(i2c_bus=i2c_bus, i2c_adr=i2c_adr)) for i2c_adr in (0x48, 0x49)]
+        config = sut.Ads1115Config(pga=sut.PGA.MODE1, drs=sut.DRS.MODE7)
+
+        async def measure() -> list[int]:
+            # both devices contend for the same bus
+            return await asyncio.gather(*[device.get_ssc_measurement(config=config) for device in devices * 2])
+
+        # -----------------------------------------------------------------
+        for _ in range(2):
+            computed = asyncio.run(measure())
+            # -------------------------------------------------------------
+            self.assertEqual(computed, [582518] * 4)
+
+    def test_executor_shutdown(self):
+        i2c_bus = EmulatedI2C(state={0x48: DEFAULTS.copy()})
+        executor = aio._get_bus_resources(i2c_bus).executor
+        # -----------------------------------------------------------------
+        del i2c_bus
+        gc.collect()
+        # -----------------------------------------------------------------
+        self.assertRaises(RuntimeError, executor.submit, print)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+test the ALERT/RDY pin
+
+The GPIO line request is replaced with a mock (no GPIO required).
+"""
+
+import unittest
+from unittest import mock
+
+from gpiod.line import Bias, Edge
+
+import feeph.ads1xxx.alert as sut  # sytem under test
+from feeph.ads1xxx.settings import CPOL
+
+
+class TestAlertReadyPin(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch('gpiod.request_lines')
+        self.request_lines = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.request = self.request_lines.return_value
+
+    # ---------------------------------------------------------------------
+
+    def test_request(self):
+        sut.AlertReadyPin(chip_path='/dev/gpiochip0', line_offset=17)
+        # -----------------------------------------------------------------
+        self.request_lines.assert_called_once()
+        self.assertEqual(self.request_lines.call_args.args, ('/dev/gpiochip0',))
+        settings = self.request_lines.call_args.kwargs['config'][17]
+        self.assertEqual(settings.edge_detection, Edge.FALLING)
+        self.assertEqual(settings.bias, Bias.PULL_UP)
+
+    def test_request_active_high(self):
+        sut.AlertReadyPin(chip_path='/dev/gpiochip0', line_offset=17, cpol=CPOL.AHI)
+        # -----------------------------------------------------------------
+        settings = self.request_lines.call_args.kwargs['config'][17]
+        self.assertEqual(settings.edge_detection, Edge.RISING)
+
+    def test_wait_edge(self):
+        self.request.wait_edge_events.return_value = True
+        alert = sut.AlertReadyPin(chip_path='/dev/gpiochip0', line_offset=17)
+        # -----------------------------------------------------------------
+        computed = alert.wait(timeout=0.01)
+        # -----------------------------------------------------------------
+        self.assertTrue(computed)
+        self.request.wait_edge_events.assert_called_once_with(timeout=0.01)
+        # the event is consumed
+        self.request.read_edge_events.assert_called_once()
+
+    def test_wait_timeout(self):
+        self.request.wait_edge_events.return_value = False
+        alert = sut.AlertReadyPin(chip_path='/dev/gpiochip0', line_offset=17)
+        # -----------------------------------------------------------------
+        computed = alert.wait(timeout=0.01)
+        # -----------------------------------------------------------------
+        self.assertFalse(computed)
+        self.request.read_edge_events.assert_not_called()
+
+    def test_clear(self):
+        self.request.wait_edge_events.side_effect = [True, True, False]
+        alert = sut.AlertReadyPin(chip_path='/dev/gpiochip0', line_offset=17)
+        # -----------------------------------------------------------------
+        alert.clear()
+        # -----------------------------------------------------------------
+        self.assertEqual(self.request.read_edge_events.call_count, 2)
+        self.request.wait_edge_events.assert_called_with(timeout=0)
+
+    def test_close(self):
+        with sut.AlertReadyPin(chip_path='/dev/gpiochip0', line_offset=17):
+            pass
+        # -----------------------------------------------------------------
+        self.request.release.assert_called_once()
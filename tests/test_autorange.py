@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+test the automatic gain selection
+"""
+
+import unittest
+
+import feeph.ads1xxx as sut  # sytem under test
+import feeph.ads1xxx.simulation as sim
+from feeph.ads1xxx.capabilities import DRS_SPS_ADS101X
+from feeph.ads1xxx.settings import DOM, DRS, MUX, PGA
+
+
+class TestAutoRange(unittest.TestCase):
+
+    def setUp(self):
+        self.signals = {
+            MUX.MODE4: sim.ConstantSignal(voltage=0.1),
+            MUX.MODE5: sim.ConstantSignal(voltage=3.0),
+            MUX.MODE6: sim.ConstantSignal(voltage=1.7),
+            MUX.MODE7: sim.ConstantSignal(voltage=1.9),
+        }
+        self.i2c_bus = sim.SimulatedAds1x1x(signals=self.signals)
+        self.ads1115 = sut.Ads1115(i2c_bus=self.i2c_bus)
+        self.auto_range = sut.AutoRange(device=self.ads1115)
+
+    def _measure(self, mux: MUX, pga: PGA = PGA.MODE2, unit: sut.UNIT = sut.UNIT.MICRO):
+        config = sut.Ads1115Config(mux=mux, pga=pga, drs=DRS.MODE7)
+        return self.auto_range.measure(config=config, unit=unit)
+
+    # ---------------------------------------------------------------------
+
+    def test_raise_gain(self):
+        first = self._measure(MUX.MODE4)
+        # -----------------------------------------------------------------
+        # the result is valid, the higher gain is used for the next measurement
+        self.assertEqual(first.pga, PGA.MODE2)
+        self.assertEqual(first.conversions, 1)
+        self.assertEqual(self.auto_range.get_gain(MUX.MODE4), PGA.MODE5)
+        second = self._measure(MUX.MODE4)
+        self.assertEqual(second.pga, PGA.MODE5)
+        self.assertEqual(second.conversions, 1)
+        self.assertAlmostEqual(second.value, 100_000, delta=10)
+
+    def test_clipped(self):
+        first = self._measure(MUX.MODE5)
+        second = self._measure(MUX.MODE5)
+        # -----------------------------------------------------------------
+        # the clipped result is measured again with a lower gain
+        self.assertEqual(first.pga, PGA.MODE1)
+        self.assertEqual(first.conversions, 2)
+        self.assertFalse(first.clipped)
+        self.assertAlmostEqual(first.value, 3_000_000, delta=200)
+        # the gain is remembered
+        self.assertEqual(second.pga, PGA.MODE1)
+        self.assertEqual(second.conversions, 1)
+
+    def test_lower_gain(self):
+        first = self._measure(MUX.MODE7)
+        # -----------------------------------------------------------------
+        # close to the full-scale range but not clipped
+        self.assertEqual(first.pga, PGA.MODE2)
+        self.assertEqual(first.conversions, 1)
+        self.assertEqual(self.auto_range.get_gain(MUX.MODE7), PGA.MODE1)
+
+    def test_hysteresis(self):
+        # 1.7V fits PGA.MODE1 (±4.096V) and PGA.MODE2 (±2.048V)
+        for pga in (PGA.MODE1, PGA.MODE2):
+            with self.subTest(pga=pga):
+                self.auto_range.reset()
+                for _ in range(3):
+                    self.assertEqual(self._measure(MUX.MODE6, pga=pga).pga, pga)
+
+    def test_channels(self):
+        for _ in range(2):
+            self._measure(MUX.MODE4)
+            self._measure(MUX.MODE5)
+        # -----------------------------------------------------------------
+        self.assertEqual(self.auto_range.get_gain(MUX.MODE4), PGA.MODE5)
+        self.assertEqual(self.auto_range.get_gain(MUX.MODE5), PGA.MODE1)
+        self.assertIsNone(self.auto_range.get_gain(MUX.MODE6))
+
+    def test_exceeds_range(self):
+        self.signals[MUX.MODE5].voltage = 7.0
+        # -----------------------------------------------------------------
+        computed = self._measure(MUX.MODE5)
+        # -----------------------------------------------------------------
+        self.assertEqual(computed.pga, PGA.MODE0)
+        self.assertEqual(computed.conversions, 3)
+        self.assertTrue(computed.clipped)
+
+    def test_gain_range(self):
+        self.auto_range = sut.AutoRange(device=self.ads1115, min_gain=PGA.MODE2, max_gain=PGA.MODE3)
+        # -----------------------------------------------------------------
+        computed = self._measure(MUX.MODE5)
+        self._measure(MUX.MODE4)
+        # -----------------------------------------------------------------
+        self.assertEqual(computed.pga, PGA.MODE2)
+        self.assertTrue(computed.clipped)
+        self.assertEqual(self.auto_range.get_gain(MUX.MODE4), PGA.MODE3)
+
+    def test_steps(self):
+        self._measure(MUX.MODE4)
+        computed = self._measure(MUX.MODE4, unit=sut.UNIT.STEPS)
+        # 0.1V / 0.256V * 32767
+        self.assertAlmostEqual(computed.value, 12800, delta=2)
+
+    def test_single_shot_only(self):
+        config = sut.Ads1115Config(mux=MUX.MODE4, dom=DOM.CCM)
+        self.assertRaises(RuntimeError, self.auto_range.measure, config=config)
+
+    def test_invalid_gain_range(self):
+        self.assertRaises(ValueError, sut.AutoRange, device=self.ads1115, min_gain=PGA.MODE3, max_gain=PGA.MODE2)
+        self.assertRaises(ValueError, sut.AutoRange, device=self.ads1115, max_gain=PGA.MODE7)
+
+    def test_no_pga(self):
+        ads1113 = sut.Ads1113(i2c_bus=self.i2c_bus)
+        self.assertRaises(ValueError, sut.AutoRange, device=ads1113)
+
+
+class TestAutoRange12Bit(unittest.TestCase):
+
+    def test_clipped(self):
+        i2c_bus = sim.SimulatedAds1x1x(drs_sps=DRS_SPS_ADS101X, resolution=12,
+                                       signals={MUX.MODE0: sim.ConstantSignal(voltage=3.0)})
+        ads1015 = sut.Ads1015(i2c_bus=i2c_bus)
+        auto_range = sut.AutoRange(device=ads1015)
+        config = sut.Ads1015Config(mux=MUX.MODE0, drs=DRS.MODE6)
+        # -----------------------------------------------------------------
+        computed = auto_range.measure(config=config)
+        # -----------------------------------------------------------------
+        self.assertEqual(computed.pga, PGA.MODE1)
+        self.assertEqual(computed.conversions, 2)
+        self.assertEqual(computed.value, 3_000_000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+import unittest
+
+import feeph.ads1xxx as sut  # sytem under test
+import feeph.ads1xxx.capabilities as caps
+from feeph.ads1xxx.settings import DRS
+
+
+class TestCapabilities(unittest.TestCase):
+
+    def test_models(self):
+        values = {
+            # fmt: off
+            sut.Ads1013: (12, 3300, False, False, False),
+            sut.Ads1014: (12, 3300, False, True,  True),
+            sut.Ads1015: (12, 3300, True,  True,  True),
+            sut.Ads1113: (16, 860,  False, False, False),
+            sut.Ads1114: (16, 860,  False, True,  True),
+            sut.Ads1115: (16, 860,  True,  True,  True),
+            # fmt: on
+        }
+        for model, (resolution, max_sps, has_mux, has_pga, has_comparator) in values.items():
+            capabilities = model.capabilities
+            self.assertEqual(capabilities.name, model.__name__.upper())
+            self.assertEqual(capabilities.resolution, resolution)
+            self.assertEqual(capabilities.drs_sps[DRS.MODE7], max_sps)
+            self.assertEqual(capabilities.has_mux, has_mux)
+            self.assertEqual(capabilities.has_pga, has_pga)
+            self.assertEqual(capabilities.has_comparator, has_comparator)
+
+    def test_conversion_time(self):
+        for capabilities in (caps.ADS1015, caps.ADS1115):
+            self.assertEqual(set(capabilities.conversion_time), set(DRS))
+            for drs in DRS:
+                config_uint = 0x0503 | drs.value
+                expected = caps.CONVERSION_MARGIN / capabilities.drs_sps[drs] + caps.CONVERSION_WAKEUP
+                self.assertEqual(capabilities.conversion_time[drs], expected)
+                self.assertEqual(capabilities.get_conversion_time(config_uint), expected)
+
+    def test_data_rate(self):
+        for capabilities in (caps.ADS1015, caps.ADS1115):
+            for drs in DRS:
+                config_uint = 0x0503 | drs.value
+                computed = capabilities.get_data_rate(config_uint)
+                self.assertEqual(computed, capabilities.drs_sps[drs])
+
+    def test_immutable(self):
+        self.assertRaises(AttributeError, setattr, caps.ADS1115, 'has_mux', False)
+
+
+class TestConversionTime(unittest.TestCase):
+
+    def test_ads101x(self):
+        values = {
+            # fmt: off
+            DRS.MODE0: 0.008619,  # 128 SPS
+            DRS.MODE4: 0.000713,  # 1600 SPS
+            DRS.MODE7: 0.000358,  # 3300 SPS
+            # fmt: on
+        }
+        for drs, expected in values.items():
+            computed = caps.ADS1015.get_conversion_time(0x0503 | drs.value)
+            self.assertAlmostEqual(computed, expected, places=6)
+
+    def test_ads111x(self):
+        values = {
+            # fmt: off
+            DRS.MODE0: 0.137525,  # 8 SPS
+            DRS.MODE4: 0.008619,  # 128 SPS
+            DRS.MODE7: 0.001304,  # 860 SPS
+            # fmt: on
+        }
+        for drs, expected in values.items():
+            computed = caps.ADS1115.get_conversion_time(0x0503 | drs.value)
+            self.assertAlmostEqual(computed, expected, places=6)
@@ -1,10 +1,17 @@
 #!/usr/bin/env python3
 
 import unittest
+from array import array
 
 import feeph.ads1xxx.conversions as sut  # sytem under test
 from feeph.ads1xxx.settings import PGA
 
+try:
+    import numpy
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 # flake8: noqa: E131
 
 
@@ -233,3 +240,202 @@ class TestConvertToStep(unittest.TestCase):
             computed = sut.convert_microvolts_to_step(microvolt, PGA.MODE7)
             expected = step
             self.assertEqual(computed, expected)
+
+
+@unittest.skipUnless(HAS_NUMPY, "requires numpy")
+class TestConvertStepsVectorized(unittest.TestCase):
+
+    def test_same_as_scalar(self):
+        steps = numpy.arange(0x0000, 0x10000, dtype=numpy.uint16)
+        for pga in PGA:
+            computed = sut.convert_steps_to_microvolts(steps, pga)
+            expected = [sut.convert_step_to_microvolts(int(step), pga) for step in steps]
+            self.assertEqual(computed.dtype, numpy.int32)
+            self.assertEqual(computed.tolist(), expected)
+
+    def test_array(self):
+        steps = array('H', [0x8000, 0x0001, 0x7FFF])
+        # -----------------------------------------------------------------
+        computed = sut.convert_steps_to_microvolts(steps, PGA.MODE2).tolist()
+        expected = [-2048063, 63, 2048000]
+        # -----------------------------------------------------------------
+        self.assertEqual(computed, expected)
+
+    def test_array_signed(self):
+        numbers = array('h', [-32768, 1, 32767])
+        # -----------------------------------------------------------------
+        computed = sut.convert_steps_to_microvolts(numbers, PGA.MODE2).tolist()
+        expected = [-2048063, 63, 2048000]
+        # -----------------------------------------------------------------
+        self.assertEqual(computed, expected)
+
+    def test_big_endian_buffer(self):
+        buffer = bytes([0x80, 0x00, 0x00, 0x01, 0x7F, 0xFF])
+        # -----------------------------------------------------------------
+        computed = sut.convert_steps_to_microvolts(buffer, PGA.MODE2).tolist()
+        expected = [-2048063, 63, 2048000]
+        # -----------------------------------------------------------------
+        self.assertEqual(computed, expected)
+
+    def test_big_endian_memoryview(self):
+        # memoryview of a byte buffer filled by 'Ads1x1x.capture()'
+        buffer = bytearray([0x80, 0x00, 0x00, 0x01, 0x7F, 0xFF])
+        # -----------------------------------------------------------------
+        computed = sut.convert_steps_to_microvolts(memoryview(buffer), PGA.MODE2).tolist()
+        expected = [-2048063, 63, 2048000]
+        # -----------------------------------------------------------------
+        self.assertEqual(computed, expected)
+
+    def test_typed_memoryview(self):
+        # memoryview of an array filled by 'Ads1x1x.capture()' (host byte order)
+        ring = array('h', [-32768, 1, 32767])
+        # -----------------------------------------------------------------
+        computed = sut.convert_steps_to_microvolts(memoryview(ring), PGA.MODE2).tolist()
+        expected = [-2048063, 63, 2048000]
+        # -----------------------------------------------------------------
+        self.assertEqual(computed, expected)
+
+    def test_volts(self):
+        steps = numpy.array([0x8000, 0x0001, 0x7FFF])
+        # -----------------------------------------------------------------
+        computed = sut.convert_steps_to_volts(steps, PGA.MODE2).tolist()
+        expected = [-2.048063, 0.000063, 2.048]
+        # -----------------------------------------------------------------
+        self.assertEqual(computed, expected)
+
+    def test_oor(self):
+        self.assertRaises(ValueError, sut.convert_steps_to_microvolts, numpy.array([0x10000]), PGA.MODE2)
+        self.assertRaises(ValueError, sut.convert_steps_to_microvolts, numpy.array([-1]), PGA.MODE2)
+
+    def test_invalid_dtype(self):
+        self.assertRaises(ValueError, sut.convert_steps_to_microvolts, numpy.array([1.0]), PGA.MODE2)
+
+
+class TestMicrovoltTable(unittest.TestCase):
+
+    def test_same_as_scalar(self):
+        # table, scalar conversion and the arithmetic agree for all steps
+        for resolution in sut.RESOLUTIONS:
+            shift = 16 - resolution
+            for pga in PGA:
+                with self.subTest(resolution=resolution, pga=pga):
+                    table = sut.get_microvolt_table(pga, resolution=resolution)
+                    self.assertEqual(len(table), 0x10000 >> shift)
+                    scale = sut.get_microvolts_per_step(pga, resolution=resolution)
+                    for step in range(0x0000, 0x10000, 1 << shift):
+                        expected = round((sut.convert_sint16_to_number(step) >> shift) * scale)
+                        self.assertEqual(table[step >> shift], expected)
+                        self.assertEqual(sut.convert_step_to_microvolts(step, pga, resolution=resolution), expected)
+
+    def test_cached(self):
+        self.assertIs(sut.get_microvolt_table(PGA.MODE2), sut.get_microvolt_table(PGA.MODE2))
+        # identical voltage ranges share the same table
+        self.assertIs(sut.get_microvolt_table(PGA.MODE5), sut.get_microvolt_table(PGA.MODE7))
+
+    @unittest.skipUnless(HAS_NUMPY, "requires numpy")
+    def test_vectorized(self):
+        steps = numpy.arange(0x0000, 0x10000, dtype=numpy.uint16)
+        for pga in PGA:
+            computed = sut.convert_steps_to_microvolts(steps, pga).tolist()
+            expected = sut.get_microvolt_table(pga).tolist()
+            self.assertEqual(computed, expected)
+
+
+class Test12Bit(unittest.TestCase):
+
+    def test_step_to_microvolts(self):
+        values = [
+            (PGA.MODE0, 0x0010, 3000),
+            (PGA.MODE1, 0x0010, 2000),
+            (PGA.MODE2, 0x0010, 1000),
+            (PGA.MODE3, 0x0010, 500),
+            (PGA.MODE4, 0x0010, 250),
+            (PGA.MODE5, 0x0010, 125),
+            (PGA.MODE2, 0x7FF0, 2047000),
+            (PGA.MODE2, 0x8000, -2048000),
+            (PGA.MODE2, 0xFFF0, -1000),
+            # the lower 4 bits are ignored
+            (PGA.MODE2, 0x000F, 0),
+            (PGA.MODE2, 0xFFFF, -1000),
+        ]
+        for pga, step, microvolts in values:
+            computed = sut.convert_step_to_microvolts(step, pga, resolution=12)
+            expected = microvolts
+            self.assertEqual(computed, expected)
+
+    def test_microvolts_to_step(self):
+        values = [
+            (-2048000, 0x8000),
+            (-1000, 0xFFF0),
+            (0, 0x0000),
+            (1400, 0x0010),
+            (2047000, 0x7FF0),
+        ]
+        for microvolts, step in values:
+            computed = sut.convert_microvolts_to_step(microvolts, PGA.MODE2, resolution=12)
+            expected = step
+            self.assertEqual(computed, expected)
+
+    def test_microvolts_to_step_oor(self):
+        self.assertRaises(ValueError, sut.convert_microvolts_to_step, 2048000, PGA.MODE2, 12)
+        self.assertRaises(ValueError, sut.convert_microvolts_to_step, -2049000, PGA.MODE2, 12)
+
+    def test_table(self):
+        for pga in PGA:
+            table = sut.get_microvolt_table(pga, resolution=12)
+            self.assertEqual(len(table), 4096)
+            for step in range(0x0000, 0x10000, 0x10):
+                self.assertEqual(table[step >> 4], sut.convert_step_to_microvolts(step, pga, resolution=12))
+
+    def test_table_cached(self):
+        self.assertIs(sut.get_microvolt_table(PGA.MODE2, resolution=12), sut.get_microvolt_table(PGA.MODE2, resolution=12))
+
+    @unittest.skipUnless(HAS_NUMPY, "requires numpy")
+    def test_vectorized(self):
+        steps = numpy.arange(0x0000, 0x10000, dtype=numpy.uint16)
+        for pga in PGA:
+            computed = sut.convert_steps_to_microvolts(steps, pga, resolution=12).tolist()
+            expected = [sut.convert_step_to_microvolts(step, pga, resolution=12) for step in range(0x0000, 0x10000)]
+            self.assertEqual(computed, expected)
+
+    def test_pack(self):
+        steps = [0x8000, 0x7FF0, 0x1230]
+        # -----------------------------------------------------------------
+        packed = sut.pack_steps12(steps)
+        computed = sut.unpack_steps12(packed, count=3)
+        # -----------------------------------------------------------------
+        self.assertEqual(packed, bytes([0x80, 0x07, 0xFF, 0x12, 0x30, 0x00]))
+        self.assertEqual(computed, array('H', steps))
+
+    def test_pack_buffer(self):
+        # big-endian words (byte buffer filled by 'Ads1x1x.capture()')
+        buffer = bytearray([0x80, 0x00, 0x7F, 0xF0])
+        # -----------------------------------------------------------------
+        computed = sut.unpack_steps12(sut.pack_steps12(buffer))
+        # -----------------------------------------------------------------
+        self.assertEqual(computed, array('H', [0x8000, 0x7FF0]))
+
+    def test_pack_signed(self):
+        # array('h') filled by 'Ads1x1x.capture()'
+        ring = array('h', [-32768, 0x7FF0])
+        # -----------------------------------------------------------------
+        computed = sut.unpack_steps12(sut.pack_steps12(ring))
+        # -----------------------------------------------------------------
+        self.assertEqual(computed, array('H', [0x8000, 0x7FF0]))
+
+    def test_invalid_resolution(self):
+        for resolution in (0, 14, 24):
+            with self.subTest(resolution=resolution):
+                self.assertRaises(ValueError, sut.convert_step_to_microvolts, 0x1230, PGA.MODE2, resolution)
+                self.assertRaises(ValueError, sut.convert_microvolts_to_step, 1000, PGA.MODE2, resolution)
+                self.assertRaises(ValueError, sut.get_microvolt_table, PGA.MODE2, resolution)
+                self.assertRaises(ValueError, sut.get_microvolts_per_step, PGA.MODE2, resolution)
+
+    @unittest.skipUnless(HAS_NUMPY, "requires numpy")
+    def test_vectorized_invalid_resolution(self):
+        steps = numpy.arange(0x0000, 0x0010, dtype=numpy.uint16)
+        self.assertRaises(ValueError, sut.convert_steps_to_microvolts, steps, PGA.MODE2, resolution=14)
+
+    def test_unpack_invalid(self):
+        self.assertRaises(ValueError, sut.unpack_steps12, bytes(4))
+        self.assertRaises(ValueError, sut.unpack_steps12, bytes(3), count=3)
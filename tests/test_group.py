@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+test DeviceGroup
+
+use simulated devices:
+  pdm run pytest
+use hardware devices (ADS1115 @ 0x48 and 0x49):
+  TEST_ADS1115_CHIP=y pdm run pytest
+"""
+
+import os
+import unittest
+
+# modules board and busio provide no type hints
+import board  # type: ignore
+import busio  # type: ignore
+from feeph.i2c import BurstHandler, EmulatedI2C
+
+import feeph.ads1xxx as sut  # sytem under test
+from feeph.ads1xxx.ads1x1x import DEFAULTS, Ads1x1xConfig
+from feeph.ads1xxx.conversions import UNIT
+
+if os.environ.get('TEST_ADS1115_CHIP', 'n') == 'y':
+    HAS_HARDWARE = True
+else:
+    HAS_HARDWARE = False
+
+
+class TestDeviceGroup(unittest.TestCase):
+
+    def setUp(self):
+        self.i2c_adrs = [0x48, 0x49]
+        if HAS_HARDWARE:
+            self.i2c_bus = busio.I2C(scl=board.SCL, sda=board.SDA)
+        else:
+            state = {}
+            for i2c_adr in self.i2c_adrs:
+                registers = DEFAULTS.copy()
+                for register, default_value in registers.items():
+                    if default_value is None:
+                        registers[register] = 0x0000
+                state[i2c_adr] = registers
+            self.i2c_bus = EmulatedI2C(state=state)
+        self.devices = [sut.Ads1115(i2c_bus=self.i2c_bus, i2c_adr=i2c_adr) for i2c_adr in self.i2c_adrs]
+
+    def tearDown(self):
+        # restore original state after each run
+        # (hardware is not stateless)
+        for device in self.devices:
+            device.reset_device_registers()
+
+    # ---------------------------------------------------------------------
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_ssc_measurements(self):
+        self.i2c_bus._state[0x48][0x00] = 0x1234
+        self.i2c_bus._state[0x49][0x00] = 0x4321
+        group = sut.DeviceGroup(devices=self.devices)
+        # -----------------------------------------------------------------
+        computed = group.get_ssc_measurements(unit=UNIT.STEPS)
+        expected = [0x1234, 0x4321]
+        # -----------------------------------------------------------------
+        self.assertEqual(expected, computed)
+
+    def test_ssc_measurements_with_config(self):
+        group = sut.DeviceGroup(devices=self.devices)
+        configs: list[Ads1x1xConfig | None] = [sut.Ads1115Config(mux=sut.MUX.MODE4), sut.Ads1115Config(mux=sut.MUX.MODE5)]
+        group.get_ssc_measurements(configs=configs)
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        with BurstHandler(i2c_bus=self.i2c_bus, i2c_adr=0x48) as bh:
+            self.assertIn(bh.read_register(0x01, byte_count=2), [0x4583, 0xC583])
+        with BurstHandler(i2c_bus=self.i2c_bus, i2c_adr=0x49) as bh:
+            self.assertIn(bh.read_register(0x01, byte_count=2), [0x5583, 0xD583])
+
+    def test_ssc_measurements_config_mismatch(self):
+        group = sut.DeviceGroup(devices=self.devices)
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        self.assertRaises(ValueError, group.get_ssc_measurements, configs=[sut.Ads1115Config()])
+
+    def test_no_devices(self):
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        self.assertRaises(ValueError, sut.DeviceGroup, devices=[])
+
+    def test_duplicate_address(self):
+        devices = [sut.Ads1115(i2c_bus=self.i2c_bus, i2c_adr=0x48), sut.Ads1115(i2c_bus=self.i2c_bus, i2c_adr=0x48)]
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        self.assertRaises(ValueError, sut.DeviceGroup, devices=devices)
+
+    def test_different_buses(self):
+        other_bus = EmulatedI2C(state={0x4A: DEFAULTS.copy()})
+        devices = [self.devices[0], sut.Ads1115(i2c_bus=other_bus, i2c_adr=0x4A)]
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        self.assertRaises(ValueError, sut.DeviceGroup, devices=devices)
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+test the lazy imports of the package
+"""
+
+import subprocess
+import sys
+import unittest
+
+import feeph.ads1xxx as sut  # sytem under test
+
+
+class TestImports(unittest.TestCase):
+
+    def test_lazy_imports(self):
+        # modules are cached, use a fresh interpreter
+        script = "import sys, feeph.ads1xxx; print(' '.join(sorted(sys.modules)))"
+        output = subprocess.run([sys.executable, '-c', script], capture_output=True, check=True, text=True).stdout
+        modules = output.split()
+        self.assertIn('feeph.ads1xxx.settings', modules)
+        for module in ('busio', 'board', 'feeph.i2c', 'feeph.ads1xxx.ads1115', 'feeph.ads1xxx.scan'):
+            self.assertNotIn(module, modules)
+
+    def test_getattr(self):
+        from feeph.ads1xxx.ads1115 import Ads1115
+        self.assertIs(sut.Ads1115, Ads1115)
+        self.assertIn('Ads1115Config', dir(sut))
+
+    def test_getattr_unknown(self):
+        self.assertRaises(AttributeError, getattr, sut, 'Ads9999')
+
+
+if __name__ == '__main__':
+    unittest.main()
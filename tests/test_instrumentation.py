@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+test the transaction statistics
+"""
+
+import operator
+import unittest
+
+import feeph.ads1xxx as sut  # sytem under test
+import feeph.ads1xxx.simulation as sim
+from feeph.ads1xxx.instrumentation import LATENCY_BUCKETS, LatencyHistogram
+from feeph.ads1xxx.settings import DOM, DRS, MUX
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_empty(self):
+        histogram = LatencyHistogram()
+        self.assertIsNone(histogram.mean_ns)
+        self.assertIsNone(histogram.percentile(0.5))
+
+    def test_record(self):
+        histogram = LatencyHistogram()
+        for duration_ns in (10_000, 20_000, 30_000, 1_000_000):
+            histogram.record(duration_ns)
+        self.assertEqual(histogram.count, 4)
+        self.assertEqual(histogram.min_ns, 10_000)
+        self.assertEqual(histogram.max_ns, 1_000_000)
+        self.assertEqual(histogram.mean_ns, 265_000)
+        self.assertEqual(histogram.percentile(0.25), 16_000)
+        self.assertEqual(histogram.percentile(0.75), 32_000)
+        self.assertEqual(histogram.percentile(1.0), 1_024_000)
+
+    def test_overflow(self):
+        histogram = LatencyHistogram()
+        histogram.record(LATENCY_BUCKETS[-1] * 10)
+        self.assertEqual(histogram.percentile(0.5), LATENCY_BUCKETS[-1] * 10)
+
+    def test_invalid_quantile(self):
+        self.assertRaises(ValueError, LatencyHistogram().percentile, 1.5)
+
+
+class TestStatistics(unittest.TestCase):
+
+    def setUp(self):
+        self.i2c_bus = sim.SimulatedAds1x1x(signals={MUX.MODE0: sim.ConstantSignal(voltage=1.0)})
+        # no reset - it would start a (slow) conversion
+        self.ads1115 = sut.Ads1115(i2c_bus=self.i2c_bus)
+
+    # ---------------------------------------------------------------------
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(self.ads1115.get_statistics())
+
+    def test_ssc_measurement(self):
+        config = sut.Ads1115Config(drs=DRS.MODE7)
+        self.ads1115.configure(config)
+        self.ads1115.enable_statistics()
+        transactions = self.i2c_bus.transactions
+        for _ in range(5):
+            self.ads1115.get_ssc_measurement()
+        report = self.ads1115.get_statistics()
+        # --------------------------------------------------------------
+        self.assertIsNotNone(report)
+        self.assertEqual(report.writes, {0x01: 5})
+        self.assertEqual(report.reads[0x00], 5)
+        self.assertEqual(report.samples, 5)
+        self.assertEqual(report.transactions, self.i2c_bus.transactions - transactions)
+        self.assertEqual(report.latency.count, report.transactions)
+        self.assertEqual(report.errors, 0)
+        self.assertEqual(report.configured_sample_rate, 860)
+        self.assertIsNotNone(report.achieved_sample_rate)
+        self.assertLess(report.achieved_sample_rate, 860)
+
+    def test_hot_measurement(self):
+        self.ads1115.configure(sut.Ads1115Config(dom=DOM.CCM, drs=DRS.MODE7))
+        self.ads1115.enable_statistics()
+        for _ in range(3):
+            self.ads1115.get_hot_measurement()
+        report = self.ads1115.get_statistics()
+        # --------------------------------------------------------------
+        # the pointer register is written once (no register is written)
+        self.assertEqual(report.pointer_writes, 1)
+        self.assertEqual(report.writes, {})
+        self.assertEqual(report.reads, {0x00: 3})
+        self.assertEqual(report.transactions_per_sample, 4 / 3)
+
+    def test_errors(self):
+        self.ads1115.enable_statistics()
+        ads1115 = sut.Ads1115(i2c_bus=self.i2c_bus, i2c_adr=0x49)
+        ads1115.enable_statistics()
+        self.assertRaises(OSError, ads1115.get_ccm_measurement)
+        # --------------------------------------------------------------
+        self.assertEqual(ads1115.get_statistics().errors, 1)
+        self.assertEqual(self.ads1115.get_statistics().errors, 0)
+
+    def test_retries(self):
+        config = sut.Ads1115Config(drs=DRS.MODE7)
+        self.ads1115.configure(config)
+        self.ads1115.enable_statistics()
+        with self.ads1115._get_burst_handler() as bh:
+            self.ads1115._start_conversion(bh, config)
+            # poll immediately - the conversion is still in progress
+            self.ads1115._poll_for_conversion(bh, conversion_time=0.002)
+        # --------------------------------------------------------------
+        self.assertGreater(self.ads1115.get_statistics().retries, 0)
+
+    def test_snapshot(self):
+        self.ads1115.enable_statistics()
+        self.ads1115.configure(sut.Ads1115Config(dom=DOM.CCM))
+        report = self.ads1115.get_statistics()
+        self.ads1115.get_ccm_measurement()
+        # --------------------------------------------------------------
+        self.assertEqual(report.samples, 0)
+        self.assertEqual(self.ads1115.get_statistics().samples, 1)
+
+    def test_read_only_report(self):
+        self.ads1115.enable_statistics()
+        self.ads1115.configure(sut.Ads1115Config(dom=DOM.CCM))
+        report = self.ads1115.get_statistics()
+        # --------------------------------------------------------------
+        self.assertRaises(TypeError, operator.setitem, report.writes, 0x01, 0)
+        self.assertRaises(TypeError, operator.setitem, report.reads, 0x00, 0)
+
+    def test_reset_and_disable(self):
+        self.ads1115.enable_statistics()
+        self.ads1115.configure(sut.Ads1115Config(dom=DOM.CCM))
+        self.ads1115.reset_statistics()
+        self.assertEqual(self.ads1115.get_statistics().transactions, 0)
+        self.ads1115.disable_statistics()
+        self.assertIsNone(self.ads1115.get_statistics())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+test the Linux I²C backend
+
+The ioctl is replaced with a loopback to a simulated device. Each
+I2C_RDWR ioctl is forwarded as a single bus transaction.
+"""
+
+import ctypes
+import tempfile
+import unittest
+from unittest import mock
+
+import feeph.ads1xxx as sut  # sytem under test
+import feeph.ads1xxx.linux_i2c as linux_i2c
+import feeph.ads1xxx.simulation as sim
+from feeph.ads1xxx.settings import DOM, DRS, MUX
+
+
+class LoopbackIoctl:
+    """
+    stand-in for 'fcntl.ioctl' connected to a simulated device
+    """
+
+    def __init__(self, device: sim.SimulatedAds1x1x, funcs: int = linux_i2c.I2C_FUNC_I2C):
+        self.device = device
+        self.funcs = funcs
+        self.ioctls = 0
+
+    def __call__(self, fd: int, request: int, arg):
+        if request == linux_i2c.I2C_FUNCS:
+            arg.value = self.funcs
+        elif request == linux_i2c.I2C_RDWR:
+            self.ioctls += 1
+            msgs = [arg.msgs[i] for i in range(arg.nmsgs)]
+            if len(msgs) == 2 and not msgs[0].flags & linux_i2c.I2C_M_RD and msgs[1].flags & linux_i2c.I2C_M_RD:
+                buffer_in = bytearray(msgs[1].len)
+                self.device.writeto_then_readfrom(msgs[0].addr, ctypes.string_at(msgs[0].buf, msgs[0].len), buffer_in)
+                ctypes.memmove(msgs[1].buf, bytes(buffer_in), msgs[1].len)
+            else:
+                for msg in msgs:
+                    if msg.flags & linux_i2c.I2C_M_RD:
+                        buffer_in = bytearray(msg.len)
+                        self.device.readfrom_into(msg.addr, buffer_in)
+                        ctypes.memmove(msg.buf, bytes(buffer_in), msg.len)
+                    else:
+                        self.device.writeto(msg.addr, ctypes.string_at(msg.buf, msg.len))
+        else:
+            raise OSError(25, "Inappropriate ioctl for device")
+        return 0
+
+
+class TestLinuxI2C(unittest.TestCase):
+
+    def setUp(self):
+        self.device = sim.SimulatedAds1x1x(signals={MUX.MODE0: sim.ConstantSignal(voltage=1.0)})
+        self.ioctl = LoopbackIoctl(self.device)
+        patcher = mock.patch('fcntl.ioctl', self.ioctl)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # a regular file stands in for the character device
+        device_file = tempfile.NamedTemporaryFile()
+        self.addCleanup(device_file.close)
+        self.i2c_bus = linux_i2c.LinuxI2C(bus=device_file.name)
+        self.addCleanup(self.i2c_bus.deinit)
+
+    # ---------------------------------------------------------------------
+
+    def test_read_register(self):
+        burst_handler = linux_i2c.LinuxBurstHandler(i2c_bus=self.i2c_bus, i2c_adr=0x48)
+        with burst_handler as bh:
+            computed = bh.read_register(0x03, byte_count=2)
+        # -----------------------------------------------------------------
+        self.assertEqual(computed, 0x7FFF)
+        # pointer and data are transferred in a single transaction
+        self.assertEqual(self.device.transactions, 1)
+
+    def test_write_register(self):
+        burst_handler = linux_i2c.LinuxBurstHandler(i2c_bus=self.i2c_bus, i2c_adr=0x48)
+        with burst_handler as bh:
+            bh.write_register(0x02, 0x9FFF, byte_count=2)
+        # -----------------------------------------------------------------
+        self.assertEqual(self.device.get_register(0x02), 0x9FFF)
+        self.assertEqual(self.device.transactions, 1)
+
+    def test_busio_api(self):
+        buffer = bytearray(4)
+        self.i2c_bus.writeto(0x48, bytes([0x03]))
+        self.i2c_bus.readfrom_into(0x48, buffer, start=2)
+        self.assertEqual(buffer, bytearray([0x00, 0x00, 0x7F, 0xFF]))
+        self.i2c_bus.writeto_then_readfrom(0x48, bytes([0x02]), buffer, in_end=2)
+        self.assertEqual(buffer, bytearray([0x80, 0x00, 0x7F, 0xFF]))
+
+    def test_preallocated_buffers(self):
+        buffer = bytearray(4)
+        view = memoryview(buffer)[2:]
+        # -----------------------------------------------------------------
+        # the hot path (pointer write, 2-byte read) builds no ctypes objects
+        with mock.patch('ctypes.cast', side_effect=AssertionError("new ctypes view")):
+            self.i2c_bus.writeto(0x48, bytes([0x03]))
+            write_buffer = ctypes.addressof(self.i2c_bus._msgs[0].buf.contents)
+            self.i2c_bus.readfrom_into(0x48, view)
+            read_buffer = ctypes.addressof(self.i2c_bus._msgs[0].buf.contents)
+        # -----------------------------------------------------------------
+        self.assertEqual(buffer, bytearray([0x00, 0x00, 0x7F, 0xFF]))
+        self.assertEqual(write_buffer, ctypes.addressof(self.i2c_bus._buffer_out.array))
+        self.assertEqual(read_buffer, ctypes.addressof(self.i2c_bus._buffers_in[2].array))
+
+    def test_read_into_read_only_buffer(self):
+        self.assertRaises(TypeError, self.i2c_bus.readfrom_into, 0x48, bytes(2))
+
+    def test_scan(self):
+        # the caller holds the lock (same as 'busio.I2C')
+        self.assertTrue(self.i2c_bus.try_lock())
+        self.addCleanup(self.i2c_bus.unlock)
+        self.assertEqual(self.i2c_bus.scan(), [0x48])
+
+    def test_missing_device(self):
+        with linux_i2c.LinuxBurstHandler(i2c_bus=self.i2c_bus, i2c_adr=0x49) as bh:
+            self.assertRaises(OSError, bh.read_register, 0x01, byte_count=2)
+        # the bus is unlocked again
+        self.assertTrue(self.i2c_bus.try_lock())
+        self.i2c_bus.unlock()
+
+    def test_locked_bus(self):
+        self.assertTrue(self.i2c_bus.try_lock())
+        burst_handler = linux_i2c.LinuxBurstHandler(i2c_bus=self.i2c_bus, i2c_adr=0x48, timeout_ms=10)
+        self.assertRaises(RuntimeError, burst_handler.__enter__)
+        self.i2c_bus.unlock()
+
+    def test_closed_bus(self):
+        self.i2c_bus.deinit()
+        self.assertRaises(RuntimeError, self.i2c_bus.writeto, 0x48, bytes([0x00]))
+
+    def test_unsupported_adapter(self):
+        self.ioctl.funcs = 0x0000_0000  # SMBus only
+        with tempfile.NamedTemporaryFile() as device_file:
+            self.assertRaises(RuntimeError, linux_i2c.LinuxI2C, bus=device_file.name)
+
+    def test_missing_device_file(self):
+        self.assertRaises(OSError, linux_i2c.LinuxI2C, bus='/nonexistent/i2c-1')
+
+    # ---------------------------------------------------------------------
+
+    def test_ads1115(self):
+        ads1115 = sut.Ads1115(i2c_bus=self.i2c_bus)
+        self.assertIs(ads1115._burst_handler_class, linux_i2c.LinuxBurstHandler)
+        # -----------------------------------------------------------------
+        computed = ads1115.get_ssc_measurement(config=sut.Ads1115Config(drs=DRS.MODE7))
+        # -----------------------------------------------------------------
+        self.assertAlmostEqual(computed, 1_000_000, delta=100)
+
+    def test_ads1115_hot_measurement(self):
+        ads1115 = sut.Ads1115(i2c_bus=self.i2c_bus)
+        ads1115.configure(sut.Ads1115Config(dom=DOM.CCM, drs=DRS.MODE7))
+        ads1115.get_hot_measurement()
+        ioctls = self.ioctl.ioctls
+        # -----------------------------------------------------------------
+        for _ in range(3):
+            ads1115.get_hot_measurement()
+        # -----------------------------------------------------------------
+        # a single read per sample
+        self.assertEqual(self.ioctl.ioctls - ioctls, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
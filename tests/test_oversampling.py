@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+test the oversampled measurements
+"""
+
+import struct
+import time
+import unittest
+from array import array
+from unittest import mock
+
+import feeph.ads1xxx as sut  # sytem under test
+import feeph.ads1xxx.oversampling as oversampling
+import feeph.ads1xxx.simulation as sim
+from feeph.ads1xxx.settings import DOM, DRS, MUX, PGA
+
+
+def _to_buffer(steps: list[int]) -> bytearray:
+    return bytearray(struct.pack(f'>{len(steps)}h', *steps))
+
+
+class CountingSignal(sim.Signal):
+    """
+    each conversion sees a higher voltage (duplicates are easy to spot)
+    """
+
+    def __init__(self):
+        self.conversions = 0
+
+    def get_voltage(self, timestamp: float) -> float:
+        self.conversions += 1
+        return self.conversions * 0.001
+
+
+class TestCombineSamples(unittest.TestCase):
+
+    def test_mean(self):
+        buffer = _to_buffer([100, 104])
+        # -----------------------------------------------------------------
+        computed = oversampling.combine_samples(buffer, sut.REDUCTION.MEAN, pga=PGA.MODE2)
+        # -----------------------------------------------------------------
+        self.assertEqual(computed.value, 6375)
+        self.assertEqual(computed.noise, 125)
+        self.assertEqual(computed.samples, 2)
+
+    def test_median(self):
+        buffer = _to_buffer([100, 100, 5000])
+        computed = oversampling.combine_samples(buffer, sut.REDUCTION.MEDIAN, pga=PGA.MODE2)
+        self.assertEqual(computed.value, 6250)
+
+    def test_trimmed_mean(self):
+        # the lowest and the highest sample are discarded
+        buffer = _to_buffer([-1000] + [10] * 8 + [9000])
+        computed = oversampling.combine_samples(buffer, sut.REDUCTION.TRIMMED_MEAN, pga=PGA.MODE2)
+        self.assertEqual(computed.value, 625)
+
+    def test_steps(self):
+        buffer = _to_buffer([-100, -104])
+        computed = oversampling.combine_samples(buffer, sut.REDUCTION.MEAN, pga=PGA.MODE2, unit=sut.UNIT.STEPS)
+        self.assertEqual(computed.value, 0xFF9A)
+        self.assertEqual(computed.noise, 2)
+
+    def test_12bit(self):
+        # the lower 4 bits are always zero
+        buffer = _to_buffer([100 << 4, 104 << 4])
+        # -----------------------------------------------------------------
+        computed = oversampling.combine_samples(buffer, sut.REDUCTION.MEAN, pga=PGA.MODE2, resolution=12)
+        computed_steps = oversampling.combine_samples(buffer, sut.REDUCTION.MEAN, pga=PGA.MODE2, resolution=12,
+                                                      unit=sut.UNIT.STEPS)
+        # -----------------------------------------------------------------
+        self.assertEqual(computed.value, 102_000)
+        self.assertEqual(computed.noise, 2000)
+        self.assertEqual(computed_steps.value, 102 << 4)
+        self.assertEqual(computed_steps.noise, 2)
+
+    def test_effective_resolution(self):
+        noisy = _to_buffer([100, 102] * 8)
+        quiet = _to_buffer([100] * 16)
+        # -----------------------------------------------------------------
+        computed_noisy = oversampling.combine_samples(noisy, sut.REDUCTION.MEAN, pga=PGA.MODE2)
+        computed_quiet = oversampling.combine_samples(quiet, sut.REDUCTION.MEAN, pga=PGA.MODE2)
+        # -----------------------------------------------------------------
+        # 16 samples -> 2 bits
+        self.assertEqual(computed_noisy.effective_resolution, 18.0)
+        # without noise there is nothing to average
+        self.assertEqual(computed_quiet.effective_resolution, 16.0)
+
+    def test_array(self):
+        # array('h') filled by 'Ads1x1x.capture()' (host byte order)
+        buffer = array('h', [100, 104])
+        computed = oversampling.combine_samples(buffer, sut.REDUCTION.MEAN, pga=PGA.MODE2)
+        self.assertEqual(computed.value, 6375)
+        self.assertEqual(computed.samples, 2)
+
+    def test_empty_buffer(self):
+        self.assertRaises(ValueError, oversampling.combine_samples, bytearray(), sut.REDUCTION.MEAN, pga=PGA.MODE2)
+
+
+@unittest.skipIf(oversampling._get_numpy() is None, "module numpy is not installed")
+class TestVectorizedReduction(unittest.TestCase):
+
+    def test_same_result(self):
+        numbers = [(i * 7919) % 2000 - 1000 for i in range(200)]
+        np = oversampling._get_numpy()
+        for reduction in sut.REDUCTION:
+            with self.subTest(reduction=reduction):
+                buffer = _to_buffer(numbers)
+                expected = oversampling._reduce(buffer, reduction)
+                self.assertEqual(oversampling._reduce_vectorized(np, array('h', numbers), reduction), expected)
+                computed = oversampling._reduce_vectorized(np, buffer, reduction)
+                self.assertAlmostEqual(computed[0], expected[0])
+                self.assertAlmostEqual(computed[1], expected[1])
+
+
+class TestOversampledMeasurement(unittest.TestCase):
+
+    def setUp(self):
+        self.i2c_bus = sim.SimulatedAds1x1x(signals={MUX.MODE0: sim.NoiseSignal(voltage=1.0, stddev=0.001, seed=0)})
+        # no reset - it would start a (slow) conversion
+        self.ads1115 = sut.Ads1115(i2c_bus=self.i2c_bus)
+        self.config = sut.Ads1115Config(dom=DOM.CCM, drs=DRS.MODE7)
+
+    # ---------------------------------------------------------------------
+
+    def test_get_oversampled_measurement(self):
+        computed = self.ads1115.get_oversampled_measurement(config=self.config, samples=64)
+        # -----------------------------------------------------------------
+        self.assertEqual(computed.samples, 64)
+        self.assertAlmostEqual(computed.value, 1_000_000, delta=500)
+        self.assertAlmostEqual(computed.noise, 1000, delta=300)
+        self.assertGreater(computed.effective_resolution, 16.0)
+
+    def test_median(self):
+        computed = self.ads1115.get_oversampled_measurement(config=self.config, samples=16, reduction=sut.REDUCTION.MEDIAN,
+                                                            unit=sut.UNIT.STEPS)
+        self.assertAlmostEqual(computed.value, 16000, delta=16)
+
+    def test_slow_oscillator(self):
+        # the device's oscillator runs 10% slow (the specified limit)
+        i2c_bus = sim.SimulatedAds1x1x(signals={MUX.MODE0: CountingSignal()}, clock=lambda: time.monotonic() / 1.1)
+        ads1115 = sut.Ads1115(i2c_bus=i2c_bus)
+        # -----------------------------------------------------------------
+        with mock.patch('feeph.ads1xxx.ads1x1x.combine_samples', wraps=oversampling.combine_samples) as combine_samples:
+            computed = ads1115.get_oversampled_measurement(config=self.config, samples=32, unit=sut.UNIT.STEPS)
+        # -----------------------------------------------------------------
+        self.assertEqual(computed.samples, 32)
+        buffer = combine_samples.call_args.args[0]
+        steps = struct.unpack(f'>{len(buffer) // 2}h', buffer)
+        # each sample is a new conversion
+        self.assertEqual(len(set(steps)), len(steps))
+
+    def test_invalid_samples(self):
+        self.assertRaises(ValueError, self.ads1115.get_oversampled_measurement, config=self.config, samples=0)
+
+    def test_single_shot_mode(self):
+        config = sut.Ads1115Config(dom=DOM.SSM)
+        self.assertRaises(RuntimeError, self.ads1115.get_oversampled_measurement, config=config, samples=16)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+test ScanList
+
+use simulated device:
+  pdm run pytest
+use hardware device:
+  TEST_ADS1115_CHIP=y pdm run pytest
+"""
+
+import os
+import unittest
+from unittest import mock
+
+# modules board and busio provide no type hints
+import board  # type: ignore
+import busio  # type: ignore
+from feeph.i2c import BurstHandler, EmulatedI2C
+
+import feeph.ads1xxx as sut  # sytem under test
+from feeph.ads1xxx.ads1x1x import DEFAULTS
+from feeph.ads1xxx.conversions import UNIT
+from feeph.ads1xxx.settings import DRS, MUX, PGA
+
+if os.environ.get('TEST_ADS1115_CHIP', 'n') == 'y':
+    HAS_HARDWARE = True
+else:
+    HAS_HARDWARE = False
+
+
+class TestScanList(unittest.TestCase):
+
+    def setUp(self):
+        self.i2c_adr = 0x48
+        if HAS_HARDWARE:
+            self.i2c_bus = busio.I2C(scl=board.SCL, sda=board.SDA)
+        else:
+            registers = DEFAULTS.copy()
+            for register, default_value in registers.items():
+                if default_value is None:
+                    registers[register] = 0x0000
+            self.i2c_bus = EmulatedI2C(state={self.i2c_adr: registers})
+        self.ads1115 = sut.Ads1115(i2c_bus=self.i2c_bus)
+
+    def tearDown(self):
+        # restore original state after each run
+        # (hardware is not stateless)
+        self.ads1115.reset_device_registers()
+
+    # ---------------------------------------------------------------------
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_scan(self):
+        self.i2c_bus._state[0x48][0x00] = 0x1234
+        scan_list = sut.ScanList(device=self.ads1115, channels=[
+            (MUX.MODE4, PGA.MODE1, DRS.MODE7),
+            (MUX.MODE5, PGA.MODE2, DRS.MODE7),
+        ])
+        # -----------------------------------------------------------------
+        computed = scan_list.scan(rounds=2)
+        expected = [[582518, 582518], [291259, 291259]]
+        # -----------------------------------------------------------------
+        self.assertEqual(expected, computed.values)
+        self.assertGreater(computed.sample_rate, 0)
+        self.assertAlmostEqual(computed.sample_rate, computed.scan_rate * 2)
+
+    @unittest.skipIf(HAS_HARDWARE, "unpredictable result on real hardware")
+    def test_scan_steps(self):
+        self.i2c_bus._state[0x48][0x00] = 0x1234
+        scan_list = sut.ScanList(device=self.ads1115, channels=[
+            (MUX.MODE4, PGA.MODE1, DRS.MODE7),
+            (MUX.MODE5, PGA.MODE2, DRS.MODE7),
+        ])
+        # -----------------------------------------------------------------
+        computed = scan_list.scan(rounds=1, unit=UNIT.STEPS)
+        expected = [[0x1234], [0x1234]]
+        # -----------------------------------------------------------------
+        self.assertEqual(expected, computed.values)
+
+    def test_scan_config(self):
+        scan_list = sut.ScanList(device=self.ads1115, channels=[
+            (MUX.MODE4, PGA.MODE1, DRS.MODE7),
+            (MUX.MODE7, PGA.MODE4, DRS.MODE7),
+        ])
+        scan_list.scan(rounds=1)
+        # -----------------------------------------------------------------
+        with BurstHandler(i2c_bus=self.i2c_bus, i2c_adr=self.i2c_adr) as bh:
+            computed = bh.read_register(0x01, byte_count=2)
+        expected = [0x79E3, 0xF9E3]
+        # -----------------------------------------------------------------
+        # last channel remains configured
+        self.assertIn(computed, expected)
+
+    @unittest.skipIf(HAS_HARDWARE, "unable to interrupt the scan on real hardware")
+    def test_scan_interrupted(self):
+        self.ads1115.configure(sut.Ads1115Config(mux=MUX.MODE4, pga=PGA.MODE1, drs=DRS.MODE7))
+        scan_list = sut.ScanList(device=self.ads1115, channels=[
+            (MUX.MODE4, PGA.MODE1, DRS.MODE7),
+            (MUX.MODE5, PGA.MODE2, DRS.MODE7),
+        ])
+        # -----------------------------------------------------------------
+        with mock.patch.object(self.ads1115, '_wait_for_conversion', side_effect=[None, RuntimeError("timeout")]):
+            self.assertRaises(RuntimeError, scan_list.scan, rounds=2)
+        # -----------------------------------------------------------------
+        # the device's config register is unknown
+        self.assertIsNone(self.ads1115._shadow[0x01])
+
+    def test_scan_invalid_rounds(self):
+        scan_list = sut.ScanList(device=self.ads1115, channels=[(MUX.MODE4, PGA.MODE1, DRS.MODE7)])
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        self.assertRaises(ValueError, scan_list.scan, rounds=0)
+
+    def test_no_channels(self):
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        self.assertRaises(ValueError, sut.ScanList, device=self.ads1115, channels=[])
+
+    def test_no_multiplexer(self):
+        ads1114 = sut.Ads1114(i2c_bus=self.i2c_bus)
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        self.assertRaises(ValueError, sut.ScanList, device=ads1114, channels=[(MUX.MODE0, PGA.MODE1, DRS.MODE7)])
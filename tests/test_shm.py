@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+test the shared memory ring
+"""
+
+import io
+import os
+import signal
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+import feeph.ads1xxx as sut  # sytem under test
+import feeph.ads1xxx.shm as shm
+import feeph.ads1xxx.simulation as sim
+from feeph.ads1xxx.capabilities import DRS_SPS_ADS101X
+from feeph.ads1xxx.settings import DOM, DRS, MUX, PGA
+
+
+class TestSharedRing(unittest.TestCase):
+
+    def setUp(self):
+        self.name = f'test_ads1xxx_{os.getpid()}'
+        config_uint = sut.Ads1115Config(dom=DOM.CCM, pga=PGA.MODE1).as_uint16()
+        self.writer = shm.SharedRingWriter(name=self.name, capacity=4, config_uint=config_uint, resolution=16, sample_rate=128)
+        self.addCleanup(self.writer.close)
+
+    # ---------------------------------------------------------------------
+
+    def test_read_available(self):
+        with shm.SharedRingReader(name=self.name) as reader:
+            for i in range(3):
+                self.writer.put(timestamp=1000 + i, step=0x1234)
+            samples = reader.read_available()
+            # -------------------------------------------------------------
+            self.assertEqual(len(samples), 3)
+            self.assertEqual(samples.overruns, 0)
+            self.assertEqual([list(timestamps) for timestamps, _ in samples.chunks], [[1000, 1001, 1002]])
+            self.assertEqual(samples.get_values(), [582518, 582518, 582518])
+            self.assertEqual(samples.get_values(unit=sut.UNIT.STEPS), [0x1234, 0x1234, 0x1234])
+            self.assertTrue(samples.is_intact())
+            samples.release()
+
+    def test_wrap_around(self):
+        with shm.SharedRingReader(name=self.name) as reader:
+            for i in range(3):
+                self.writer.put(timestamp=i, step=i)
+            reader.read_available().release()
+            for i in range(3, 6):
+                self.writer.put(timestamp=i, step=i)
+            samples = reader.read_available()
+            # -------------------------------------------------------------
+            # the samples are returned as two chunks (no copy)
+            self.assertEqual([list(steps) for _, steps in samples.chunks], [[3], [4, 5]])
+            samples.release()
+
+    def test_overrun(self):
+        with shm.SharedRingReader(name=self.name) as reader:
+            for i in range(10):
+                self.writer.put(timestamp=i, step=i)
+            samples = reader.read_available()
+            # -------------------------------------------------------------
+            self.assertEqual(samples.get_values(unit=sut.UNIT.STEPS), [7, 8, 9])
+            self.assertEqual(samples.overruns, 7)
+            # the writer continues and overwrites the samples
+            self.writer.put(timestamp=10, step=10)
+            self.assertFalse(samples.is_intact())
+            samples.release()
+
+    def test_only_new_samples(self):
+        self.writer.put(timestamp=0, step=0)
+        with shm.SharedRingReader(name=self.name) as reader:
+            self.assertEqual(len(reader.read_available()), 0)
+            self.assertEqual(reader.sample_rate, 128)
+
+    def test_counter_wrap(self):
+        # a writer that has been running for a long time
+        self.writer._sequence = 2**32 - 2
+        self.writer._sequence_view[0] = 2**32 - 2
+        with shm.SharedRingReader(name=self.name) as reader:
+            for i in range(3):
+                self.writer.put(timestamp=i, step=i)
+            samples = reader.read_available()
+            # -------------------------------------------------------------
+            # the shared counter wrapped around, the reader's view did not
+            self.assertEqual(self.writer._sequence_view[0], 1)
+            self.assertEqual(reader.sequence, 2**32 + 1)
+            self.assertEqual(samples.first, 2**32 - 2)
+            self.assertEqual(samples.get_values(unit=sut.UNIT.STEPS), [0, 1, 2])
+            self.assertTrue(samples.is_intact())
+            samples.release()
+
+    def test_invalid_capacity(self):
+        config_uint = sut.Ads1115Config(dom=DOM.CCM).as_uint16()
+        self.assertRaises(ValueError, shm.SharedRingWriter, name=f'{self.name}_invalid', capacity=6,
+                          config_uint=config_uint, resolution=16, sample_rate=128)
+
+    def test_publish_order(self):
+        published = []
+        # record what a reader could see when the barrier is crossed
+        barrier = mock.Mock(side_effect=lambda: published.append((self.writer._steps[0], self.writer._sequence_view[0])))
+        # -----------------------------------------------------------------
+        with mock.patch.object(shm, '_memory_barrier', barrier):
+            self.writer.put(timestamp=0, step=0x1234)
+        # -----------------------------------------------------------------
+        # the sample is stored before the barrier, the counter after it
+        self.assertEqual(published, [(0x1234, 0)])
+        self.assertEqual(self.writer._sequence_view[0], 1)
+
+    def test_unknown_format(self):
+        self.writer.shm.buf[0:8] = b'UNKNOWN\x00'
+        self.assertRaises(RuntimeError, shm.SharedRingReader, name=self.name)
+
+    def test_missing_block(self):
+        self.assertRaises(FileNotFoundError, shm.SharedRingReader, name=f'{self.name}_missing')
+
+    def test_other_process(self):
+        for i in range(2):
+            self.writer.put(timestamp=i, step=0x1234)
+        script = (
+            "import sys; from feeph.ads1xxx.shm import SharedRingReader\n"
+            "reader = SharedRingReader(name=sys.argv[1])\n"
+            "print(reader.sequence, reader.config_uint)\n"
+            "reader.close()\n"
+        )
+        output = subprocess.run([sys.executable, '-c', script, self.name], capture_output=True, check=True, text=True).stdout
+        # -----------------------------------------------------------------
+        self.assertEqual(output.split(), ['2', str(0x0283)])
+        # the block remains after the reader exits
+        with shm.SharedRingReader(name=self.name) as reader:
+            self.assertEqual(reader.sequence, 2)
+
+
+class TestDaemon(unittest.TestCase):
+
+    def test_run_daemon(self):
+        i2c_bus = sim.SimulatedAds1x1x(signals={MUX.MODE0: sim.ConstantSignal(voltage=1.0)})
+        ads1115 = sut.Ads1115(i2c_bus=i2c_bus)
+        config = sut.Ads1115Config(dom=DOM.CCM, drs=DRS.MODE7)
+        name = f'test_ads1xxx_daemon_{os.getpid()}'
+        with shm.SharedRingWriter(name=name, capacity=16, config_uint=config.as_uint16(), resolution=16,
+                                  sample_rate=860) as writer:
+            with shm.SharedRingReader(name=name) as reader:
+                # -------------------------------------------------------------
+                shm.run_daemon(ads1115, config, writer, count=3)
+                # -------------------------------------------------------------
+                samples = reader.read_available()
+                for value in samples.get_values():
+                    self.assertAlmostEqual(value, 1_000_000, delta=100)
+                self.assertEqual(len(samples), 3)
+                samples.release()
+
+
+class TestMain(unittest.TestCase):
+
+    def setUp(self):
+        self.name = f'test_ads1xxx_main_{os.getpid()}'
+        # main() installs a SIGTERM handler
+        self.addCleanup(signal.signal, signal.SIGTERM, signal.getsignal(signal.SIGTERM))
+
+    def test_startup(self):
+        i2c_bus = sim.SimulatedAds1x1x(drs_sps=DRS_SPS_ADS101X, resolution=12,
+                                       signals={MUX.MODE0: sim.ConstantSignal(voltage=1.0)})
+        calls = []
+
+        def run_daemon(device, config, writer):
+            # the block exists while the daemon is running
+            with shm.SharedRingReader(name=self.name) as reader:
+                calls.append((device, config, reader.capacity, reader.sample_rate, reader.resolution))
+
+        # -----------------------------------------------------------------
+        with mock.patch('feeph.ads1xxx.linux_i2c.LinuxI2C') as linux_i2c, mock.patch.object(shm, 'run_daemon', run_daemon):
+            linux_i2c.return_value.__enter__.return_value = i2c_bus
+            computed = shm.main(['--bus', '3', '--model', 'ADS1015', '--drs', 'MODE7', '--name', self.name,
+                                 '--capacity', '16'])
+        # -----------------------------------------------------------------
+        self.assertEqual(computed, 0)
+        linux_i2c.assert_called_once_with(bus=3)
+        device, config, capacity, sample_rate, resolution = calls[0]
+        self.assertIsInstance(device, sut.Ads1015)
+        self.assertEqual(config, sut.Ads1015Config(dom=DOM.CCM, drs=DRS.MODE7))
+        self.assertEqual((capacity, sample_rate, resolution), (16, 3300, 12))
+        # the block is removed when the daemon stops
+        self.assertRaises(FileNotFoundError, shm.SharedRingReader, name=self.name)
+
+    def test_invalid_arguments(self):
+        for argv in (['--capacity', '1000'], ['--model', 'ADS1234'], ['--drs', 'MODE8']):
+            with self.subTest(argv=argv):
+                with mock.patch('sys.stderr', io.StringIO()):
+                    self.assertRaises(SystemExit, shm.main, ['--name', self.name] + argv)
+
+
+if __name__ == '__main__':
+    unittest.main()
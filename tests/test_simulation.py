@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+test SimulatedAds1x1x
+"""
+
+import time
+import unittest
+
+import feeph.ads1xxx as sut  # sytem under test
+import feeph.ads1xxx.simulation as sim
+from feeph.ads1xxx.capabilities import DRS_SPS_ADS101X
+from feeph.ads1xxx.conversions import UNIT
+from feeph.ads1xxx.settings import CQUE, DOM, DRS, MUX, PGA
+
+
+class TestSignals(unittest.TestCase):
+
+    def test_constant(self):
+        self.assertEqual(sim.ConstantSignal(voltage=1.5).get_voltage(0.7), 1.5)
+
+    def test_sine(self):
+        signal = sim.SineSignal(amplitude=2.0, frequency=1.0, offset=0.5)
+        self.assertAlmostEqual(signal.get_voltage(0.0), 0.5)
+        self.assertAlmostEqual(signal.get_voltage(0.25), 2.5)
+
+    def test_noise(self):
+        # same seed -> same noise
+        signal1 = sim.NoiseSignal(voltage=1.0, stddev=0.01, seed=42)
+        signal2 = sim.NoiseSignal(voltage=1.0, stddev=0.01, seed=42)
+        self.assertEqual([signal1.get_voltage(0.0) for _ in range(5)], [signal2.get_voltage(0.0) for _ in range(5)])
+
+    def test_trace(self):
+        signal = sim.TraceSignal(voltages=[0.1, 0.2, 0.3], sample_rate=10)
+        self.assertEqual([signal.get_voltage(t / 10) for t in range(5)], [0.1, 0.2, 0.3, 0.1, 0.2])
+
+    def test_trace_no_loop(self):
+        signal = sim.TraceSignal(voltages=[0.1, 0.2, 0.3], sample_rate=10, loop=False)
+        self.assertEqual(signal.get_voltage(1.0), 0.3)
+
+    def test_trace_empty(self):
+        self.assertRaises(ValueError, sim.TraceSignal, voltages=[], sample_rate=10)
+
+
+class TestSimulatedAds1x1x(unittest.TestCase):
+
+    def setUp(self):
+        self.i2c_bus = sim.SimulatedAds1x1x(signals={
+            MUX.MODE4: sim.ConstantSignal(voltage=1.0),
+            MUX.MODE5: sim.ConstantSignal(voltage=-0.5),
+        })
+        self.ads1115 = sut.Ads1115(i2c_bus=self.i2c_bus)
+
+    def test_ssc_measurement(self):
+        config = sut.Ads1115Config(mux=MUX.MODE4, drs=DRS.MODE7)
+        # -----------------------------------------------------------------
+        computed = self.ads1115.get_ssc_measurement(config=config)
+        expected = 1_000_000  # microvolts
+        # -----------------------------------------------------------------
+        self.assertAlmostEqual(expected, computed, delta=63)
+
+    def test_ssc_measurement_negative(self):
+        config = sut.Ads1115Config(mux=MUX.MODE5, pga=PGA.MODE3, drs=DRS.MODE7)
+        # -----------------------------------------------------------------
+        computed = self.ads1115.get_ssc_measurement(config=config)
+        expected = -500_000  # microvolts
+        # -----------------------------------------------------------------
+        self.assertAlmostEqual(expected, computed, delta=32)
+
+    def test_ssc_measurement_clipped(self):
+        config = sut.Ads1115Config(mux=MUX.MODE4, pga=PGA.MODE4, drs=DRS.MODE7)
+        # -----------------------------------------------------------------
+        computed = self.ads1115.get_ssc_measurement(config=config, unit=UNIT.STEPS)
+        expected = 0x7FFF
+        # -----------------------------------------------------------------
+        self.assertEqual(expected, computed)
+
+    def test_conversion_timing(self):
+        config = sut.Ads1115Config(drs=DRS.MODE4)
+        self.ads1115.configure(config=config)
+        # -----------------------------------------------------------------
+        self.i2c_bus.writeto(0x48, bytes([0x01, 0x85, 0x83]))  # start conversion
+        converting = self.i2c_bus.get_register(0x01)
+        time.sleep(1 / 128)
+        completed = self.i2c_bus.get_register(0x01)
+        # -----------------------------------------------------------------
+        self.assertEqual(converting, 0x0583)
+        self.assertEqual(completed, 0x8583)
+
+    def test_pointer_register(self):
+        self.i2c_bus.writeto(0x48, bytes([0x03]))
+        buffer = bytearray(2)
+        # -----------------------------------------------------------------
+        self.i2c_bus.readfrom_into(0x48, buffer)
+        # -----------------------------------------------------------------
+        self.assertEqual(buffer, bytearray([0x7F, 0xFF]))
+
+    def test_wrong_address(self):
+        # -----------------------------------------------------------------
+        # -----------------------------------------------------------------
+        self.assertRaises(OSError, self.i2c_bus.writeto, 0x49, bytes([0x00]))
+
+    def test_stream(self):
+        config = sut.Ads1115Config(mux=MUX.MODE4, dom=DOM.CCM, drs=DRS.MODE7)
+        # -----------------------------------------------------------------
+        computed = [value for _, value in self.ads1115.stream(config=config, count=5)]
+        # -----------------------------------------------------------------
+        for value in computed:
+            self.assertAlmostEqual(value, 1_000_000, delta=63)
+        self.assertGreaterEqual(self.i2c_bus.conversions, 5)
+
+    def test_12bit(self):
+        signals = {MUX.MODE0: sim.ConstantSignal(voltage=0.001)}
+        i2c_bus = sim.SimulatedAds1x1x(drs_sps=DRS_SPS_ADS101X, resolution=12, signals=signals)
+        ads1015 = sut.Ads1015(i2c_bus=i2c_bus)
+        # -----------------------------------------------------------------
+        computed = ads1015.get_ssc_measurement(config=sut.Ads1015Config(drs=DRS.MODE7), unit=UNIT.STEPS)
+        # -----------------------------------------------------------------
+        # the lower 4 bits are always zero
+        self.assertEqual(computed & 0x000F, 0x0000)
+        self.assertEqual(computed, 0x0010)
+
+    def test_comparator_traditional(self):
+        config = sut.Ads1115Config(mux=MUX.MODE4, drs=DRS.MODE7, cque=CQUE.AA1)
+        config.set_atlo(500_000)
+        config.set_athi(800_000)
+        # -----------------------------------------------------------------
+        self.ads1115.get_ssc_measurement(config=config)
+        # -----------------------------------------------------------------
+        self.assertTrue(self.i2c_bus.alert_asserted)
+        self.assertEqual(self.i2c_bus.alert_events, 1)
+
+    def test_comparator_window(self):
+        config = sut.Ads1115Config(mux=MUX.MODE5, drs=DRS.MODE7, cmod=sut.CMOD.WND, cque=CQUE.AA1)
+        config.set_atlo(-200_000)
+        config.set_athi(200_000)
+        # -----------------------------------------------------------------
+        self.ads1115.get_ssc_measurement(config=config)
+        # -----------------------------------------------------------------
+        self.assertTrue(self.i2c_bus.alert_asserted)
+
+    def test_comparator_disabled(self):
+        config = sut.Ads1115Config(mux=MUX.MODE4, drs=DRS.MODE7)
+        config.set_atlo(500_000)
+        config.set_athi(800_000)
+        # -----------------------------------------------------------------
+        self.ads1115.get_ssc_measurement(config=config)
+        # -----------------------------------------------------------------
+        self.assertFalse(self.i2c_bus.alert_asserted)
+
+    def test_conversion_ready(self):
+        alert = sim.SimulatedAlertReadyPin(device=self.i2c_bus)
+        self.ads1115.configure_rdy(config=sut.Ads1115Config(mux=MUX.MODE4, dom=DOM.CCM, drs=DRS.MODE7))
+        # -----------------------------------------------------------------
+        computed = [self.ads1115.get_rdy_measurement(alert=alert) for _ in range(3)]  # type: ignore [arg-type]
+        # -----------------------------------------------------------------
+        for value in computed:
+            self.assertAlmostEqual(value, 1_000_000, delta=63)